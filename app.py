@@ -1,10 +1,24 @@
+import logging
 import streamlit as st
 import time
-import requests
+from types import MappingProxyType
 from sarvam_client import SarvamClient
+from context_window import ContextWindowManager, make_summarizer
+from translation_cache import TranslationCache
+from response_cache import ResponseCache, is_canned_prompt
+from resilience import HedgePolicy
 from tiger_mascot import TigerMascot
-from image_tiger import get_simple_tiger_html
+from image_tiger import compact_html, get_simple_tiger_html
 from language_support import LanguageSupport
+from worker_pool import WorkerPool
+from chat_history import HISTORY_PAGE_SIZE, new_message, render_chat_history, reset_history_view
+from conversation_store import DEFAULT_WINDOW, Conversation, create_store, new_session_id, validate_session_id
+from metrics import MetricsRegistry, bind_session, start_json_log, start_metrics_server, worker_metrics_port
+from shared_cache import shared_state_path
+from startup import WARMUP_QUERY_PARAM, check_connection_requested, warmup_requested
+# weather and translation_pipeline are imported where used: most sessions never need them
+
+logger = logging.getLogger(__name__)
 
 # Page configuration
 st.set_page_config(
@@ -14,11 +28,69 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Initialize process-wide request metrics
+# (METRICS_PORT serves /metrics for Prometheus, METRICS_LOG_INTERVAL logs JSON snapshots)
+@st.cache_resource
+def get_metrics():
+    metrics = MetricsRegistry()
+    metrics_port = st.secrets.get("METRICS_PORT")
+    if metrics_port:
+        # With run.py --workers each worker exports on its own port (METRICS_PORT + worker index)
+        port = worker_metrics_port(int(metrics_port))
+        try:
+            start_metrics_server(metrics, port, host=st.secrets.get("METRICS_HOST", "127.0.0.1"))
+        except OSError as e:
+            # The port is taken (e.g. by another process): serve the app without the exporter
+            logger.warning("Metrics exporter not started on port %d: %s", port, e)
+    log_interval = st.secrets.get("METRICS_LOG_INTERVAL")
+    if log_interval:
+        start_json_log(metrics, float(log_interval))
+    return metrics
+
 # Initialize Sarvam client using st.secrets
+# (one instance, and so one keep-alive connection pool, shared by all sessions)
 @st.cache_resource
 def get_sarvam_client():
     api_key = st.secrets.get("SARVAM_API_KEY", "default_api_key")
-    return SarvamClient(api_key)
+    pool_maxsize = int(st.secrets.get("SARVAM_POOL_MAXSIZE", 32))
+    # Requests per second for the whole process, to stay under the subscription quota
+    rate_limit = st.secrets.get("SARVAM_RATE_LIMIT")
+    # Send a backup chat request when one is slower than this latency percentile (e.g. 0.97)
+    hedge_percentile = st.secrets.get("SARVAM_HEDGE_PERCENTILE")
+    # gzip large request bodies (long chat histories); only for APIs that accept Content-Encoding
+    compress_requests = bool(st.secrets.get("SARVAM_COMPRESS_REQUESTS", False))
+    # Set TRANSLATION_CACHE_PATH to keep translations across restarts
+    # (with run.py --workers they are shared between worker processes by default)
+    translation_cache = TranslationCache(
+        db_path=st.secrets.get("TRANSLATION_CACHE_PATH") or shared_state_path("translations.db")
+    )
+    return SarvamClient(
+        api_key,
+        pool_maxsize=pool_maxsize,
+        translation_cache=translation_cache,
+        response_cache=ResponseCache(),
+        rate_limit=float(rate_limit) if rate_limit else None,
+        hedge_policy=HedgePolicy(
+            float(hedge_percentile), budget=float(st.secrets.get("SARVAM_HEDGE_BUDGET", 0.05))
+        ) if hedge_percentile else None,
+        compress_requests=compress_requests,
+        # Point at a local mock server for offline runs and load tests
+        base_url=st.secrets.get("SARVAM_BASE_URL"),
+        metrics=get_metrics()
+    )
+
+# Initialize conversation context window manager
+@st.cache_resource
+def get_context_manager():
+    return ContextWindowManager(
+        token_budget=int(st.secrets.get("CONTEXT_TOKEN_BUDGET", 3000)),
+        summary_mode=bool(st.secrets.get("CONTEXT_SUMMARY", False))
+    )
+
+# Initialize background worker pool (shared by all sessions)
+@st.cache_resource
+def get_worker_pool():
+    return WorkerPool(max_workers=int(st.secrets.get("WORKER_THREADS", 16)))
 
 # Initialize tiger mascot
 @st.cache_resource
@@ -28,12 +100,50 @@ def get_tiger_mascot():
 # Initialize language support
 @st.cache_resource
 def get_language_support():
-    return LanguageSupport()
+    # Optional JSON file with extra languages, see language_support.load_language_file
+    return LanguageSupport(language_file=st.secrets.get("LANGUAGES_FILE"))
+
+# Initialize conversation store (SQLite file by default; "jsonl" keeps one log per session)
+@st.cache_resource
+def get_conversation_store():
+    backend = st.secrets.get("CONVERSATION_STORE", "sqlite")
+    path = st.secrets.get("CONVERSATION_STORE_PATH")
+    if path is None and backend != "memory":
+        path = shared_state_path("conversations.db" if backend == "sqlite" else "conversations")
+    return create_store(backend, path)
+
+# Query parameter of resume links; the conversation ID is never put in the page URL otherwise
+RESUME_QUERY_PARAM = "session"
+
+def open_conversation():
+    """Resume the conversation of a resume link (?session=...), or start a new one"""
+    session_id = st.query_params.get(RESUME_QUERY_PARAM)
+    if session_id is not None:
+        # The ID grants access to the conversation: keep it out of the address bar and shared page URLs
+        del st.query_params[RESUME_QUERY_PARAM]
+    try:
+        session_id = validate_session_id(session_id) if session_id else None
+    except ValueError:
+        session_id = None
+    if session_id is None:
+        session_id = new_session_id()
+    window = int(st.secrets.get("CONVERSATION_WINDOW", DEFAULT_WINDOW))
+    return Conversation(get_conversation_store(), session_id, window=window)
+
+def resume_link(session_id):
+    """Link that reopens a conversation; anyone holding it can read and continue it"""
+    # st.context.url is unknown outside a browser session; the query alone still works there
+    base_url = (st.context.url or "").split("?")[0]
+    return f"{base_url}?{RESUME_QUERY_PARAM}={session_id}"
+
+def append_message(role, content):
+    """Store a turn in the session's conversation"""
+    st.session_state.conversation.append(new_message(role, content))
 
 def initialize_session_state():
     """Initialize session state variables"""
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    if "conversation" not in st.session_state:
+        st.session_state.conversation = open_conversation()
     if "dark_mode" not in st.session_state:
         st.session_state.dark_mode = False
     if "tiger_state" not in st.session_state:
@@ -42,6 +152,16 @@ def initialize_session_state():
         st.session_state.selected_language = "en-IN"
     if "auto_translate" not in st.session_state:
         st.session_state.auto_translate = False
+    if "chat_job" not in st.session_state:
+        st.session_state.chat_job = None
+    if "chat_error" not in st.session_state:
+        st.session_state.chat_error = None
+    if "weather_job" not in st.session_state:
+        st.session_state.weather_job = None
+    if "weather_report" not in st.session_state:
+        st.session_state.weather_report = None
+    if "session_metrics" not in st.session_state:
+        st.session_state.session_metrics = MetricsRegistry()
 
 def apply_dark_theme():
     """Dark theme styling"""
@@ -61,67 +181,240 @@ def apply_light_theme():
     </style>
     """
 
+def _render_theme_button(theme_icon):
+    return f"""
+    <button class="theme-toggle" onclick="document.getElementById('theme-toggle-btn').click();">
+        {theme_icon}
+    </button>
+    """
+
+# Theme CSS and toggle button per mode, rendered once per process
+THEME_FRAGMENTS = MappingProxyType({
+    True: (compact_html(apply_dark_theme()), compact_html(_render_theme_button("☀️"))),
+    False: (compact_html(apply_light_theme()), compact_html(_render_theme_button("🌙")))
+})
+
 def render_tiger_mascot(tiger_mascot, state):
     animation_class = tiger_mascot.get_animation_class(state)
     tiger_html = get_simple_tiger_html(state=state, animation_class=animation_class)
     st.markdown(tiger_html, unsafe_allow_html=True)
 
+# Initialize weather service (shared cache and connection pool for all sessions)
+@st.cache_resource
+def get_weather_service():
+    from shared_cache import SharedCache
+    from weather import WeatherService
+
+    api_key = st.secrets.get("WEATHER_API_KEY", "default_weather_api_key")
+    ttl_seconds = float(st.secrets.get("WEATHER_CACHE_TTL", 600))
+    shared_path = shared_state_path("shared_cache.db")
+    return WeatherService(
+        api_key,
+        ttl_seconds=ttl_seconds,
+        metrics=get_metrics(),
+        shared_cache=SharedCache(shared_path, "weather") if shared_path else None
+    )
+
 # ✅ ✅ ✅ UPDATED: WeatherAPI version
 def get_weather(city: str):
-    api_key = st.secrets.get("WEATHER_API_KEY", "default_weather_api_key")
-    base_url = "http://api.weatherapi.com/v1/current.json"
-    params = {
-        "key": api_key,
-        "q": city,
-        "aqi": "no"
-    }
+    return get_weather_service().get_weather(city)
+
+# Background jobs: these run on worker threads and must not touch st.*
+
+def run_weather_job(job, weather_service, city):
+    """Fetch a weather report as a chat reply"""
+    return {"success": True, "message": weather_service.get_weather(city)}
+
+def run_chat_job(job, sarvam_client, context_manager, system_message, history, history_offset, conversation,
+                 target_language, pipelined=True):
+    """
+    Stream a chat reply into job.partial and optionally translate it
+
+    With pipelined translation each completed sentence is translated while
+    the rest of the reply is still being generated, and the translated prefix
+    is published in job.partial_translation; otherwise the whole reply is
+    translated once generation has finished. history starts at message
+    history_offset of the conversation (see ContextWindowManager.load_history);
+    a summary compacted on the way is saved with the conversation.
+    """
+    # Bounded request: system message + the recent turns that fit the token budget
+    summary_state = conversation.summary
+    covered = summary_state.get("covered")
+    messages_with_identity = context_manager.build_messages(
+        system_message,
+        history,
+        summary_state=summary_state,
+        summarizer=make_summarizer(sarvam_client),
+        history_offset=history_offset
+    )
+    if summary_state.get("covered") != covered:
+        conversation.save_summary()
+    # A canned opening prompt (greetings, "who made you", ...) opts in to the shared
+    # response cache; every other turn streams and is never shared between users
+    opening = history_offset + len(history) == 1 and is_canned_prompt(history[-1]["content"])
+    response = sarvam_client.chat_completion(
+        messages=messages_with_identity,
+        temperature=0.8,
+        stream=True,
+        cache=True if opening else None
+    )
+    if not response["success"]:
+        return response
+
+    translator = None
+    if target_language is not None and pipelined:
+        from translation_pipeline import StreamingTranslator
+        translator = StreamingTranslator(sarvam_client, target_language)
+
+    ai_response = ""
     try:
-        response = requests.get(base_url, params=params)
-        data = response.json()
-        if response.status_code == 200:
-            location = data["location"]["name"]
-            region = data["location"]["region"]
-            country = data["location"]["country"]
-            temp_c = data["current"]["temp_c"]
-            feelslike_c = data["current"]["feelslike_c"]
-            condition = data["current"]["condition"]["text"]
-            humidity = data["current"]["humidity"]
-            wind_kph = data["current"]["wind_kph"]
-
-            result = (
-                f"**Weather in {location}, {region}, {country}**\n"
-                f"- Condition: {condition}\n"
-                f"- Temperature: {temp_c}°C (Feels like {feelslike_c}°C)\n"
-                f"- Humidity: {humidity}%\n"
-                f"- Wind Speed: {wind_kph} kph"
+        for delta in response["stream"]:
+            if job.cancelled:
+                return {"success": False, "error": "Cancelled", "cancelled": True}
+            ai_response += delta
+            job.partial = ai_response
+            if translator is not None:
+                translator.feed(delta)
+                job.partial_translation = translator.translated_text()
+        if not ai_response:
+            return {"success": False, "error": "Empty response from API", "unexpected": True}
+
+        if translator is not None:
+            translator.finish()
+            translation_result = translator.result()
+        elif target_language is not None:
+            translation_result = sarvam_client.translate_text(
+                text=ai_response,
+                source_language="en-IN",
+                target_language=target_language
             )
-            return result
-        else:
-            error_message = data.get("error", {}).get("message", "Unknown error")
-            return f"❌ Could not fetch weather: {error_message}"
+    finally:
+        # Drops queued translations when the job ends early (cancelled, or the stream
+        # broke off); after result() it only shuts the translator's threads down
+        if translator is not None:
+            translator.cancel()
+    if target_language is not None:
+        if translation_result["success"]:
+            translated = translation_result["translated_text"]
+            ai_response = f"{translated}\n\n---\n*Original (English):* {ai_response}"
+    return {"success": True, "message": ai_response}
+
+@st.fragment(run_every=0.25)
+def render_chat_job(language_support):
+    """Poll the session's pending chat job and render its progress"""
+    job = st.session_state.chat_job
+    if job is None:
+        return
+
+    if not job.done:
+        with st.chat_message("assistant"):
+            if job.partial_translation:
+                st.markdown(f"{job.partial_translation}▌\n\n---\n*Original (English):* {job.partial}")
+            elif job.partial:
+                st.markdown(job.partial + "▌")
+            else:
+                thinking_message = language_support.get_thinking_message(st.session_state.selected_language)
+                st.markdown(f'<div class="loading-message">{thinking_message}</div>', unsafe_allow_html=True)
+        return
+
+    st.session_state.chat_job = None
+    result = job.result()
+    if result["success"]:
+        append_message("assistant", result["message"])
+        st.session_state.tiger_state = "happy"
+    elif not result.get("cancelled"):
+        st.session_state.chat_error = f"❌ Error: {result.get('error', 'Unknown error occurred')}"
+        st.session_state.tiger_state = "confused" if result.get("unexpected") else "sad"
+    st.rerun()
 
-    except Exception as e:
-        return f"❌ Error fetching weather: {str(e)}"
+@st.fragment(run_every=0.5)
+def render_weather_job():
+    """Poll the session's pending sidebar weather lookup"""
+    job = st.session_state.weather_job
+    if job is None:
+        return
+    if not job.done:
+        st.caption("☁️ Fetching weather...")
+        return
+
+    st.session_state.weather_job = None
+    st.session_state.weather_report = job.result().get("message") or job.result().get("error")
+    st.rerun()
+
+def format_metrics_table(rows):
+    """Markdown table of MetricsRegistry.summary() rows"""
+    if not rows:
+        return "_No API requests yet_"
+    lines = [
+        "| Endpoint | Req | Err | p50 | p95 | TTFB | KB out/in | Compression out/in | Tokens |",
+        "|---|---:|---:|---:|---:|---:|---:|---:|---:|"
+    ]
+    for row in rows:
+        lines.append(
+            f"| {row['service']} {row['endpoint']} | {row['requests']} | {row['errors']} "
+            f"| {row['total_p50'] * 1000:.0f} ms | {row['total_p95'] * 1000:.0f} ms | {row['ttfb_p50'] * 1000:.0f} ms "
+            f"| {row['bytes_sent'] / 1024:.1f}/{row['bytes_received'] / 1024:.1f} "
+            f"| {row['request_compression']:.1f}×/{row['response_compression']:.1f}× | {row['tokens']} |"
+        )
+    return "\n".join(lines)
+
+def render_performance_panel(worker_pool):
+    """Sidebar panel with this session's and the whole process's request metrics"""
+    with st.expander("📊 Performance"):
+        st.markdown("**This session**")
+        st.markdown(format_metrics_table(st.session_state.session_metrics.summary()))
+        st.markdown("**All sessions**")
+        st.markdown(format_metrics_table(get_metrics().summary()))
+        pool_stats = worker_pool.get_stats()
+        st.caption(
+            f"Worker pool: {pool_stats['pending']} pending of {pool_stats['max_workers']} workers, "
+            f"{pool_stats['rejected']} rejected"
+        )
+        sarvam_client = get_sarvam_client()
+        if sarvam_client.hedge_policy is not None:
+            resilience = sarvam_client.get_resilience_stats()
+            st.caption(
+                f"Hedged chat requests: {resilience['hedges_fired']} sent, {resilience['hedges_won']} won, "
+                f"{resilience['hedges_denied']} over budget"
+            )
+
+# Run once per process, by run.py before it reports the worker ready (see startup.py)
+@st.cache_resource
+def warm_up():
+    """Build the shared resources and open pooled API connections ahead of the first user"""
+    started = time.perf_counter()
+    # Localization and mascot tables, caches, stores and the worker pool
+    get_metrics()
+    get_context_manager()
+    get_worker_pool()
+    get_tiger_mascot()
+    get_language_support()
+    get_conversation_store()
+    report = get_sarvam_client().warm_up(
+        connections=int(st.secrets.get("WARMUP_CONNECTIONS", 2)),
+        check_connection=check_connection_requested()
+    )
+    report["seconds"] = time.perf_counter() - started
+    return report
 
 def main():
+    if warmup_requested(st.query_params.get(WARMUP_QUERY_PARAM)):
+        # Warm-up session: report and stop before a conversation is created
+        st.json(warm_up())
+        st.stop()
+
     initialize_session_state()
+    # API calls made for this session, here or on worker threads, also count toward its own stats
+    bind_session(st.session_state.session_metrics)
 
     sarvam_client = get_sarvam_client()
+    context_manager = get_context_manager()
+    worker_pool = get_worker_pool()
     tiger_mascot = get_tiger_mascot()
     language_support = get_language_support()
 
-    if st.session_state.dark_mode:
-        st.markdown(apply_dark_theme(), unsafe_allow_html=True)
-        theme_icon = "☀️"
-    else:
-        st.markdown(apply_light_theme(), unsafe_allow_html=True)
-        theme_icon = "🌙"
-
-    theme_button_html = f"""
-    <button class="theme-toggle" onclick="document.getElementById('theme-toggle-btn').click();">
-        {theme_icon}
-    </button>
-    """
+    theme_css, theme_button_html = THEME_FRAGMENTS[bool(st.session_state.dark_mode)]
+    st.markdown(theme_css, unsafe_allow_html=True)
     st.markdown(theme_button_html, unsafe_allow_html=True)
 
     if st.button("", key="theme-toggle-btn", help="Toggle theme"):
@@ -160,62 +453,46 @@ def main():
 
     render_tiger_mascot(tiger_mascot, st.session_state.tiger_state)
 
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+    # Recent turns as chat bubbles, older ones paged behind "load more"
+    render_chat_history(st.session_state.conversation, int(st.secrets.get("HISTORY_PAGE_SIZE", HISTORY_PAGE_SIZE)))
+
+    if st.session_state.chat_error:
+        st.markdown(f'<div class="error-message">{st.session_state.chat_error}</div>', unsafe_allow_html=True)
+
+    if st.session_state.chat_job is not None:
+        render_chat_job(language_support)
 
     chat_placeholder = language_support.get_chat_placeholder(st.session_state.selected_language)
-    if prompt := st.chat_input(chat_placeholder):
+    if prompt := st.chat_input(chat_placeholder, disabled=st.session_state.chat_job is not None):
+        st.session_state.chat_error = None
         if prompt.lower().startswith("weather in"):
             city_name = prompt[10:].strip()
-            weather = get_weather(city_name)
-            st.session_state.messages.append({"role": "assistant", "content": weather})
-            with st.chat_message("assistant"):
-                st.markdown(weather)
-            st.session_state.tiger_state = "happy"
-            st.rerun()
+            st.session_state.chat_job = worker_pool.submit("weather", run_weather_job, get_weather_service(), city_name)
         else:
-            st.session_state.messages.append({"role": "user", "content": prompt})
-            with st.chat_message("user"):
-                st.markdown(prompt)
-            st.session_state.tiger_state = "thinking"
-            render_tiger_mascot(tiger_mascot, st.session_state.tiger_state)
-            with st.chat_message("assistant"):
-                message_placeholder = st.empty()
-                thinking_message = language_support.get_thinking_message(st.session_state.selected_language)
-                message_placeholder.markdown(f'<div class="loading-message">{thinking_message}</div>', unsafe_allow_html=True)
-                try:
-                    system_message = language_support.create_system_message_for_language(st.session_state.selected_language)
-                    messages_with_identity = st.session_state.messages.copy()
-                    if not messages_with_identity or messages_with_identity[0].get("role") != "system":
-                        messages_with_identity.insert(0, system_message)
-                    else:
-                        messages_with_identity[0] = system_message
-                    response = sarvam_client.chat_completion(messages=messages_with_identity, temperature=0.8)
-                    if response["success"]:
-                        ai_response = response["message"]
-                        if (st.session_state.auto_translate and st.session_state.selected_language != "en-IN"):
-                            translation_result = sarvam_client.translate_text(
-                                text=ai_response,
-                                source_language="en-IN",
-                                target_language=st.session_state.selected_language
-                            )
-                            if translation_result["success"]:
-                                translated = translation_result["translated_text"]
-                                ai_response = f"{translated}\n\n---\n*Original (English):* {ai_response}"
-                        st.session_state.tiger_state = "excited"
-                        message_placeholder.markdown(ai_response)
-                        st.session_state.messages.append({"role": "assistant", "content": ai_response})
-                        time.sleep(0.5)
-                        st.session_state.tiger_state = "happy"
-                    else:
-                        error_msg = f"❌ Error: {response.get('error', 'Unknown error occurred')}"
-                        message_placeholder.markdown(f'<div class="error-message">{error_msg}</div>', unsafe_allow_html=True)
-                        st.session_state.tiger_state = "sad"
-                except Exception as e:
-                    message_placeholder.markdown(f'<div class="error-message">❌ Unexpected error: {str(e)}</div>', unsafe_allow_html=True)
-                    st.session_state.tiger_state = "confused"
-            st.rerun()
+            append_message("user", prompt)
+            # Older turns come from the store when the in-memory window does not cover the token budget
+            conversation = st.session_state.conversation
+            history_offset, history = context_manager.load_history(
+                conversation.load, len(conversation), conversation.summary
+            )
+            system_message = language_support.create_system_message_for_language(st.session_state.selected_language)
+            target_language = None
+            if st.session_state.auto_translate and st.session_state.selected_language != "en-IN":
+                target_language = st.session_state.selected_language
+            st.session_state.chat_job = worker_pool.submit(
+                "chat",
+                run_chat_job,
+                sarvam_client,
+                context_manager,
+                system_message,
+                history,
+                history_offset,
+                conversation,
+                target_language,
+                bool(st.secrets.get("PIPELINED_TRANSLATION", True))
+            )
+        st.session_state.tiger_state = "thinking"
+        st.rerun()
 
     with st.sidebar:
         st.markdown("### 🦁 Mufasa - Your AI Companion")
@@ -241,13 +518,27 @@ def main():
         city = st.text_input("Enter city name for weather")
         if st.button("🔍 Get Weather"):
             if city:
-                weather_report = get_weather(city)
-                st.info(weather_report)
+                st.session_state.weather_report = None
+                st.session_state.weather_job = worker_pool.submit("weather", run_weather_job, get_weather_service(), city)
             else:
                 st.warning("Please enter a city name.")
+        if st.session_state.weather_job is not None:
+            render_weather_job()
+        elif st.session_state.weather_report:
+            st.info(st.session_state.weather_report)
+
+        # Only shown on request: the link is the only credential for the conversation
+        if st.toggle("🔗 Show resume link"):
+            st.code(resume_link(st.session_state.conversation.session_id), language=None)
+            st.caption("Opens this conversation again later. Anyone with the link can read and continue it.")
 
         if st.button("🗑️ Clear Chat History"):
-            st.session_state.messages = []
+            if st.session_state.chat_job is not None:
+                st.session_state.chat_job.cancel()
+                st.session_state.chat_job = None
+            st.session_state.chat_error = None
+            st.session_state.conversation.clear()
+            reset_history_view()
             st.session_state.tiger_state = "idle"
             st.rerun()
 
@@ -257,6 +548,8 @@ def main():
         else:
             st.success("✅ SARVAM API key configured")
 
+        render_performance_panel(worker_pool)
+
     st.markdown('</div>', unsafe_allow_html=True)
 
 if __name__ == "__main__":
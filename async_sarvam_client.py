@@ -0,0 +1,269 @@
+"""
+Asyncio client for Sarvam AI API
+Async twin of SarvamClient for batch jobs that keep many requests in flight
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, Union
+
+from sarvam_client import (
+    CONNECTION_ERROR,
+    DEFAULT_TIMEOUTS,
+    INVALID_JSON_ERROR,
+    TIMEOUT_ERROR,
+    build_chat_payload,
+    build_translate_payload,
+    error_result,
+    parse_chat_response,
+    parse_detect_response,
+    parse_translate_response,
+    resolve_base_url
+)
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, only needed for batch jobs
+    aiohttp = None
+
+
+class AsyncSarvamClient:
+    """Asyncio client for Sarvam AI API returning the same result dicts as SarvamClient"""
+
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = 100,
+        pool_maxsize: int = 100,
+        timeouts: Optional[Dict[str, Union[float, Tuple[float, float]]]] = None,
+        base_url: Optional[str] = None
+    ):
+        """
+        Initialize the async client with API key
+
+        Args:
+            api_key: Sarvam AI subscription key
+            max_concurrency: Maximum requests in flight across all calls
+            pool_maxsize: Maximum open connections in the aiohttp connector
+            timeouts: Per-endpoint timeout overrides, keyed like DEFAULT_TIMEOUTS
+            base_url: API base URL (default: SARVAM_BASE_URL, then the public API)
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncSarvamClient requires aiohttp. Install it with: pip install aiohttp")
+
+        self.api_key = api_key
+        self.base_url = resolve_base_url(base_url)
+        self.headers = {
+            "api-subscription-key": api_key,
+            "Content-Type": "application/json"
+        }
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # The aiohttp session must be created inside a running event loop
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying aiohttp session and its connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        return self._session
+
+    def _timeout(self, endpoint: str):
+        timeout = self.timeouts.get(endpoint, 30)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=timeout)
+
+    async def _post(self, endpoint: str, payload: Dict[str, Any]) -> Tuple[int, bytes]:
+        """Send a JSON POST and return the status code and raw body"""
+        session = self._get_session()
+        async with self._semaphore:
+            async with session.post(
+                f"{self.base_url}/{endpoint}",
+                json=payload,
+                timeout=self._timeout(endpoint)
+            ) as response:
+                return response.status, await response.read()
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "sarvam-m",
+        temperature: float = 0.8,
+        top_p: float = 0.9,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        wiki_grounding: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get chat completion from Sarvam AI
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            model: Model to use (default: sarvam-m)
+            temperature: Controls randomness (0-2)
+            top_p: Nucleus sampling parameter
+            max_tokens: Maximum tokens to generate
+            stop: List of stop sequences
+            frequency_penalty: Penalize repetition (-2.0 to 2.0)
+            presence_penalty: Encourage new topics (-2.0 to 2.0)
+            wiki_grounding: Enable RAG with Wikipedia
+
+        Returns:
+            Dictionary with success status and response/error message
+        """
+        payload = build_chat_payload(
+            messages,
+            model=model,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            stop=stop,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            wiki_grounding=wiki_grounding
+        )
+
+        try:
+            status_code, body = await self._post("chat/completions", payload)
+            return parse_chat_response(status_code, body)
+
+        except asyncio.TimeoutError:
+            return error_result(TIMEOUT_ERROR)
+
+        except aiohttp.ClientConnectionError:
+            return error_result(CONNECTION_ERROR)
+
+        except json.JSONDecodeError:
+            return error_result(INVALID_JSON_ERROR)
+
+        except aiohttp.ClientError as e:
+            return error_result(f"Request error: {str(e)}")
+
+        except Exception as e:
+            return error_result(f"Unexpected error: {str(e)}")
+
+    async def translate_text(
+        self,
+        text: str,
+        source_language: str = "en-IN",
+        target_language: str = "hi-IN",
+        speaker_gender: str = "Male",
+        mode: str = "formal",
+        model: str = "mayura:v1"
+    ) -> Dict[str, Any]:
+        """
+        Translate text using Sarvam AI translation API
+
+        Args:
+            text: Text to translate
+            source_language: Source language code (BCP-47 format)
+            target_language: Target language code (BCP-47 format)
+            speaker_gender: Male or Female
+            mode: formal or informal
+            model: Translation model
+
+        Returns:
+            Dictionary with success status and translated text or error
+        """
+        payload = build_translate_payload(
+            text,
+            source_language=source_language,
+            target_language=target_language,
+            speaker_gender=speaker_gender,
+            mode=mode,
+            model=model
+        )
+
+        try:
+            status_code, body = await self._post("translate", payload)
+            return parse_translate_response(status_code, body)
+
+        except Exception as e:
+            return error_result(f"Translation error: {str(e)}")
+
+    async def detect_language(self, text: str) -> Dict[str, Any]:
+        """
+        Detect the language of given text
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Dictionary with success status and detected language or error
+        """
+        try:
+            status_code, body = await self._post("detect-language", {"input": text})
+            return parse_detect_response(status_code, body)
+
+        except Exception as e:
+            return error_result(f"Language detection error: {str(e)}")
+
+    async def gather(
+        self,
+        calls: Iterable[Awaitable[Dict[str, Any]]],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many client calls concurrently with a bound on how many run at once
+
+        Args:
+            calls: Coroutines such as client.translate_text(...) (not yet awaited)
+            concurrency: Maximum calls running at once (default: max_concurrency)
+
+        Returns:
+            Result dictionaries in the same order as the calls
+        """
+        limit = asyncio.Semaphore(concurrency or self.max_concurrency)
+
+        async def run(call):
+            async with limit:
+                try:
+                    return await call
+                except Exception as e:
+                    return error_result(f"Unexpected error: {str(e)}")
+
+        return await asyncio.gather(*(run(call) for call in calls))
+
+    async def test_connection(self) -> Dict[str, Any]:
+        """
+        Test the connection to Sarvam AI API
+
+        Returns:
+            Dictionary with success status and connection info
+        """
+        result = await self.chat_completion(
+            messages=[{"role": "user", "content": "Hello"}],
+            temperature=0.1
+        )
+
+        if result["success"]:
+            return {
+                "success": True,
+                "message": "API connection successful"
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"API connection failed: {result.get('error', 'Unknown error')}"
+            }
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark
+Starts fresh Streamlit workers against the mock Sarvam server and measures
+time to ready and the latency of the first user's page (a session with a
+40-message conversation), with and without run.py's warm-up, next to a
+steady-state rerun of the same page.
+
+Requires the websockets package (installed with Streamlit).
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_workers import free_port, seed_conversations
+from load_balancer import probe_health
+from mock_sarvam_server import MockSarvamServer
+from run import start_worker, stop_workers
+from startup import run_script, warm_up_worker
+
+
+async def start_once(work_dir, warm_up):
+    """
+    Start a worker with fresh state and time it until the first page is served
+
+    Returns:
+        (seconds to ready, seconds spent warming up, first page seconds,
+        steady-state page seconds)
+    """
+    state_dir = tempfile.mkdtemp(dir=work_dir)
+    session_id = seed_conversations(state_dir, 1)[0]
+    port = free_port()
+    started = time.perf_counter()
+    process = start_worker(port, state_dir, cwd=work_dir, quiet=True)
+    try:
+        warm_up_seconds = 0.0
+        if warm_up:
+            report = await warm_up_worker("127.0.0.1", port, process=process)
+            warm_up_seconds = report["warm_up_seconds"]
+        else:
+            while not await probe_health("127.0.0.1", port):
+                await asyncio.sleep(0.05)
+        ready = time.perf_counter() - started
+
+        page_started = time.perf_counter()
+        await run_script("127.0.0.1", port, f"session={session_id}")
+        first_page = time.perf_counter() - page_started
+
+        page_started = time.perf_counter()
+        await run_script("127.0.0.1", port, f"session={session_id}")
+        steady_page = time.perf_counter() - page_started
+        return ready, warm_up_seconds, first_page, steady_page
+    finally:
+        stop_workers([process])
+
+
+async def main_async(args):
+    work_dir = tempfile.mkdtemp(prefix="mufasa-bench-")
+    os.makedirs(os.path.join(work_dir, ".streamlit"))
+    try:
+        with MockSarvamServer() as server:
+            with open(os.path.join(work_dir, ".streamlit", "secrets.toml"), "w") as secrets:
+                secrets.write(f'SARVAM_API_KEY = "benchmark-key"\nSARVAM_BASE_URL = "{server.base_url}"\n')
+            print(f"Median of {args.runs} fresh worker starts")
+            print(f"{'start':<8} {'ready (s)':>10} {'warm-up (s)':>12} {'first page (ms)':>16} "
+                  f"{'steady page (ms)':>17} {'start to page (s)':>18}")
+            for warm_up in (False, True):
+                results = [await start_once(work_dir, warm_up) for _ in range(args.runs)]
+                ready, warm, first, steady = (statistics.median(column) for column in zip(*results))
+                total = statistics.median(result[0] + result[2] for result in results)
+                print(f"{'warm' if warm_up else 'cold':<8} {ready:>10.2f} {warm:>12.2f} {first * 1000:>16.0f} "
+                      f"{steady * 1000:>17.0f} {total:>18.2f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark time to first response of a fresh worker")
+    parser.add_argument("--runs", type=int, default=3, help="fresh starts measured per mode")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
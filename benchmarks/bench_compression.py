@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Compression benchmark
+Sends chat completions with 10- to 200-turn histories and translations of
+growing length to the mock Sarvam server over a bandwidth-limited link, and
+compares bytes on the wire and request latency with and without gzip request
+bodies and compressed responses. Messages are random word sequences over a
+mixed Hindi/English vocabulary, so ratios are not inflated by repeated text.
+"""
+
+import argparse
+import gzip
+import os
+import random
+import statistics
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_request_encoding import TURNS
+from language_support import LanguageSupport
+from mock_sarvam_server import MockSarvamServer
+from sarvam_client import REQUEST_COMPRESSION_LEVEL, SarvamClient, build_chat_payload, encode_json
+
+SENTENCES = (
+    "The lion king watched the sun rise over the savanna while the herds moved toward the river",
+    "राजा का समय सूरज की तरह उगता और ढलता है और हर जीव जीवन के चक्र का हिस्सा है",
+    "Everything the light touches is part of the circle of life, from the ant to the antelope",
+    "मेरे बच्चे याद रखो कि तुम कौन हो क्योंकि सच्चा राजा अपनी प्रजा की रक्षा करता है",
+    "Rafiki says the past can hurt, but you can either run from it or learn from it",
+    "बहादुरी का मतलब डर का न होना नहीं बल्कि डर के बावजूद सही काम करना है"
+)
+VOCABULARY = sorted({word for sentence in SENTENCES for word in sentence.split()})
+
+
+def random_text(rng, words):
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def history(turns, seed=7):
+    """Alternating user questions (~15 words) and replies (~60 words)"""
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(turns):
+        messages.append({"role": "user", "content": random_text(rng, 15)})
+        messages.append({"role": "assistant", "content": random_text(rng, 60)})
+    return messages
+
+
+def median_ms(function, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+    return statistics.median(timings) * 1000
+
+
+def endpoint_row(client, endpoint):
+    return next(row for row in client.metrics.summary() if row["endpoint"] == endpoint)
+
+
+def chat_requests(args, system_message):
+    print(f"Chat completions, upload limited to {args.bandwidth / 1000:.0f} KB/s")
+    print(f"{'turns':>5} {'body bytes':>11} {'gzip bytes':>11} {'ratio':>6} {'gzip (us)':>10} "
+          f"{'plain ms':>9} {'gzip ms':>8}")
+    with MockSarvamServer(first_token_delay=0.0, token_delay=0.0, upload_bandwidth=args.bandwidth) as server:
+        for turns in TURNS:
+            messages = [system_message] + history(turns)
+            body = encode_json(build_chat_payload(messages))
+            compress = lambda: gzip.compress(body, compresslevel=REQUEST_COMPRESSION_LEVEL, mtime=0)
+            compress_us = min(timeit.repeat(compress, number=20, repeat=5)) / 20 * 1e6
+            latencies = []
+            for compress_requests in (False, True):
+                client = SarvamClient("benchmark-key", base_url=server.base_url, compress_requests=compress_requests)
+                latencies.append(median_ms(lambda: client.chat_completion(messages), args.runs))
+                row = endpoint_row(client, "chat/completions")
+                client.close()
+            print(f"{turns:>5} {len(body):>11} {len(compress()):>11} {row['request_compression']:>5.1f}x "
+                  f"{compress_us:>10.0f} {latencies[0]:>9.1f} {latencies[1]:>8.1f}")
+
+
+def translations(args):
+    print(f"\nTranslations, download limited to {args.bandwidth / 1000:.0f} KB/s")
+    print(f"{'chars':>5} {'plain bytes':>12} {'wire bytes':>11} {'ratio':>6} {'plain ms':>9} {'compressed ms':>14}")
+    for chars in (100, 250, 500, 1000):
+        rng = random.Random(chars)
+        text = ""
+        while len(text) < chars:
+            text += random_text(rng, 12) + "\n"
+        text = text[:chars]
+        latencies, rows = [], []
+        for compress_responses in (False, True):
+            with MockSarvamServer(
+                translate_delay=0.0, download_bandwidth=args.bandwidth, compress_responses=compress_responses
+            ) as server:
+                client = SarvamClient("benchmark-key", base_url=server.base_url)
+                latencies.append(median_ms(lambda: client.translate_text(text, target_language="hi-IN"), args.runs))
+                rows.append(endpoint_row(client, "translate"))
+                client.close()
+        plain = rows[0]["bytes_received"] // rows[0]["requests"]
+        wire = rows[1]["bytes_received"] // rows[1]["requests"]
+        print(f"{chars:>5} {plain:>12} {wire:>11} {rows[1]['response_compression']:>5.1f}x "
+              f"{latencies[0]:>9.1f} {latencies[1]:>14.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark request and response compression against payload size")
+    parser.add_argument("--bandwidth", type=float, default=125_000, help="link bytes per second (default: 1 Mbit/s)")
+    parser.add_argument("--runs", type=int, default=5, help="requests timed per size and mode")
+    args = parser.parse_args()
+
+    system_message = LanguageSupport().create_system_message_for_language("hi-IN")
+    chat_requests(args, system_message)
+    translations(args)
+
+
+if __name__ == "__main__":
+    main()
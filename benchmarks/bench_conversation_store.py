@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Conversation store benchmark
+Measures per-turn append cost, resume time and per-session memory for the
+SQLite and JSONL stores against keeping the whole history in memory
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chat_history import new_message
+from conversation_store import DEFAULT_WINDOW, Conversation, create_store
+
+TURNS = 2000
+REPLY = (
+    "Everything the light touches is our kingdom. A king's time as ruler rises and falls like the sun. "
+    "Remember who you are, and respect the circle of life."
+)
+
+
+def messages():
+    for i in range(TURNS):
+        yield new_message("user", f"Question number {i // 2}?") if i % 2 == 0 else new_message("assistant", REPLY)
+
+
+def retained_kb(build):
+    """Memory still allocated by the object build() returns, in KB"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / 1024
+
+
+def measure(backend, path):
+    store = create_store(backend, path)
+    conversation = Conversation(store, "benchmark")
+    start = time.perf_counter()
+    for message in messages():
+        conversation.append(message)
+    append_us = (time.perf_counter() - start) / TURNS * 1e6
+
+    start = time.perf_counter()
+    resumed = Conversation(store, "benchmark")
+    resume_ms = (time.perf_counter() - start) * 1000
+    assert len(resumed) == TURNS and len(resumed.messages) == DEFAULT_WINDOW
+
+    memory = retained_kb(lambda: Conversation(store, "benchmark"))
+    store.close()
+    return append_us, resume_ms, memory
+
+
+def main():
+    full_history = retained_kb(lambda: list(messages()))
+    print(f"{TURNS} messages per session, window of {DEFAULT_WINDOW}")
+    print(f"{'store':<14} {'append (us)':>12} {'resume (ms)':>12} {'session KB':>11}")
+    print(f"{'in-memory list':<14} {'-':>12} {'-':>12} {full_history:>11.1f}")
+    with tempfile.TemporaryDirectory() as directory:
+        for backend, path in (("sqlite", os.path.join(directory, "conversations.db")),
+                              ("jsonl", os.path.join(directory, "conversations"))):
+            append_us, resume_ms, memory = measure(backend, path)
+            print(f"{backend:<14} {append_us:>12.1f} {resume_ms:>12.2f} {memory:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
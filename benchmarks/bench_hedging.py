@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Request hedging benchmark
+Streams chat completions from the mock Sarvam server with an injected
+latency tail (a few percent of requests stall before answering) and
+compares time to first token and extra upstream load with and without a
+HedgePolicy
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_sarvam_server import Latency, MockSarvamServer
+from resilience import HedgePolicy
+from sarvam_client import SarvamClient
+
+MESSAGES = [{"role": "user", "content": "Tell me something wise"}]
+
+
+def measure(args, hedge):
+    latency = Latency(args.median, args.sigma, args.tail_probability, args.tail_delay, seed=args.seed)
+    with MockSarvamServer(first_token_delay=0.0, token_delay=0.002, latency={"chat/completions": latency}) as server:
+        policy = HedgePolicy(args.percentile, args.budget) if hedge else None
+        client = SarvamClient("benchmark-key", base_url=server.base_url, hedge_policy=policy)
+
+        def turn(_):
+            start = time.perf_counter()
+            result = client.chat_completion(MESSAGES, stream=True)
+            first_token = None
+            for _ in result.get("stream", ()):
+                if first_token is None:
+                    first_token = time.perf_counter() - start
+            return result["success"], first_token
+
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(executor.map(turn, range(args.requests)))
+        client.close()
+        first_tokens = [seconds for success, seconds in results if success and seconds is not None]
+        extra = server.request_counts.get("chat/completions", 0) / args.requests - 1
+        return first_tokens, len(results) - len(first_tokens), extra, client.get_resilience_stats(), server.closed_streams
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hedged chat completions against a latency tail")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--median", type=float, default=0.05, help="median seconds to first token")
+    parser.add_argument("--sigma", type=float, default=0.25, help="log-normal spread around the median")
+    parser.add_argument("--tail-probability", type=float, default=0.01, help="share of requests that stall")
+    parser.add_argument("--tail-delay", type=float, default=1.0, help="seconds a stalled request adds")
+    parser.add_argument("--percentile", type=float, default=0.97, help="hedge after this latency percentile")
+    parser.add_argument("--budget", type=float, default=0.05, help="backup requests allowed per request")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{args.requests} streamed chat completions, {args.concurrency} concurrent, "
+          f"{args.tail_probability:.0%} stall by {args.tail_delay:.1f}s")
+    print(f"{'mode':<10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'errors':>7} {'extra load':>11}"
+          f"  hedges fired/won/denied, streams cancelled")
+    for hedge in (False, True):
+        first_tokens, errors, extra, stats, closed = measure(args, hedge)
+        cuts = statistics.quantiles(first_tokens, n=100, method="inclusive")
+        print(f"{'hedged' if hedge else 'plain':<10} {cuts[49] * 1000:>8.0f} {cuts[94] * 1000:>8.0f} "
+              f"{cuts[98] * 1000:>8.0f} {max(first_tokens) * 1000:>8.0f} {errors:>7} {extra:>10.1%}  "
+              f"{stats['hedges_fired']}/{stats['hedges_won']}/{stats['hedges_denied']}, {closed}")
+
+
+if __name__ == "__main__":
+    main()
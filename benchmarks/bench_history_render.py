@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Chat history rendering benchmark
+Measures app.py script-run time with 10, 100 and 1000 messages in the
+history, replaying every message (the previous behaviour) and with the
+paged renderer
+"""
+
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest
+
+from chat_history import HISTORY_PAGE_SIZE, new_message
+from conversation_store import Conversation, MemoryConversationStore
+
+RERUNS = 5
+SIZES = (10, 100, 1000)
+REPLY = (
+    "Everything the light touches is our kingdom. A king's time as ruler rises and falls like the sun.\n\n"
+    "- Remember who you are\n- Respect the circle of life\n- Look to the stars"
+)
+
+
+def history(size):
+    """A stored conversation of size alternating user/assistant messages"""
+    conversation = Conversation(MemoryConversationStore(), "benchmark")
+    for i in range(size):
+        conversation.append(
+            new_message("user", f"Question number {i // 2}?") if i % 2 == 0 else new_message("assistant", REPLY)
+        )
+    return conversation
+
+
+def script_run_ms(size, page_size):
+    """Median app.py run time in milliseconds for a history of size messages"""
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.secrets["SARVAM_API_KEY"] = "benchmark-key"
+    at.secrets["HISTORY_PAGE_SIZE"] = page_size
+    at.secrets["CONVERSATION_STORE"] = "memory"
+    at.run()
+    at.session_state.conversation = history(size)
+    at.run()
+
+    samples = []
+    for _ in range(RERUNS):
+        start = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - start)
+    assert not at.exception, at.exception
+    return statistics.median(samples) * 1000, len(at.chat_message)
+
+
+def main():
+    print(f"{'messages':>8} {'replay all (ms)':>16} {'paged (ms)':>11} {'bubbles':>8}")
+    for size in SIZES:
+        replay, _ = script_run_ms(size, 0)
+        paged, bubbles = script_run_ms(size, HISTORY_PAGE_SIZE)
+        print(f"{size:>8} {replay:>16.1f} {paged:>11.1f} {bubbles:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Language detection micro-benchmark
+Compares the single-pass script table detector with the previous chain of
+per-Unicode-block any() scans
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from language_support import LanguageSupport
+
+
+def legacy_detect_language_from_text(text):
+    """The previous LanguageSupport.detect_language_from_text implementation"""
+    if any('\u0900' <= char <= '\u097F' for char in text):
+        return "hi-IN"
+    elif any('\u0980' <= char <= '\u09FF' for char in text):
+        return "bn-IN"
+    elif any('\u0B80' <= char <= '\u0BFF' for char in text):
+        return "ta-IN"
+    elif any('\u0C00' <= char <= '\u0C7F' for char in text):
+        return "te-IN"
+    elif any('\u0A80' <= char <= '\u0AFF' for char in text):
+        return "gu-IN"
+    elif any('\u0C80' <= char <= '\u0CFF' for char in text):
+        return "kn-IN"
+    elif any('\u0D00' <= char <= '\u0D7F' for char in text):
+        return "ml-IN"
+    elif any('\u0A00' <= char <= '\u0A7F' for char in text):
+        return "pa-IN"
+    elif any('\u0B00' <= char <= '\u0B7F' for char in text):
+        return "or-IN"
+    else:
+        return "en-IN"
+
+
+SAMPLES = {
+    "english short": "What can you do for me today, Mufasa?",
+    "english 4KB": "Everything the light touches is our kingdom. " * 90,
+    "hindi short": "आज मौसम कैसा है?",
+    "odia 4KB": "ଆଜି ପାଗ କିପରି ଅଛି? " * 200,
+    "hinglish": "yaar aaj ka weather kaisa hai, kuch batao na",
+    "mixed 4KB": ("Tell me about தமிழ் literature and its history. " * 80)
+}
+
+
+def main():
+    language_support = LanguageSupport()
+    print(f"{'sample':<15} {'legacy (us)':>12} {'table (us)':>11} {'speedup':>8}  result")
+    for label, text in SAMPLES.items():
+        number = 2000
+        legacy = timeit.timeit(lambda: legacy_detect_language_from_text(text), number=number) / number
+        table = timeit.timeit(lambda: language_support.detect_language_from_text(text), number=number) / number
+        print(f"{label:<15} {legacy * 1e6:>12.2f} {table * 1e6:>11.2f} {legacy / table:>7.1f}x  "
+              f"{legacy_detect_language_from_text(text)} -> {language_support.detect_language_from_text(text)}")
+
+
+if __name__ == "__main__":
+    main()
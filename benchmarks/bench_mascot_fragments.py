@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Mascot fragment benchmark
+Compares formatting the mascot and theme HTML on every rerun with the
+prerendered fragment tables, in time per rerun and in bytes of the
+ForwardMsg deltas Streamlit pushes over the websocket
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from app import THEME_FRAGMENTS, _render_theme_button, apply_light_theme
+from image_tiger import _render_simple_tiger_html, get_simple_tiger_html
+from tiger_mascot import TigerMascot
+
+RERUNS = 100_000
+
+
+def markdown_delta_bytes(body):
+    """Serialized size of the ForwardMsg carrying one st.markdown(..., unsafe_allow_html=True)"""
+    msg = ForwardMsg()
+    msg.delta.new_element.markdown.body = body
+    msg.delta.new_element.markdown.allow_html = True
+    return msg.ByteSize()
+
+
+def legacy_fragments(mascot, state):
+    """HTML the previous app.py formatted on every rerun"""
+    return (
+        apply_light_theme(),
+        _render_theme_button("🌙"),
+        _render_simple_tiger_html(state=state, animation_class=mascot.get_animation_class(state))
+    )
+
+
+def prerendered_fragments(mascot, state):
+    """HTML looked up from the prerendered tables"""
+    theme_css, theme_button_html = THEME_FRAGMENTS[False]
+    return (
+        theme_css,
+        theme_button_html,
+        get_simple_tiger_html(state=state, animation_class=mascot.get_animation_class(state))
+    )
+
+
+def main():
+    mascot = TigerMascot()
+
+    print(f"{'state':<12} {'legacy (us)':>12} {'tables (us)':>12} {'legacy bytes':>13} {'table bytes':>12}")
+    for state in ("idle", "thinking", "excited", "celebrating"):
+        before = timeit.timeit(lambda: legacy_fragments(mascot, state), number=RERUNS) / RERUNS
+        after = timeit.timeit(lambda: prerendered_fragments(mascot, state), number=RERUNS) / RERUNS
+        legacy_bytes = sum(markdown_delta_bytes(html) for html in legacy_fragments(mascot, state))
+        table_bytes = sum(markdown_delta_bytes(html) for html in prerendered_fragments(mascot, state))
+        print(f"{state:<12} {before * 1e6:>12.2f} {after * 1e6:>12.2f} {legacy_bytes:>13} {table_bytes:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Pipelined translation benchmark
+Compares end-to-end latency of auto-translate when the reply is translated
+after generation (the serial path) and sentence by sentence while it streams
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_sarvam_server import DEFAULT_REPLY, MockSarvamServer
+from sarvam_client import SarvamClient
+from translation_pipeline import StreamingTranslator
+
+RUNS = 5
+TARGET = "hi-IN"
+MESSAGES = [{"role": "user", "content": "Tell me something wise"}]
+REPLY = " ".join([DEFAULT_REPLY] * 3)
+
+
+def serial(client):
+    """Stream the whole reply, then translate it in one request"""
+    start = time.perf_counter()
+    result = client.chat_completion(messages=MESSAGES, stream=True)
+    reply = "".join(result["stream"])
+    translation = client.translate_text(reply, target_language=TARGET)
+    assert translation["success"], translation.get("error")
+    return time.perf_counter() - start, None, translation["translated_text"]
+
+
+def pipelined(client):
+    """Translate each completed sentence while the reply is still streaming"""
+    start = time.perf_counter()
+    first_translated = None
+    translator = StreamingTranslator(client, TARGET)
+    result = client.chat_completion(messages=MESSAGES, stream=True)
+    for delta in result["stream"]:
+        translator.feed(delta)
+        if first_translated is None and translator.translated_text():
+            first_translated = time.perf_counter() - start
+    translator.finish()
+    translation = translator.result()
+    assert translation["success"], translation.get("error")
+    return time.perf_counter() - start, first_translated, translation["translated_text"]
+
+
+def main():
+    with MockSarvamServer(reply=REPLY, translate_delay=0.15, translate_char_delay=0.002) as server:
+        client = SarvamClient("benchmark-key", base_url=server.base_url)
+
+        results = {}
+        for name, run in (("serial", serial), ("pipelined", pipelined)):
+            results[name] = [run(client) for _ in range(RUNS)]
+
+    print(f"reply: {len(REPLY)} chars, {len(server.tokens())} tokens")
+    print(f"{'mode':<10} {'first translated (ms)':>22} {'end-to-end p50 (ms)':>20}")
+    for name, samples in results.items():
+        total = statistics.median(s[0] for s in samples) * 1000
+        firsts = [s[1] for s in samples if s[1] is not None]
+        first = f"{statistics.median(firsts) * 1000:.1f}" if firsts else f"{total:.1f}"
+        print(f"{name:<10} {first:>22} {total:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Reaction matcher benchmark
+Compares the previous per-category substring sweeps in
+TigerMascot.determine_reaction_state (English only, and extended to every
+language's keywords) with ReactionMatcher (a whole-word sweep for ASCII
+keywords, hash lookups for Indic ones) on multi-KB replies. A sweep stops at
+the first category that fires, so replies without any keyword are its worst
+case and replies opening with a greeting its best.
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tiger_mascot import REACTION_KEYWORDS, REACTION_STATES, TigerMascot
+
+
+def legacy_determine_reaction_state(message_content, is_error=False):
+    """The previous TigerMascot.determine_reaction_state implementation"""
+    if is_error:
+        return "sad"
+    content_lower = message_content.lower()
+    greeting_words = ["hello", "hi", "hey", "greetings", "welcome", "namaste"]
+    if any(word in content_lower for word in greeting_words):
+        return "excited"
+    positive_words = ["great", "excellent", "wonderful", "amazing", "fantastic", "good", "yes", "correct"]
+    if any(word in content_lower for word in positive_words):
+        return "happy"
+    question_indicators = ["?", "what", "how", "why", "when", "where", "which"]
+    if any(indicator in content_lower for indicator in question_indicators):
+        return "thinking"
+    celebration_words = ["congratulations", "success", "achievement", "won", "victory", "celebrate"]
+    if any(word in content_lower for word in celebration_words):
+        return "celebrating"
+    return "happy"
+
+
+# Keyword-free prose (worst case for both: every pattern is scanned in full)
+NEUTRAL_EN = (
+    "The river flows past the old stone bridge as lions rest in the shade of tall trees. "
+    "Every creature in the valley depends on rain, grass, patience and the balance of the land. "
+    "A careful leader listens first, learns from mistakes and protects those who cannot protect themselves. "
+    "Morning light spreads over the plains as herds move slowly toward water near distant ridges."
+).split()
+NEUTRAL_HI = (
+    "नदी पुराने पत्थर के पुल के पास से बहती है और शेर पेड़ों की छाया में आराम करते हैं। "
+    "घाटी का हर प्राणी बारिश, घास, धैर्य और धरती के संतुलन पर निर्भर रहता है। "
+    "एक समझदार नेता पहले सुनता है, गलतियों से सीखता है और कमजोरों की रक्षा करता है।"
+).split()
+
+
+def reply(words, size, ending=""):
+    """Build a reply of roughly size characters from shuffled words, then append ending"""
+    rng = random.Random(size)
+    text = ""
+    while len(text) < size:
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(8, 16)))
+        text += sentence.capitalize() + ". " + ("\n\n" if rng.random() < 0.2 else "")
+    return text + ending
+
+
+def sweep_all_languages(message_content):
+    """The previous substring sweeps, extended to every language's keywords"""
+    content_lower = message_content.lower()
+    for category, by_language in REACTION_KEYWORDS.items():
+        if any(word in content_lower for words in by_language.values() for word in words):
+            return REACTION_STATES[category]
+    return "happy"
+
+
+def main():
+    mascot = TigerMascot()
+    cases = []
+    for size in (2_000, 8_000, 32_000):
+        cases.append((f"en {size // 1000}KB, no keyword", reply(NEUTRAL_EN, size)))
+        cases.append((f"en {size // 1000}KB, celebrate at end", reply(NEUTRAL_EN, size, "We won!")))
+        cases.append((f"hi {size // 1000}KB, no keyword", reply(NEUTRAL_HI, size)))
+        cases.append((f"hi {size // 1000}KB, greeting at end", reply(NEUTRAL_HI, size, "नमस्ते!")))
+
+    print(f"{'reply':<30} {'legacy (us)':>12} {'sweep 11 langs (us)':>20} {'matcher (us)':>13}  {'legacy':<12} {'matcher':<12}")
+    for name, text in cases:
+        number = max(20, 2_000_000 // len(text))
+        legacy = timeit.timeit(lambda: legacy_determine_reaction_state(text), number=number) / number
+        sweep = timeit.timeit(lambda: sweep_all_languages(text), number=number) / number
+        current = timeit.timeit(lambda: mascot.determine_reaction_state(text), number=number) / number
+        print(f"{name:<30} {legacy * 1e6:>12.1f} {sweep * 1e6:>20.1f} {current * 1e6:>13.1f}"
+              f"  {legacy_determine_reaction_state(text):<12} {mascot.determine_reaction_state(text):<12}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Chat request encoding benchmark
+Measures JSON encode time and bytes per chat completions request for 10- to
+200-turn histories: requests' json= encoding of the whole payload against
+ChatRequestTemplate with orjson, which reuses the encoded system prompt and
+sampling parameters, and the whole-payload standard library encoding the
+client falls back to without orjson
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sarvam_client
+from language_support import LanguageSupport
+from sarvam_client import SarvamClient, build_chat_payload
+
+TURNS = (10, 25, 50, 100, 200)
+USER = ("राजा बनने का सही अर्थ क्या है?", "How do I stay brave when I am afraid?")
+REPLY = (
+    "मेरे बच्चे, राजा का समय सूरज की तरह उगता और ढलता है। जो कुछ भी प्रकाश छूता है, वह हमारा राज्य है। "
+    "Remember who you are, and respect the circle of life."
+)
+
+
+def history(turns):
+    messages = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": USER[i % 2]})
+        messages.append({"role": "assistant", "content": REPLY})
+    return messages
+
+
+def per_call_us(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    system_message = LanguageSupport().create_system_message_for_language("hi-IN")
+    client = SarvamClient("benchmark-key")
+    encoders = [("json=", None)]
+    if sarvam_client.orjson is not None:
+        encoders.append(("template+orjson", sarvam_client.orjson))
+    encoders.append(("stdlib", None))
+
+    print(f"System prompt: {len(system_message['content'])} characters; one user+assistant pair per turn")
+    print(f"{'turns':>5} {'encoder':<16} {'encode (us)':>12} {'bytes':>8}")
+    for turns in TURNS:
+        payload = build_chat_payload([system_message] + history(turns))
+        number = max(20, 4000 // turns)
+        for name, orjson_module in encoders:
+            if name == "json=":
+                # What requests does with json=payload
+                encode = lambda: json.dumps(dict(payload, stream=True), allow_nan=False).encode("utf-8")
+            else:
+                sarvam_client.orjson = orjson_module
+                client._chat_templates.clear()
+                encode = lambda: client._encode_chat_body(payload, True)
+            size = len(encode())
+            print(f"{turns:>5} {name:<16} {per_call_us(encode, number):>12.1f} {size:>8}")
+
+
+if __name__ == "__main__":
+    main()
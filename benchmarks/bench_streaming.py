@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Streaming benchmark
+Compares time-to-first-token of blocking and streaming chat completions
+against the local mock Sarvam server
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_sarvam_server import MockSarvamServer
+from sarvam_client import SarvamClient
+
+RUNS = 10
+MESSAGES = [{"role": "user", "content": "Tell me something wise"}]
+
+
+def measure(client, stream):
+    """Return (time to first token, total time, reply) for one completion"""
+    start = time.perf_counter()
+    result = client.chat_completion(messages=MESSAGES, stream=stream)
+    assert result["success"], result.get("error")
+
+    if not stream:
+        elapsed = time.perf_counter() - start
+        return elapsed, elapsed, result["message"]
+
+    first_token = None
+    reply = ""
+    for delta in result["stream"]:
+        if first_token is None:
+            first_token = time.perf_counter() - start
+        reply += delta
+    return first_token, time.perf_counter() - start, reply
+
+
+def main():
+    with MockSarvamServer() as server:
+        client = SarvamClient("benchmark-key", base_url=server.base_url)
+
+        results = {}
+        for stream in (False, True):
+            samples = [measure(client, stream) for _ in range(RUNS)]
+            assert all(reply == server.reply for _, _, reply in samples)
+            results[stream] = samples
+
+    print(f"{'mode':<10} {'TTFT p50 (ms)':>15} {'total p50 (ms)':>15}")
+    for stream, samples in results.items():
+        ttft = statistics.median(s[0] for s in samples) * 1000
+        total = statistics.median(s[1] for s in samples) * 1000
+        print(f"{'stream' if stream else 'blocking':<10} {ttft:>15.1f} {total:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
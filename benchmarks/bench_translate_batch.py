@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Batch translation benchmark
+Compares translate_batch against looping translate_text over the same items
+against the local mock Sarvam server
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_sarvam_server import MockSarvamServer
+from sarvam_client import SarvamClient
+
+TARGETS = ["hi-IN", "bn-IN", "ta-IN", "te-IN", "mr-IN", "gu-IN", "kn-IN", "ml-IN", "pa-IN", "or-IN"]
+UI_STRINGS = [
+    "Ask Mufasa anything...",
+    "Mufasa is thinking...",
+    "Welcome! I'm Mufasa, your wise AI companion. How can I help you today?",
+    "Clear Chat History",
+    "Enter city name for weather",
+    "Please enter a city name.",
+    "Automatically translate responses to your selected language",
+    "Using default Sarvam API key. Set SARVAM_API_KEY for full functionality."
+]
+
+
+def build_items():
+    """UI strings into every target language, with every pair repeated twice"""
+    items = [(text, target) for target in TARGETS for text in UI_STRINGS]
+    return items + items
+
+
+def run(server, label, translate):
+    server.request_counts.clear()
+    client = SarvamClient("benchmark-key", base_url=server.base_url)
+    items = build_items()
+
+    start = time.perf_counter()
+    results = translate(client, items)
+    elapsed = time.perf_counter() - start
+
+    assert all(result["success"] for result in results)
+    assert all(result["translated_text"] == f"[{target}] {text}" for result, (text, target) in zip(results, items))
+    print(f"{label:<22} {len(items):>6} {server.request_counts.get('translate', 0):>9} {elapsed * 1000:>10.1f}")
+
+
+def main():
+    with MockSarvamServer(translate_delay=0.05) as server:
+        print(f"{'method':<22} {'items':>6} {'requests':>9} {'time (ms)':>10}")
+        run(server, "loop translate_text", lambda client, items: [
+            client.translate_text(text, target_language=target) for text, target in items
+        ])
+        run(server, "translate_batch", lambda client, items: client.translate_batch(items))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Multi-process serving benchmark
+Measures full app.py script-run throughput through the sticky-session load
+balancer with 1, 2 and 4 Streamlit workers. Headless clients speak
+Streamlit's WebSocket protocol directly and rerun a session that has a
+40-message conversation, as a browser does on every interaction.
+
+Requires the websockets package (installed with uvicorn[standard]).
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import socket
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from chat_history import new_message
+from conversation_store import SQLiteConversationStore
+from load_balancer import STICKY_COOKIE, Backend, LoadBalancer, wait_until_healthy
+from mock_sarvam_server import MockSarvamServer
+from run import start_worker, stop_workers
+
+try:
+    from websockets.asyncio.client import connect
+except ImportError:
+    connect = None
+
+REPLY = (
+    "Everything the light touches is our kingdom. A king's time as ruler rises and falls like the sun.\n\n"
+    "- Remember who you are\n- Respect the circle of life\n- Look to the stars"
+)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def seed_conversations(state_dir, clients, messages=40):
+    """One stored conversation per client, so every rerun renders real history"""
+    store = SQLiteConversationStore(os.path.join(state_dir, "conversations.db"))
+    session_ids = []
+    for _ in range(clients):
+        session_id = uuid.uuid4().hex
+        for i in range(messages):
+            store.append(session_id, new_message("user", f"Question {i // 2}?") if i % 2 == 0 else new_message("assistant", REPLY))
+        session_ids.append(session_id)
+    store.close()
+    return session_ids
+
+
+async def sticky_cookie(port):
+    """Load the page once through the balancer and return the worker cookie it sets"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET / HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    for line in response.split(b"\r\n\r\n", 1)[0].split(b"\r\n"):
+        if line.lower().startswith(b"set-cookie: " + STICKY_COOKIE.encode()):
+            return line.split(b": ", 1)[1].split(b";")[0].decode()
+    raise RuntimeError("Load balancer did not set the sticky cookie")
+
+
+def rerun_message(session_id):
+    message = BackMsg()
+    message.rerun_script.query_string = f"session={session_id}"
+    return message.SerializeToString()
+
+
+async def wait_script_finished(websocket):
+    while True:
+        message = ForwardMsg()
+        message.ParseFromString(await websocket.recv())
+        if message.WhichOneof("type") == "script_finished":
+            return
+
+
+async def client(port, session_id, deadline, latencies):
+    cookie = await sticky_cookie(port)
+    async with connect(
+        f"ws://127.0.0.1:{port}/_stcore/stream",
+        subprotocols=["streamlit"],
+        additional_headers={"Cookie": cookie},
+        max_size=None
+    ) as websocket:
+        # First run creates the session and loads its conversation
+        await websocket.send(rerun_message(session_id))
+        await wait_script_finished(websocket)
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            await websocket.send(rerun_message(session_id))
+            await wait_script_finished(websocket)
+            latencies.append(time.perf_counter() - start)
+
+
+async def measure(workers, clients, duration, work_dir, state_dir, session_ids):
+    ports = [free_port() for _ in range(workers)]
+    processes = [start_worker(port, state_dir, cwd=work_dir, quiet=True) for port in ports]
+    balancer = LoadBalancer([Backend("127.0.0.1", port) for port in ports], host="127.0.0.1", port=0)
+    try:
+        if not await wait_until_healthy(balancer, timeout=120):
+            raise RuntimeError("Workers did not start")
+        await balancer.start()
+        latencies = []
+        # Warm every worker (imports, cached resources) before timing
+        await asyncio.gather(*(client(balancer.port, session_ids[i], time.monotonic(), []) for i in range(clients)))
+        start = time.monotonic()
+        await asyncio.gather(*(client(balancer.port, session_ids[i], start + duration, latencies) for i in range(clients)))
+        elapsed = time.monotonic() - start
+        spread = [backend["requests"] for backend in balancer.get_stats()["backends"]]
+        return len(latencies) / elapsed, latencies, spread
+    finally:
+        await balancer.stop()
+        stop_workers(processes)
+
+
+async def main_async(args):
+    work_dir = tempfile.mkdtemp(prefix="mufasa-bench-")
+    state_dir = os.path.join(work_dir, "state")
+    os.makedirs(os.path.join(work_dir, ".streamlit"))
+    os.makedirs(state_dir)
+    with MockSarvamServer() as server:
+        with open(os.path.join(work_dir, ".streamlit", "secrets.toml"), "w") as secrets:
+            secrets.write(f'SARVAM_API_KEY = "benchmark-key"\nSARVAM_BASE_URL = "{server.base_url}"\n')
+        session_ids = seed_conversations(state_dir, args.clients)
+        print(f"{os.cpu_count()} CPU(s), {args.clients} clients, {args.duration:.0f}s per run")
+        print(f"{'workers':>7} {'reruns/s':>9} {'p50 (ms)':>9} {'p95 (ms)':>9}  requests per worker")
+        try:
+            for workers in args.workers:
+                throughput, latencies, spread = await measure(
+                    workers, args.clients, args.duration, work_dir, state_dir, session_ids
+                )
+                cuts = statistics.quantiles(latencies, n=20) if len(latencies) > 1 else [0.0] * 19
+                print(f"{workers:>7} {throughput:>9.1f} {statistics.median(latencies) * 1000:>9.1f} "
+                      f"{cuts[18] * 1000:>9.1f}  {spread}")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark run.py --workers scaling")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=8, help="concurrent browser sessions")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds measured per worker count")
+    args = parser.parse_args()
+    if connect is None:
+        sys.exit("This benchmark needs the websockets package: pip install websockets")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
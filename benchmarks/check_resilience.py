@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Resilience checks
+Drives SarvamClient's circuit breaker and rate limiter against the mock
+Sarvam server and exits non-zero if a scenario misbehaves:
+
+- a half-open probe that the rate limiter turns away does not lock the
+  breaker half-open; the next allowed call probes and closes it
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_sarvam_server import MockSarvamServer
+from resilience import CircuitBreaker, RetryPolicy, TokenBucket
+from sarvam_client import RATE_LIMIT_ERROR, SarvamClient
+
+
+def check_probe_not_lost_to_rate_limiter():
+    with MockSarvamServer(translate_delay=0.0, error_rate=1.0) as server:
+        client = SarvamClient(
+            "check-key",
+            base_url=server.base_url,
+            retry_policy=RetryPolicy(max_retries=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+        )
+        assert not client.translate_text("Hello", target_language="hi-IN")["success"]
+        assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+        # Reset timeout passes while the limiter is starved: the probe is refused locally
+        time.sleep(0.15)
+        client.rate_limiter = TokenBucket(rate=0.001, capacity=1)
+        client.rate_limiter.acquire()
+        result = client.translate_text("Hello", target_language="hi-IN")
+        assert RATE_LIMIT_ERROR in result["error"], result
+
+        # The upstream recovers and the limiter refills: the next call must get through
+        server.error_rate = 0.0
+        client.rate_limiter = None
+        result = client.translate_text("Hello", target_language="hi-IN")
+        assert result["success"], result
+        assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+        client.close()
+
+
+def main():
+    checks = [check_probe_not_lost_to_rate_limiter]
+    for check in checks:
+        check()
+        print(f"ok  {check.__name__}")
+
+
+if __name__ == "__main__":
+    main()
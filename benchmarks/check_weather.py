@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Weather service checks
+Drives WeatherService against the mock WeatherAPI server and exits non-zero
+if a scenario misbehaves:
+
+- a fresh report is served from the cache without a request
+- a report past its TTL is served stale while one background refresh runs,
+  and one past the stale TTL is fetched again
+- concurrent lookups for one city share a single request
+- API errors are returned and not cached, and a failing shared cache write
+  does not leave the city in flight (later lookups would wait and time out)
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_weather_server import MockWeatherServer
+from shared_cache import SharedCache
+from weather import WeatherService
+
+
+class FailingSharedCache(SharedCache):
+    """Shared cache whose writes fail like a locked SQLite file"""
+
+    def set(self, key, value, stored_at=None):
+        raise sqlite3.OperationalError("database is locked")
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def check_cache_hit():
+    with MockWeatherServer() as server:
+        service = WeatherService("check-key", base_url=server.base_url)
+        first = service.get_weather("Delhi")
+        assert "Weather in Delhi" in first, first
+        assert service.get_weather("  delhi! ") == first
+        assert server.request_counts == {"Delhi": 1}, server.request_counts
+        assert service.get_stats()["hits"] == 1
+
+
+def check_ttl_expiry():
+    with MockWeatherServer() as server:
+        service = WeatherService("check-key", base_url=server.base_url, ttl_seconds=0.2, stale_ttl_seconds=0.6)
+        service.get_weather("Pune")
+        time.sleep(0.3)
+        # Stale: answered at once, refreshed in the background
+        assert "Weather in Pune" in service.get_weather("Pune")
+        wait_for(lambda: server.request_counts.get("Pune") == 2 and not service._in_flight)
+        assert service.get_stats()["stale_hits"] == 1
+        time.sleep(0.7)
+        # Past the stale TTL: fetched again before answering
+        service.get_weather("Pune")
+        assert server.request_counts["Pune"] == 3, server.request_counts
+        assert service.get_stats()["misses"] == 2
+
+
+def check_coalescing():
+    with MockWeatherServer(delay=0.3) as server:
+        service = WeatherService("check-key", base_url=server.base_url)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            reports = list(executor.map(service.get_weather, ["Chennai"] * 8))
+        assert len(set(reports)) == 1 and "Weather in Chennai" in reports[0], reports
+        assert server.request_counts == {"Chennai": 1}, server.request_counts
+        stats = service.get_stats()
+        assert stats["misses"] == 1 and stats["coalesced"] == 7, stats
+
+
+def check_errors():
+    with MockWeatherServer() as server:
+        service = WeatherService("check-key", base_url=server.base_url)
+        report = service.get_weather("Atlantis")
+        assert report.startswith("❌") and "No matching location" in report, report
+        service.get_weather("Atlantis")
+        assert server.request_counts["Atlantis"] == 2, "errors must not be cached"
+
+        server.status = 500
+        assert service.get_weather("Kolkata").startswith("❌")
+        assert service.get_stats()["errors"] == 3
+        assert not service._in_flight
+
+
+def check_shared_cache_failure():
+    # The failed writes are logged as warnings; expected here
+    logging.getLogger("weather").setLevel(logging.ERROR)
+    with MockWeatherServer() as server, tempfile.TemporaryDirectory() as state_dir:
+        shared_cache = FailingSharedCache(os.path.join(state_dir, "shared.db"), "weather")
+        service = WeatherService(
+            "check-key", base_url=server.base_url, ttl_seconds=0.0, stale_ttl_seconds=0.0,
+            timeout=(1.0, 1.0), shared_cache=shared_cache
+        )
+        assert "Weather in Mumbai" in service.get_weather("Mumbai")
+        assert not service._in_flight, "a failed shared cache write left the city in flight"
+        started = time.monotonic()
+        assert "Weather in Mumbai" in service.get_weather("Mumbai")
+        assert time.monotonic() - started < 1.0, "the second lookup waited on a stranded request"
+
+
+def main():
+    checks = [check_cache_hit, check_ttl_expiry, check_coalescing, check_errors, check_shared_cache_failure]
+    for check in checks:
+        check()
+        print(f"ok  {check.__name__}")
+
+
+if __name__ == "__main__":
+    main()
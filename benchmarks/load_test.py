@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Headless load test
+Drives SarvamClient, or the whole app through Streamlit's AppTest, at a
+configurable concurrency against the local mock Sarvam server (or any
+base URL) and reports latency percentiles and throughput
+
+Examples:
+    python benchmarks/load_test.py --mode client --concurrency 16 --requests 400
+    python benchmarks/load_test.py --mode client --error-rate 0.05 --burst-interval 5 --burst-duration 0.5
+    python benchmarks/load_test.py --mode client --tail-probability 0.02 --tail-delay 1 --hedge-percentile 0.97
+    python benchmarks/load_test.py --mode app --concurrency 4 --requests 20
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mock_sarvam_server import add_server_arguments, server_from_arguments
+from resilience import HedgePolicy
+from sarvam_client import SarvamClient
+
+PROMPTS = [
+    "Tell me something wise",
+    "What does it mean to be a good king?",
+    "How do I stay brave when I am afraid?",
+    "Tell me about the circle of life."
+]
+DETECT_TEXTS = [
+    "Hello, how are you today?",
+    "नमस्ते, आप कैसे हैं?",
+    "kya haal hai bhai, sab theek?",
+    "வணக்கம், எப்படி இருக்கிறீர்கள்?"
+]
+TRANSLATE_TEXT = "Everything the light touches is our kingdom. Remember who you are."
+
+
+class Recorder:
+    """Thread-safe latency and outcome log per operation"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+
+    def add(self, op: str, seconds: float, success: bool, error: str = ""):
+        with self._lock:
+            self.latencies.setdefault(op, []).append(seconds)
+            if not success:
+                errors = self.errors.setdefault(op, {})
+                key = error.split(":")[0][:60] or "error"
+                errors[key] = errors.get(key, 0) + 1
+
+
+def percentiles(values):
+    """p50/p95/p99 of a list of latencies in seconds"""
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return value, value, value
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return cuts[49], cuts[94], cuts[98]
+
+
+def run_client_op(client, op: str, rng: random.Random, stream: bool):
+    """Run one client operation; returns (success, error)"""
+    if op == "chat":
+        messages = [{"role": "user", "content": rng.choice(PROMPTS)}]
+        result = client.chat_completion(messages=messages, stream=stream)
+        if result["success"] and stream:
+            # Latency covers the whole streamed reply, not just the headers
+            for _ in result["stream"]:
+                pass
+    elif op == "translate":
+        result = client.translate_text(TRANSLATE_TEXT, source_language="en-IN", target_language="hi-IN")
+    else:
+        result = client.detect_language(rng.choice(DETECT_TEXTS), local_confidence=None)
+    return result["success"], result.get("error", "")
+
+
+def client_load(args, base_url: str, recorder: Recorder):
+    """Share one SarvamClient between worker threads, like the app's cached client"""
+    hedge_policy = HedgePolicy(args.hedge_percentile, args.hedge_budget) if args.hedge_percentile else None
+    client = SarvamClient(
+        "load-test-key", base_url=base_url, hedge_policy=hedge_policy, compress_requests=args.compress_requests
+    )
+    ops = [op for op, weight in (("chat", args.chat), ("translate", args.translate), ("detect", args.detect))
+           for _ in range(weight)]
+    deadline = time.monotonic() + args.duration if args.duration else None
+    remaining = [args.requests]
+    remaining_lock = threading.Lock()
+
+    def take():
+        if deadline is not None:
+            return time.monotonic() < deadline
+        with remaining_lock:
+            if remaining[0] <= 0:
+                return False
+            remaining[0] -= 1
+            return True
+
+    def worker(index):
+        rng = random.Random((args.seed or 0) + index)
+        while take():
+            op = rng.choice(ops)
+            start = time.perf_counter()
+            try:
+                success, error = run_client_op(client, op, rng, not args.no_stream)
+            except Exception as e:
+                success, error = False, f"Unexpected error: {e}"
+            recorder.add(op, time.perf_counter() - start, success, error)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(worker, range(args.concurrency)))
+    return client.get_resilience_stats()
+
+
+def app_load(args, base_url: str, recorder: Recorder):
+    """
+    Run concurrent AppTest sessions that each send prompts through main()
+
+    AppTest swaps process-wide state (secrets, config) while a script runs,
+    so script runs are serialized. The chat jobs they start still overlap on
+    the shared worker pool, which is where a request spends its time.
+    Conversations go to a temporary store that is removed after the run.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    store_dir = tempfile.TemporaryDirectory(prefix="mufasa-load-test-")
+    store_path = os.path.join(store_dir.name, "conversations.db")
+
+    run_lock = threading.Lock()
+
+    def run(at, widget=None):
+        with run_lock:
+            (widget or at).run()
+
+    deadline = time.monotonic() + args.duration if args.duration else None
+    remaining = [args.requests]
+    remaining_lock = threading.Lock()
+
+    def take():
+        if deadline is not None:
+            return time.monotonic() < deadline
+        with remaining_lock:
+            if remaining[0] <= 0:
+                return False
+            remaining[0] -= 1
+            return True
+
+    def session(index):
+        rng = random.Random((args.seed or 0) + index)
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=args.timeout)
+        at.secrets["SARVAM_API_KEY"] = "load-test-key"
+        at.secrets["SARVAM_BASE_URL"] = base_url
+        at.secrets["CONVERSATION_STORE_PATH"] = store_path
+        run(at)
+        while take():
+            start = time.perf_counter()
+            run(at, at.chat_input[0].set_value(rng.choice(PROMPTS)))
+            # The reply streams on a worker thread; rerun like the polling fragment does
+            while at.session_state.chat_job is not None and time.perf_counter() - start < args.timeout:
+                time.sleep(args.poll_interval)
+                run(at)
+            error = at.session_state.chat_error or ""
+            if at.exception:
+                error = f"Script error: {at.exception[0].message}"
+            elif at.session_state.chat_job is not None:
+                error = "Timed out"
+            recorder.add("app_chat", time.perf_counter() - start, not error, error)
+
+    with store_dir, ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(session, range(args.concurrency)))
+    return None
+
+
+def report(recorder: Recorder, elapsed: float, server, resilience):
+    print(f"{'operation':<12} {'count':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8}")
+    total = 0
+    for op, values in sorted(recorder.latencies.items()):
+        p50, p95, p99 = percentiles(values)
+        errors = sum(recorder.errors.get(op, {}).values())
+        total += len(values)
+        print(f"{op:<12} {len(values):>6} {errors:>6} {p50 * 1000:>8.1f} {p95 * 1000:>8.1f} "
+              f"{p99 * 1000:>8.1f} {len(values) / elapsed:>8.1f}")
+    print(f"\n{total} requests in {elapsed:.2f}s: {total / elapsed:.1f} req/s")
+
+    for op, errors in sorted(recorder.errors.items()):
+        for message, count in sorted(errors.items(), key=lambda item: -item[1]):
+            print(f"  {op} error x{count}: {message}")
+    if server is not None:
+        print(f"Mock requests: {server.request_counts}")
+        print(f"Mock statuses: {server.status_counts}")
+        if server.closed_streams:
+            print(f"Mock streams closed by the client: {server.closed_streams}")
+    if resilience:
+        print(f"Client resilience: {resilience}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test Mufasa AI against a mock Sarvam server")
+    parser.add_argument("--mode", choices=("client", "app"), default="client",
+                        help="drive SarvamClient directly or the whole app via AppTest")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent workers or app sessions")
+    parser.add_argument("--requests", type=int, default=200, help="total requests (ignored with --duration)")
+    parser.add_argument("--duration", type=float, default=0.0, help="run for this many seconds instead")
+    parser.add_argument("--chat", type=int, default=3, help="weight of chat completions in client mode")
+    parser.add_argument("--translate", type=int, default=1, help="weight of translate requests in client mode")
+    parser.add_argument("--detect", type=int, default=1, help="weight of detect-language requests in client mode")
+    parser.add_argument("--no-stream", action="store_true", help="use blocking chat completions in client mode")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds before an app request times out")
+    parser.add_argument("--poll-interval", type=float, default=0.1, help="seconds between app reruns")
+    parser.add_argument("--base-url", default=None, help="target an already running server instead of the mock")
+    parser.add_argument("--hedge-percentile", type=float, default=None,
+                        help="hedge chat completions slower than this latency percentile (e.g. 0.97)")
+    parser.add_argument("--hedge-budget", type=float, default=0.05, help="backup requests allowed per request")
+    parser.add_argument("--compress-requests", action="store_true", help="gzip request bodies in client mode")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = server_from_arguments(args)
+        base_url = server.start()
+
+    recorder = Recorder()
+    print(f"{args.mode} load: concurrency {args.concurrency} against {base_url}")
+    start = time.perf_counter()
+    try:
+        if args.mode == "client":
+            resilience = client_load(args, base_url, recorder)
+        else:
+            resilience = app_load(args, base_url, recorder)
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.stop()
+    report(recorder, elapsed, server, resilience)
+
+
+if __name__ == "__main__":
+    main()
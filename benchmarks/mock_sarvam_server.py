@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Local mock of the Sarvam AI API
+Lets the client, the app and benchmarks run offline against a fake
+api.sarvam.ai with configurable latency distributions, error rates, 429
+bursts, response compression and link bandwidth
+
+Run standalone and point the app at it:
+    python benchmarks/mock_sarvam_server.py --port 8765
+    SARVAM_BASE_URL=http://127.0.0.1:8765/v1 streamlit run app.py
+"""
+
+import argparse
+import gzip
+import json
+import math
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from language_support import detect_script
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_REPLY = (
+    "Greetings, friend! I am Mufasa. Everything the light touches is our kingdom. "
+    "A king's time as ruler rises and falls like the sun. "
+    "Remember who you are, and I will always be here to help you."
+)
+
+ENDPOINTS = ("chat/completions", "translate", "detect-language")
+
+# JSON responses smaller than this are sent uncompressed even with compress_responses
+RESPONSE_COMPRESSION_MIN_BYTES = 256
+
+
+class Latency:
+    """Random extra delay: log-normal around a median plus an occasional slow tail"""
+
+    def __init__(
+        self,
+        median: float = 0.0,
+        sigma: float = 0.0,
+        tail_probability: float = 0.0,
+        tail_delay: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Configure the distribution
+
+        Args:
+            median: Median delay in seconds
+            sigma: Log-normal shape; 0 makes every delay equal to the median
+            tail_probability: Share of requests that also get tail_delay
+            tail_delay: Extra seconds for tail requests
+            seed: Seed for reproducible runs
+        """
+        self.median = median
+        self.sigma = sigma
+        self.tail_probability = tail_probability
+        self.tail_delay = tail_delay
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        """Draw one delay in seconds"""
+        with self._lock:
+            delay = self.median * math.exp(self.sigma * self._random.gauss(0, 1)) if self.median else 0.0
+            if self.tail_probability and self._random.random() < self.tail_probability:
+                delay += self.tail_delay
+            return delay
+
+
+class _MockSarvamHandler(BaseHTTPRequestHandler):
+    """Request handler implementing the subset of the Sarvam API the app uses"""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def mock(self):
+        return self.server.mock
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.mock.throttle(self.mock.upload_bandwidth, length)
+        body = self.rfile.read(length)
+        self.mock.record_bytes("received", len(body))
+        return body
+
+    def _response_encoding(self, size):
+        """Content-Encoding for a JSON response: br or gzip if the client offers it, else None"""
+        if not self.mock.compress_responses or size < RESPONSE_COMPRESSION_MIN_BYTES:
+            return None
+        offered = {part.split(";")[0].strip().lower() for part in self.headers.get("Accept-Encoding", "").split(",")}
+        if brotli is not None and "br" in offered:
+            return "br"
+        return "gzip" if "gzip" in offered else None
+
+    def _send_json(self, status, data, headers=None):
+        # UTF-8 like the real API, not \u escapes, so Indic response sizes are realistic
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        encoding = self._response_encoding(len(body))
+        if encoding is not None:
+            body = brotli.compress(body) if encoding == "br" else gzip.compress(body, mtime=0)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.mock.throttle(self.mock.download_bandwidth, len(body))
+        self.wfile.write(body)
+        self.mock.record_bytes("sent", len(body))
+        self.mock.record_status(status)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        body = self._read_body()
+        encoding = self.headers.get("Content-Encoding", "identity").strip().lower()
+        if encoding != "identity" and (encoding != "gzip" or not self.mock.accept_compressed_requests):
+            # RFC 7694: tell the client which request encodings are accepted
+            self._send_json(415, {"error": {"message": f"Unsupported Content-Encoding: {encoding}"}},
+                            {"Accept-Encoding": "identity"})
+            return
+        payload = json.loads((gzip.decompress(body) if encoding == "gzip" else body) or b"{}")
+        endpoint = next((name for name in ENDPOINTS if self.path.endswith("/" + name)), None)
+        if endpoint is None:
+            self._send_json(404, {"error": {"message": f"Unknown endpoint {self.path}"}})
+            return
+
+        self.mock.record(endpoint)
+        latency = self.mock.latency.get(endpoint)
+        if latency is not None:
+            time.sleep(latency.sample())
+        if self._injected_failure():
+            return
+
+        if endpoint == "chat/completions":
+            self._chat_completion(payload)
+        elif endpoint == "translate":
+            self._translate(payload)
+        else:
+            self._detect_language(payload)
+
+    def _injected_failure(self):
+        """Answer with a 429 burst or a random server error when one is configured"""
+        retry_after = self.mock.in_rate_limit_burst()
+        if retry_after is not None:
+            self._send_json(429, {"error": {"message": "Rate limit exceeded"}}, {"Retry-After": str(retry_after)})
+            return True
+        if self.mock.error_rate and self.mock.random() < self.mock.error_rate:
+            self._send_json(self.mock.error_status, {"error": {"message": "Injected server error"}})
+            return True
+        return False
+
+    def _chat_completion(self, payload):
+        tokens = self.mock.tokens()
+        time.sleep(self.mock.first_token_delay)
+
+        if not payload.get("stream"):
+            time.sleep(self.mock.token_delay * len(tokens))
+            self._send_json(200, {
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": "".join(tokens)}}],
+                "usage": {"completion_tokens": len(tokens)}
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self.mock.record_status(200)
+        try:
+            for index, token in enumerate(tokens):
+                if index:
+                    time.sleep(self.mock.token_delay)
+                event = {"choices": [{"index": 0, "delta": {"content": token}}]}
+                self._write_chunk(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self._write_chunk(b"data: [DONE]\n\n")
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading (e.g. a cancelled hedged request): stop generating
+            self.mock.record_closed_stream()
+            self.close_connection = True
+
+    def _translate(self, payload):
+        text = payload.get("input", "")
+        if len(text) > self.mock.translate_input_limit:
+            self._send_json(400, {"error": {"message": "Input too long"}})
+            return
+
+        time.sleep(self.mock.translate_delay + self.mock.translate_char_delay * len(text))
+        # Fake translation: tag every line with the target language, keeping line breaks
+        target = payload.get("target_language_code", "")
+        translated = "\n".join(f"[{target}] {line}" if line else line for line in text.split("\n"))
+        self._send_json(200, {"translated_text": translated, "request_id": "mock"})
+
+    def _detect_language(self, payload):
+        time.sleep(self.mock.detect_delay)
+        detected = detect_script(payload.get("input", ""))
+        self._send_json(200, {
+            "detected_language": detected["language_code"],
+            "confidence": detected["confidence"],
+            "request_id": "mock"
+        })
+
+
+class MockSarvamServer:
+    """Threaded local HTTP server that imitates the Sarvam AI endpoints"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        reply: str = DEFAULT_REPLY,
+        first_token_delay: float = 0.2,
+        token_delay: float = 0.02,
+        translate_delay: float = 0.05,
+        translate_char_delay: float = 0.0,
+        translate_input_limit: int = 1000,
+        detect_delay: float = 0.02,
+        latency: Optional[Dict[str, Latency]] = None,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        burst_interval: float = 0.0,
+        burst_duration: float = 0.0,
+        burst_retry_after: int = 1,
+        compress_responses: bool = False,
+        accept_compressed_requests: bool = True,
+        upload_bandwidth: float = 0.0,
+        download_bandwidth: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Configure the mock server
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            reply: Assistant reply returned by chat completions
+            first_token_delay: Seconds before the first token is produced
+            token_delay: Seconds between consecutive tokens
+            translate_delay: Seconds taken by each translate request
+            translate_char_delay: Extra seconds per input character, so long
+                inputs take longer than short ones
+            translate_input_limit: Longest translate input accepted
+            detect_delay: Seconds taken by each detect-language request
+            latency: Extra random delay per endpoint ("chat/completions",
+                "translate", "detect-language"), drawn before answering
+            error_rate: Share of requests answered with error_status
+            error_status: Status used for injected errors
+            burst_interval: Every this many seconds a 429 burst starts (0: never)
+            burst_duration: Seconds each 429 burst lasts
+            burst_retry_after: Retry-After header sent with burst 429s
+            compress_responses: Send JSON responses gzip or brotli encoded
+                when the client's Accept-Encoding offers it (streamed replies
+                stay uncompressed)
+            accept_compressed_requests: Decode gzip request bodies; when
+                False they are answered with 415, like an API without support
+            upload_bandwidth: Bytes per second at which request bodies
+                arrive, to imitate a constrained client uplink (0: unlimited)
+            download_bandwidth: Bytes per second at which JSON responses are
+                sent (0: unlimited)
+            seed: Seed for the error draws
+        """
+        self.reply = reply
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.translate_delay = translate_delay
+        self.translate_char_delay = translate_char_delay
+        self.translate_input_limit = translate_input_limit
+        self.detect_delay = detect_delay
+        self.latency = dict(latency or {})
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.burst_interval = burst_interval
+        self.burst_duration = burst_duration
+        self.burst_retry_after = burst_retry_after
+        self.compress_responses = compress_responses
+        self.accept_compressed_requests = accept_compressed_requests
+        self.upload_bandwidth = upload_bandwidth
+        self.download_bandwidth = download_bandwidth
+        self.request_counts = {}
+        self.status_counts = {}
+        # Streamed replies the client hung up on before the end
+        self.closed_streams = 0
+        # Body bytes as they crossed the wire, JSON responses only for "sent"
+        self.wire_bytes = {"received": 0, "sent": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._server = ThreadingHTTPServer((host, port), _MockSarvamHandler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to SarvamClient(base_url=...)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def record(self, endpoint: str):
+        """Count one request served by an endpoint"""
+        with self._lock:
+            self.request_counts[endpoint] = self.request_counts.get(endpoint, 0) + 1
+
+    def record_closed_stream(self):
+        """Count one streamed reply abandoned by the client"""
+        with self._lock:
+            self.closed_streams += 1
+
+    def record_bytes(self, direction: str, size: int):
+        """Count body bytes "received" or "sent" on the wire"""
+        with self._lock:
+            self.wire_bytes[direction] += size
+
+    @staticmethod
+    def throttle(bandwidth: float, size: int):
+        """Wait as long as size bytes take at bandwidth bytes per second"""
+        if bandwidth and size:
+            time.sleep(size / bandwidth)
+
+    def record_status(self, status: int):
+        """Count one response status"""
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def random(self) -> float:
+        """Thread-safe uniform draw for error injection"""
+        with self._lock:
+            return self._random.random()
+
+    def in_rate_limit_burst(self) -> Optional[int]:
+        """Retry-After value while a 429 burst is active, otherwise None"""
+        if not self.burst_interval or not self.burst_duration:
+            return None
+        elapsed = (time.monotonic() - self._started_at) % self.burst_interval
+        # Bursts sit at the end of each interval, so a run starts healthy
+        if elapsed >= self.burst_interval - self.burst_duration:
+            return self.burst_retry_after
+        return None
+
+    def tokens(self):
+        """Split the configured reply into word-sized stream tokens"""
+        words = self.reply.split(" ")
+        return [word if i == 0 else " " + word for i, word in enumerate(words)]
+
+    def start(self) -> str:
+        """Start serving in a background thread and return the base URL"""
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stop serving and release the port"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    """Add the mock server options shared by this script and the load generator"""
+    group = parser.add_argument_group("mock server")
+    group.add_argument("--first-token-delay", type=float, default=0.2, help="seconds before the first chat token")
+    group.add_argument("--token-delay", type=float, default=0.02, help="seconds between chat tokens")
+    group.add_argument("--translate-delay", type=float, default=0.05, help="seconds per translate request")
+    group.add_argument("--detect-delay", type=float, default=0.02, help="seconds per detect-language request")
+    group.add_argument("--latency-median", type=float, default=0.0, help="median extra latency for every endpoint")
+    group.add_argument("--latency-sigma", type=float, default=0.0, help="log-normal spread of the extra latency")
+    group.add_argument("--tail-probability", type=float, default=0.0, help="share of requests given the tail delay")
+    group.add_argument("--tail-delay", type=float, default=0.0, help="extra seconds for tail requests")
+    group.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with --error-status")
+    group.add_argument("--error-status", type=int, default=500, help="status for injected errors")
+    group.add_argument("--burst-interval", type=float, default=0.0, help="seconds between 429 bursts (0: none)")
+    group.add_argument("--burst-duration", type=float, default=0.0, help="seconds each 429 burst lasts")
+    group.add_argument("--burst-retry-after", type=int, default=1, help="Retry-After sent during bursts")
+    group.add_argument("--compress-responses", action="store_true", help="gzip/brotli JSON responses when offered")
+    group.add_argument("--reject-compressed-requests", action="store_true",
+                       help="answer gzip request bodies with 415")
+    group.add_argument("--upload-bandwidth", type=float, default=0.0, help="request body bytes/s (0: unlimited)")
+    group.add_argument("--download-bandwidth", type=float, default=0.0, help="response body bytes/s (0: unlimited)")
+    group.add_argument("--seed", type=int, default=None, help="seed for latency and error draws")
+
+
+def server_from_arguments(args: argparse.Namespace, host: str = "127.0.0.1", port: int = 0) -> MockSarvamServer:
+    """Build a MockSarvamServer from parsed add_server_arguments options"""
+    latency = {}
+    if args.latency_median or args.tail_probability:
+        latency = {
+            endpoint: Latency(args.latency_median, args.latency_sigma, args.tail_probability, args.tail_delay, args.seed)
+            for endpoint in ENDPOINTS
+        }
+    return MockSarvamServer(
+        host=host,
+        port=port,
+        first_token_delay=args.first_token_delay,
+        token_delay=args.token_delay,
+        translate_delay=args.translate_delay,
+        detect_delay=args.detect_delay,
+        latency=latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        burst_interval=args.burst_interval,
+        burst_duration=args.burst_duration,
+        burst_retry_after=args.burst_retry_after,
+        compress_responses=args.compress_responses,
+        accept_compressed_requests=not args.reject_compressed_requests,
+        upload_bandwidth=args.upload_bandwidth,
+        download_bandwidth=args.download_bandwidth,
+        seed=args.seed
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the mock Sarvam AI server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = server_from_arguments(args, args.host, args.port)
+    print(f"Mock Sarvam API listening on {server.base_url} (Ctrl+C to stop)")
+    print(f"Run the app against it with: SARVAM_BASE_URL={server.base_url} streamlit run app.py")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
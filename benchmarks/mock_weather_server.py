@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Local mock of WeatherAPI's current.json
+Lets WeatherService and its checks run offline with a configurable delay
+and per-city request counts
+
+Run standalone:
+    python benchmarks/mock_weather_server.py --port 8766
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Cities the mock answers with WeatherAPI's "No matching location found" error
+UNKNOWN_CITIES = frozenset(("atlantis", "nowhere"))
+
+
+def current_weather(city: str) -> dict:
+    """A current.json body for any city"""
+    return {
+        "location": {"name": city.title(), "region": "Mock Region", "country": "India"},
+        "current": {
+            "temp_c": 31.0,
+            "feelslike_c": 35.2,
+            "condition": {"text": "Sunny"},
+            "humidity": 48,
+            "wind_kph": 11.2
+        }
+    }
+
+
+class _MockWeatherHandler(BaseHTTPRequestHandler):
+    """Serves /v1/current.json"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if not url.path.endswith("/current.json"):
+            self._send_json(404, {"error": {"code": 404, "message": "Not found"}})
+            return
+        city = parse_qs(url.query).get("q", [""])[0]
+        mock = self.server.mock
+        mock.record(city)
+        time.sleep(mock.delay)
+        if mock.status != 200:
+            self._send_json(mock.status, {"error": {"code": 9999, "message": "Internal application error."}})
+        elif city.strip().casefold() in UNKNOWN_CITIES:
+            self._send_json(400, {"error": {"code": 1006, "message": "No matching location found."}})
+        else:
+            self._send_json(200, current_weather(city))
+
+
+class MockWeatherServer:
+    """Threaded local HTTP server that imitates WeatherAPI"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, delay: float = 0.0, status: int = 200):
+        """
+        Configure the mock server
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            delay: Seconds taken by each request
+            status: Status of every answer; anything but 200 is an API error
+        """
+        self.delay = delay
+        self.status = status
+        self.request_counts = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _MockWeatherHandler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to WeatherService(base_url=...)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def record(self, city: str):
+        """Count one request for a city"""
+        with self._lock:
+            self.request_counts[city] = self.request_counts.get(city, 0) + 1
+
+    def start(self) -> str:
+        """Start serving in a background thread and return the base URL"""
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def stop(self):
+        """Stop serving and release the port"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the mock WeatherAPI server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds per request")
+    args = parser.parse_args()
+
+    server = MockWeatherServer(args.host, args.port, delay=args.delay)
+    print(f"Mock WeatherAPI listening on {server.base_url} (Ctrl+C to stop)")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Chat history rendering
+Shows the most recent messages as chat bubbles and collapses older ones
+into page-sized markdown blocks behind a "load more" control, so each
+rerun renders a bounded number of elements however long the chat gets.
+Older pages are read from the conversation store only once revealed.
+"""
+
+import uuid
+from typing import Dict, List
+
+import streamlit as st
+
+# Messages shown as chat bubbles (10 turns); older ones are paged in this size
+HISTORY_PAGE_SIZE = 20
+
+ROLE_LABELS = {
+    "user": "🧑 **You**",
+    "assistant": "🦁 **Mufasa**"
+}
+
+
+def new_message(role: str, content: str) -> Dict[str, str]:
+    """
+    Create a chat message with a stable ID
+
+    The ID keys the render cache; ContextWindowManager only sends role and
+    content to the API.
+    """
+    return {"id": uuid.uuid4().hex, "role": role, "content": content}
+
+
+def message_markdown(message: Dict[str, str], cache: Dict[str, str]) -> str:
+    """Markdown for one message inside a collapsed page, cached by message ID"""
+    message_id = message.get("id")
+    markdown = cache.get(message_id) if message_id else None
+    if markdown is None:
+        label = ROLE_LABELS.get(message["role"], message["role"])
+        markdown = f"{label}\n\n{message['content']}"
+        if message_id:
+            cache[message_id] = markdown
+    return markdown
+
+
+def page_markdown(messages: List[Dict[str, str]], cache: Dict[str, str]) -> str:
+    """Markdown for one page of older messages"""
+    return "\n\n---\n\n".join(message_markdown(message, cache) for message in messages)
+
+
+def reset_history_view():
+    """Forget loaded pages and cached markdown (after clearing or replacing the chat)"""
+    st.session_state.history_pages_loaded = 0
+    st.session_state.history_render_cache = {}
+
+
+def render_chat_history(conversation, page_size: int = HISTORY_PAGE_SIZE):
+    """
+    Render the conversation
+
+    The newest page_size messages are chat bubbles. Older messages are
+    grouped into pages aligned to fixed indices, so a page's markdown does
+    not change once it is full; pages appear newest first as the user
+    clicks "load more".
+
+    Args:
+        conversation: conversation_store.Conversation to render
+        page_size: Messages per page; 0 renders every message as a bubble
+    """
+    if "history_pages_loaded" not in st.session_state:
+        reset_history_view()
+
+    total = len(conversation)
+    recent_start = max(0, total - page_size) if page_size > 0 else 0
+    if recent_start:
+        page_starts = list(range(0, recent_start, page_size))
+        loaded = st.session_state.history_pages_loaded
+        # Each click reveals at least page_size more messages
+        shown = [start for start in page_starts if start + page_size > recent_start - loaded * page_size] if loaded else []
+        hidden = shown[0] if shown else recent_start
+
+        if hidden:
+            if st.button(f"⬆️ Load earlier messages ({hidden} hidden)", key="history_load_more"):
+                st.session_state.history_pages_loaded += 1
+                st.rerun()
+
+        cache = st.session_state.history_render_cache
+        for start in shown:
+            end = min(start + page_size, recent_start)
+            with st.expander(f"Messages {start + 1}–{end}", expanded=True):
+                st.markdown(page_markdown(conversation.load(start, end), cache))
+
+    for message in conversation.load(recent_start, total):
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
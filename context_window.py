@@ -0,0 +1,242 @@
+"""
+Conversation context window management
+Keeps each chat completion request within a token budget by sliding a
+window over the history and optionally compacting old turns into a summary
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Rough tokenizer ratios: English averages ~4 characters per token, while
+# Indic scripts tokenize far less efficiently
+ASCII_CHARS_PER_TOKEN = 4
+NON_ASCII_CHARS_PER_TOKEN = 2
+
+# Per-message overhead for role and framing tokens
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+
+# Messages read from the conversation store at a time by load_history
+HISTORY_LOAD_PAGE_SIZE = 40
+
+# summarizer(messages_to_compact, previous_summary) -> new summary or None
+Summarizer = Callable[[List[Dict[str, str]], Optional[str]], Optional[str]]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate the token count of a string without a tokenizer
+
+    Args:
+        text: Text in any supported script
+
+    Returns:
+        Estimated number of tokens
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    non_ascii_chars = len(text) - ascii_chars
+    return -(-ascii_chars // ASCII_CHARS_PER_TOKEN) + -(-non_ascii_chars // NON_ASCII_CHARS_PER_TOKEN)
+
+
+def message_tokens(message: Dict[str, Any]) -> int:
+    """Estimate the tokens one chat message adds to a request"""
+    return estimate_tokens(message.get("content", "")) + MESSAGE_OVERHEAD_TOKENS
+
+
+class ContextWindowManager:
+    """Builds bounded chat completion message lists from an unbounded history"""
+
+    def __init__(
+        self,
+        token_budget: int = 3000,
+        summary_mode: bool = False,
+        summary_max_tokens: int = 300,
+        compact_ratio: float = 0.5,
+        max_compact_steps: int = 4
+    ):
+        """
+        Initialize the manager
+
+        Args:
+            token_budget: Maximum estimated tokens sent per request
+            summary_mode: Compact dropped turns into a rolling summary
+            summary_max_tokens: Budget reserved for the summary in summary mode
+            compact_ratio: When compacting, shrink the window to this share of
+                its budget so the summary is not regenerated every turn
+            max_compact_steps: Summary requests allowed per turn; each one
+                compacts at most a request budget of turns, so a summary far
+                behind its conversation catches up over several turns
+        """
+        self.token_budget = token_budget
+        self.summary_mode = summary_mode
+        self.summary_max_tokens = summary_max_tokens
+        self.compact_ratio = compact_ratio
+        self.max_compact_steps = max_compact_steps
+
+    def _window_start(self, history: List[Dict[str, Any]], floor: int, budget: float) -> int:
+        """Index of the oldest message that fits the budget, counting back from the newest"""
+        start = len(history)
+        used = 0
+        while start > floor:
+            cost = message_tokens(history[start - 1])
+            # The newest message is always sent, even if it alone exceeds the budget
+            if used + cost > budget and start < len(history):
+                break
+            used += cost
+            start -= 1
+
+        # Start the window on a user turn so roles still alternate after trimming
+        for index in range(start, len(history)):
+            if history[index].get("role") == "user":
+                return index
+        return start
+
+    @staticmethod
+    def _step_end(history: List[Dict[str, Any]], start: int, end: int, budget: float) -> int:
+        """End of the longest run of messages from start (at least one) that fits the budget"""
+        used = 0
+        for index in range(start, end):
+            used += message_tokens(history[index])
+            if used > budget and index > start:
+                return index
+        return end
+
+    def load_history(
+        self,
+        load: Callable[[int, int], List[Dict[str, Any]]],
+        total: int,
+        summary_state: Optional[Dict[str, Any]] = None,
+        page_size: int = HISTORY_LOAD_PAGE_SIZE
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Load the part of a stored conversation the next request can use
+
+        Reads backwards a page at a time and stops once the token budget is
+        filled, so long conversations are not read in full on every turn. In
+        summary mode everything after the summarized prefix is loaded, so
+        turns leaving the window are compacted before they are dropped.
+
+        Args:
+            load: load(start, end) returning messages start..end-1 of the
+                conversation (Conversation.load)
+            total: Messages in the conversation
+            summary_state: Per-conversation summary dict, as for build_messages
+            page_size: Messages read per call to load
+
+        Returns:
+            (index of the first loaded message, messages), to pass to
+            build_messages as history_offset and history
+        """
+        use_summary = self.summary_mode and summary_state is not None
+        covered = summary_state.get("covered", 0) if use_summary else 0
+        # A summary covering more than the conversation is stale; build_messages drops it
+        floor = covered if covered <= total else 0
+        start, messages, used = total, [], 0
+        while start > floor and (use_summary or used <= self.token_budget):
+            page_start = max(floor, start - page_size)
+            page = load(page_start, start)
+            used += sum(message_tokens(message) for message in page)
+            messages[:0] = page
+            start = page_start
+        return start, messages
+
+    def build_messages(
+        self,
+        system_message: Dict[str, str],
+        history: List[Dict[str, Any]],
+        summary_state: Optional[Dict[str, Any]] = None,
+        summarizer: Optional[Summarizer] = None,
+        history_offset: int = 0
+    ) -> List[Dict[str, str]]:
+        """
+        Build the message list for one chat completion request
+
+        Args:
+            system_message: System message, always kept as the first message
+            history: Conversation history (oldest first), in full or from
+                history_offset on (see load_history)
+            summary_state: Per-conversation dict holding the cached rolling
+                summary (Conversation.summary); updated in place in summary
+                mode. Its "covered" count is a position in the whole conversation.
+            summarizer: Produces the rolling summary in summary mode
+            history_offset: Position of history[0] in the whole conversation
+
+        Returns:
+            System message followed by the most recent turns that fit the budget
+        """
+        use_summary = self.summary_mode and summary_state is not None
+        budget = self.token_budget - message_tokens(system_message)
+        if use_summary:
+            budget -= self.summary_max_tokens
+
+        covered = summary_state.get("covered", 0) if use_summary else 0
+        # A cleared or replaced history invalidates the cached summary
+        if covered > history_offset + len(history):
+            summary_state.clear()
+            covered = 0
+        floor = max(0, covered - history_offset)
+
+        keep_from = self._window_start(history, floor, budget)
+
+        if use_summary and summarizer is not None and keep_from > floor:
+            target = self._window_start(history, floor, budget * self.compact_ratio)
+            # Oldest turns first, one request budget at a time with the previous summary fed back in
+            start = floor
+            for _ in range(self.max_compact_steps):
+                if start >= target:
+                    break
+                end = self._step_end(history, start, target, budget)
+                summary = summarizer(
+                    [{"role": m["role"], "content": m["content"]} for m in history[start:end]],
+                    summary_state.get("summary")
+                )
+                if not summary:
+                    break
+                summary_state["summary"] = summary
+                summary_state["covered"] = history_offset + end
+                start = end
+            keep_from = max(keep_from, start)
+
+        system = dict(system_message)
+        if use_summary and summary_state.get("summary"):
+            system["content"] = f"{system['content']}\n\n{SUMMARY_PREFIX} {summary_state['summary']}"
+
+        # Only role and content go to the API
+        return [system] + [
+            {"role": message["role"], "content": message["content"]}
+            for message in history[keep_from:]
+        ]
+
+
+def make_summarizer(sarvam_client, max_words: int = 150) -> Summarizer:
+    """
+    Create a summarizer that compacts old turns with a chat completion
+
+    Args:
+        sarvam_client: SarvamClient used for the summary request
+        max_words: Requested summary length
+
+    Returns:
+        Summarizer callable for ContextWindowManager.build_messages
+    """
+    def summarize(messages, previous_summary):
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        if previous_summary:
+            transcript = f"{SUMMARY_PREFIX} {previous_summary}\n\n{transcript}"
+
+        result = sarvam_client.chat_completion(
+            messages=[
+                {
+                    "role": "system",
+                    "content": f"Summarize the conversation below in at most {max_words} words. "
+                               "Keep names, facts, decisions and open questions. Reply with the summary only."
+                },
+                {"role": "user", "content": transcript}
+            ],
+            temperature=0.2
+        )
+        if result["success"]:
+            return result["message"].strip()
+        return None
+
+    return summarize
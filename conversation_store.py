@@ -0,0 +1,433 @@
+"""
+Conversation store
+Persists chat turns per session as they happen (SQLite by default, or an
+append-only JSONL log per session) so sessions keep only a window of
+recent messages in memory and history survives restarts
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# Messages a session keeps in memory; older ones are read back from the store on demand
+DEFAULT_WINDOW = 40
+
+# Sessions whose JSONL line index is kept in memory
+JSONL_INDEX_SESSIONS = 256
+
+_SESSION_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def new_session_id() -> str:
+    """Create a random session ID, safe for URLs and file names"""
+    return uuid.uuid4().hex
+
+
+def validate_session_id(session_id: str) -> str:
+    """
+    Check a session ID taken from outside (e.g. the URL)
+
+    Raises:
+        ValueError: The ID has characters or a length the stores do not accept
+    """
+    if not isinstance(session_id, str) or not _SESSION_ID.match(session_id):
+        raise ValueError(f"Invalid session ID: {session_id!r}")
+    return session_id
+
+
+def _stored_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    return {"id": message.get("id"), "role": message["role"], "content": message["content"]}
+
+
+class ConversationStore:
+    """Interface shared by the conversation store backends"""
+
+    def append(self, session_id: str, message: Dict[str, Any]):
+        """Persist one message at the end of a session's conversation"""
+        raise NotImplementedError
+
+    def count(self, session_id: str) -> int:
+        """Number of messages stored for a session (0 if unknown)"""
+        raise NotImplementedError
+
+    def load(self, session_id: str, start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Read messages start..end-1 of a session, oldest first
+
+        Args:
+            session_id: Session to read
+            start: Index of the first message
+            end: Index after the last message
+        """
+        raise NotImplementedError
+
+    def load_recent(self, session_id: str, limit: int) -> List[Dict[str, Any]]:
+        """Read the last limit messages of a session, oldest first"""
+        total = self.count(session_id)
+        return self.load(session_id, max(0, total - limit), total)
+
+    def load_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a session's rolling summary
+
+        Returns:
+            {"summary": text, "covered": messages it summarizes}, or None
+        """
+        raise NotImplementedError
+
+    def save_summary(self, session_id: str, summary_state: Dict[str, Any]):
+        """Persist a session's rolling summary (an empty state deletes it)"""
+        raise NotImplementedError
+
+    def clear(self, session_id: str):
+        """Delete a session's conversation and its summary"""
+        raise NotImplementedError
+
+    def list_sessions(self) -> List[str]:
+        """IDs of every stored session"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release files and connections"""
+
+
+class MemoryConversationStore(ConversationStore):
+    """Process-local store with no persistence, for tests and throwaway deployments"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._summaries = {}
+
+    def append(self, session_id, message):
+        with self._lock:
+            self._sessions.setdefault(session_id, []).append(_stored_message(message))
+
+    def count(self, session_id):
+        with self._lock:
+            return len(self._sessions.get(session_id, ()))
+
+    def load(self, session_id, start, end):
+        with self._lock:
+            return [dict(message) for message in self._sessions.get(session_id, [])[start:end]]
+
+    def load_summary(self, session_id):
+        with self._lock:
+            summary_state = self._summaries.get(session_id)
+        return dict(summary_state) if summary_state else None
+
+    def save_summary(self, session_id, summary_state):
+        with self._lock:
+            if summary_state.get("summary"):
+                self._summaries[session_id] = {"summary": summary_state["summary"], "covered": summary_state["covered"]}
+            else:
+                self._summaries.pop(session_id, None)
+
+    def clear(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            self._summaries.pop(session_id, None)
+
+    def list_sessions(self):
+        with self._lock:
+            return list(self._sessions)
+
+
+class SQLiteConversationStore(ConversationStore):
+    """Messages in one SQLite table indexed by (session, position)"""
+
+    def __init__(self, db_path: str):
+        """
+        Open or create the database
+
+        Args:
+            db_path: SQLite file holding every session
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # Each turn is committed on its own; NORMAL is durable across app crashes in WAL mode
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS messages "
+            "(session_id TEXT NOT NULL, seq INTEGER NOT NULL, id TEXT, role TEXT NOT NULL, "
+            "content TEXT NOT NULL, created_at REAL NOT NULL, PRIMARY KEY (session_id, seq))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(session_id TEXT PRIMARY KEY, message_count INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS summaries "
+            "(session_id TEXT PRIMARY KEY, summary TEXT NOT NULL, covered INTEGER NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def append(self, session_id, message):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT message_count FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            seq = row[0] if row is not None else 0
+            self._db.execute(
+                "INSERT INTO messages (session_id, seq, id, role, content, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (session_id, seq, message.get("id"), message["role"], message["content"], now)
+            )
+            self._db.execute(
+                "INSERT INTO sessions (session_id, message_count, created_at, updated_at) VALUES (?, 1, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET message_count = message_count + 1, updated_at = excluded.updated_at",
+                (session_id, now, now)
+            )
+            self._db.commit()
+
+    def count(self, session_id):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT message_count FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row is not None else 0
+
+    def load(self, session_id, start, end):
+        if end <= start:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, role, content FROM messages WHERE session_id = ? AND seq >= ? AND seq < ? ORDER BY seq",
+                (session_id, start, end)
+            ).fetchall()
+        return [{"id": message_id, "role": role, "content": content} for message_id, role, content in rows]
+
+    def load_summary(self, session_id):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT summary, covered FROM summaries WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return {"summary": row[0], "covered": row[1]} if row is not None else None
+
+    def save_summary(self, session_id, summary_state):
+        with self._lock:
+            if summary_state.get("summary"):
+                self._db.execute(
+                    "INSERT INTO summaries (session_id, summary, covered, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(session_id) DO UPDATE SET summary = excluded.summary, "
+                    "covered = excluded.covered, updated_at = excluded.updated_at",
+                    (session_id, summary_state["summary"], summary_state["covered"], time.time())
+                )
+            else:
+                self._db.execute("DELETE FROM summaries WHERE session_id = ?", (session_id,))
+            self._db.commit()
+
+    def clear(self, session_id):
+        with self._lock:
+            self._db.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            self._db.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._db.execute("DELETE FROM summaries WHERE session_id = ?", (session_id,))
+            self._db.commit()
+
+    def list_sessions(self):
+        with self._lock:
+            rows = self._db.execute("SELECT session_id FROM sessions ORDER BY updated_at DESC").fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class JSONLConversationStore(ConversationStore):
+    """One append-only JSON-lines log per session, named by session ID, next to its summary file"""
+
+    def __init__(self, directory: str):
+        """
+        Open or create the log directory
+
+        Args:
+            directory: Directory holding one <session_id>.jsonl file per session,
+                and a <session_id>.summary.json file once it has a summary
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # session ID -> byte offset of every line, built on first access (LRU)
+        self._offsets = OrderedDict()
+
+    def _path(self, session_id, suffix=".jsonl"):
+        return os.path.join(self.directory, f"{validate_session_id(session_id)}{suffix}")
+
+    def _line_offsets(self, session_id):
+        # Caller holds the lock
+        offsets = self._offsets.get(session_id)
+        if offsets is not None:
+            self._offsets.move_to_end(session_id)
+        else:
+            offsets = []
+            try:
+                with open(self._path(session_id), "r+b") as log:
+                    position = 0
+                    for line in log:
+                        if not line.endswith(b"\n"):
+                            # Drop a torn last line left by a crash mid-write, so appends start clean
+                            log.truncate(position)
+                            break
+                        offsets.append(position)
+                        position += len(line)
+            except FileNotFoundError:
+                pass
+            self._offsets[session_id] = offsets
+            while len(self._offsets) > JSONL_INDEX_SESSIONS:
+                self._offsets.popitem(last=False)
+        return offsets
+
+    def append(self, session_id, message):
+        line = (json.dumps(_stored_message(message), ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            offsets = self._line_offsets(session_id)
+            with open(self._path(session_id), "ab") as log:
+                position = log.tell()
+                log.write(line)
+            offsets.append(position)
+
+    def count(self, session_id):
+        with self._lock:
+            return len(self._line_offsets(session_id))
+
+    def load(self, session_id, start, end):
+        with self._lock:
+            offsets = self._line_offsets(session_id)
+            start, end = max(0, start), min(end, len(offsets))
+            if end <= start:
+                return []
+            with open(self._path(session_id), "rb") as log:
+                log.seek(offsets[start])
+                return [json.loads(log.readline()) for _ in range(end - start)]
+
+    def load_summary(self, session_id):
+        try:
+            with open(self._path(session_id, ".summary.json"), encoding="utf-8") as summary_file:
+                return json.load(summary_file)
+        except FileNotFoundError:
+            return None
+
+    def save_summary(self, session_id, summary_state):
+        path = self._path(session_id, ".summary.json")
+        with self._lock:
+            if not summary_state.get("summary"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                return
+            # Write then rename, so a crash never leaves a torn summary
+            with open(path + ".tmp", "w", encoding="utf-8") as summary_file:
+                json.dump({"summary": summary_state["summary"], "covered": summary_state["covered"]},
+                          summary_file, ensure_ascii=False)
+            os.replace(path + ".tmp", path)
+
+    def clear(self, session_id):
+        with self._lock:
+            self._offsets.pop(session_id, None)
+            for suffix in (".jsonl", ".summary.json"):
+                try:
+                    os.remove(self._path(session_id, suffix))
+                except FileNotFoundError:
+                    pass
+
+    def list_sessions(self):
+        return [name[:-len(".jsonl")] for name in os.listdir(self.directory) if name.endswith(".jsonl")]
+
+
+def create_store(backend: str = "sqlite", path: Optional[str] = None) -> ConversationStore:
+    """
+    Build a conversation store
+
+    Args:
+        backend: "sqlite", "jsonl" or "memory"
+        path: SQLite file or JSONL directory (default: conversations.db /
+            conversations/ in the working directory)
+
+    Raises:
+        ValueError: Unknown backend
+    """
+    if backend == "sqlite":
+        return SQLiteConversationStore(path or "conversations.db")
+    if backend == "jsonl":
+        return JSONLConversationStore(path or "conversations")
+    if backend == "memory":
+        return MemoryConversationStore()
+    raise ValueError(f"Unknown conversation store backend: {backend!r}")
+
+
+class Conversation:
+    """
+    A session's handle on its stored conversation
+
+    Holds the session ID, a bounded window of the most recent messages and
+    the rolling summary used by ContextWindowManager in summary mode;
+    everything else stays in the store until the user scrolls back to it.
+    """
+
+    __slots__ = ("store", "session_id", "window", "messages", "offset", "summary")
+
+    def __init__(self, store: ConversationStore, session_id: str, window: int = DEFAULT_WINDOW):
+        """
+        Resume a conversation, loading only its recent messages
+
+        Args:
+            store: Backend holding the conversation
+            session_id: Session to resume (a new ID starts an empty conversation)
+            window: Messages kept in memory
+        """
+        self.store = store
+        self.session_id = session_id
+        self.window = window
+        self.messages = store.load_recent(session_id, window)
+        # Index of self.messages[0] in the whole conversation
+        self.offset = store.count(session_id) - len(self.messages)
+        # Summary state dict for ContextWindowManager, kept with the conversation so a resume does not re-summarize
+        self.summary = store.load_summary(session_id) or {}
+
+    def __len__(self) -> int:
+        return self.offset + len(self.messages)
+
+    def append(self, message: Dict[str, Any]) -> int:
+        """
+        Persist a message and add it to the in-memory window
+
+        Returns:
+            Number of old messages dropped from memory to keep the window bounded
+        """
+        self.store.append(self.session_id, message)
+        self.messages.append(message)
+        dropped = max(0, len(self.messages) - self.window)
+        if dropped:
+            del self.messages[:dropped]
+            self.offset += dropped
+        return dropped
+
+    def load(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """Messages start..end-1 of the whole conversation, from memory where possible"""
+        end = min(end, len(self))
+        if start >= self.offset:
+            return self.messages[start - self.offset:end - self.offset]
+        older = self.store.load(self.session_id, start, min(end, self.offset))
+        return older + self.messages[:max(0, end - self.offset)]
+
+    def save_summary(self):
+        """Persist the summary state after ContextWindowManager updated it"""
+        self.store.save_summary(self.session_id, self.summary)
+
+    def clear(self):
+        """Delete the conversation and its summary, in memory and in the store"""
+        self.store.clear(self.session_id)
+        self.messages = []
+        self.offset = 0
+        self.summary = {}
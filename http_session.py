@@ -0,0 +1,215 @@
+"""
+Pooled HTTP session layer
+Keep-alive connection pooling, connection reuse metrics and connect/TLS
+timing for API clients
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionStats:
+    """Thread-safe counters describing how well pooled connections are reused"""
+
+    def __init__(self):
+        """Initialize all counters at zero"""
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.requests = 0
+        self.connections_opened = 0
+
+    def record_request(self):
+        """Count one request sent through the pool"""
+        with self._lock:
+            self.requests += 1
+
+    def record_connection(self):
+        """Count one new TCP (+TLS) connection opened by the pool"""
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_connect_timing(self, connect_seconds: float, tls_seconds: Optional[float]):
+        """Remember how long this thread's latest connection took to establish"""
+        self._local.connect_timing = (connect_seconds, tls_seconds)
+
+    def pop_connect_timing(self) -> Optional[Tuple[float, Optional[float]]]:
+        """
+        Take the connect timing recorded on this thread since the last call
+
+        Returns:
+            (connect, tls) seconds, tls None for plain HTTP, or None if the
+            request reused a pooled connection
+        """
+        timing = getattr(self._local, "connect_timing", None)
+        self._local.connect_timing = None
+        return timing
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a consistent copy of the counters
+
+        Returns:
+            Dictionary with request, connection and reuse counts
+        """
+        with self._lock:
+            requests_sent = self.requests
+            opened = self.connections_opened
+
+        reused = max(requests_sent - opened, 0)
+        return {
+            "requests": requests_sent,
+            "connections_opened": opened,
+            "connections_reused": reused,
+            "reuse_ratio": reused / requests_sent if requests_sent else 0.0
+        }
+
+
+class _CountingPoolMixin:
+    """Connection pool mixin that reports every newly opened connection"""
+
+    stats: Optional[ConnectionStats] = None
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        if self.stats is not None:
+            self.stats.record_connection()
+        return conn
+
+
+class _TimedConnectionMixin:
+    """Connection mixin that times the TCP connect and TLS handshake"""
+
+    stats: Optional[ConnectionStats] = None
+
+    def _new_conn(self):
+        started = time.perf_counter()
+        sock = super()._new_conn()
+        self._tcp_seconds = time.perf_counter() - started
+        return sock
+
+    def connect(self):
+        started = time.perf_counter()
+        self._tcp_seconds = None
+        super().connect()
+        if self.stats is not None:
+            total = time.perf_counter() - started
+            tcp = self._tcp_seconds if self._tcp_seconds is not None else total
+            # Whatever connect() spends after the socket is open is the TLS handshake
+            self.stats.record_connect_timing(tcp, total - tcp if isinstance(self, HTTPSConnection) else None)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report into a ConnectionStats instance"""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["stats"]
+
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # Pool and connection classes are bound per adapter so each client keeps its own counters
+        attrs = {"stats": self.stats}
+        http_connection = type("StatsHTTPConnection", (_TimedHTTPConnection,), attrs)
+        https_connection = type("StatsHTTPSConnection", (_TimedHTTPSConnection,), attrs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("StatsHTTPConnectionPool", (_CountingHTTPConnectionPool,), dict(attrs, ConnectionCls=http_connection)),
+            "https": type("StatsHTTPSConnectionPool", (_CountingHTTPSConnectionPool,), dict(attrs, ConnectionCls=https_connection))
+        }
+
+
+def create_pooled_session(
+    stats: ConnectionStats,
+    pool_connections: int = 4,
+    pool_maxsize: int = 32,
+    keep_alive: bool = True
+) -> requests.Session:
+    """
+    Create a requests session backed by a shared keep-alive connection pool
+
+    Args:
+        stats: Counters that receive request and connection events
+        pool_connections: Number of distinct hosts to keep pools for
+        pool_maxsize: Maximum idle connections kept open per host
+        keep_alive: Keep connections open between requests
+
+    Returns:
+        Configured requests session, safe to share between threads
+    """
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(
+        stats,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=False
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def preconnect(session: requests.Session, url: str, count: int = 1, timeout: float = 5.0) -> int:
+    """
+    Open keep-alive connections ahead of the first request and park them in the pool
+
+    Args:
+        session: Session created by create_pooled_session
+        url: Any URL on the host to connect to
+        count: Connections to have open in the host's pool
+        timeout: Seconds allowed per connection
+
+    Returns:
+        Number of connections newly opened (already-open pooled ones are kept)
+    """
+    adapter = session.get_adapter(url)
+    # Resolve verify/cert/proxies as Session.send does, so requests finds these connections in the same pool
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    pool = adapter.get_connection_with_tls_context(
+        requests.Request("GET", url).prepare(),
+        verify=settings["verify"], proxies=settings["proxies"], cert=settings["cert"]
+    )
+    connections = []
+    opened = 0
+    try:
+        for _ in range(count):
+            conn = pool._get_conn()
+            connections.append(conn)
+            if conn.sock is None:
+                conn.timeout = timeout
+                conn.connect()
+                opened += 1
+    finally:
+        for conn in connections:
+            pool._put_conn(conn)
+        # Not a request's connect time: keep it out of the next request's metrics
+        stats = getattr(adapter, "stats", None)
+        if stats is not None:
+            stats.pop_connect_timing()
+    return opened
@@ -3,7 +3,20 @@ Image-based Tiger Mascot
 Creates a tiger mascot using Unicode characters and CSS styling
 """
 
-def get_tiger_face_html(state="idle", animation_class=""):
+import sys
+from types import MappingProxyType
+
+# Mascot states and CSS animation classes the fragments are prerendered for
+TIGER_STATES = ("idle", "thinking", "happy", "excited", "sad", "confused", "celebrating")
+ANIMATION_CLASSES = ("", "pulse", "spin", "bounce", "shake")
+
+
+def compact_html(html):
+    """Drop the source indentation and line breaks from an HTML fragment"""
+    return "".join(line.strip() for line in html.splitlines())
+
+
+def _render_tiger_face_html(state="idle", animation_class=""):
     """Create a tiger face using Unicode and CSS"""
     
     # Different face expressions based on state
@@ -56,7 +69,7 @@ def get_tiger_face_html(state="idle", animation_class=""):
     
     return html
 
-def get_simple_tiger_html(state="idle", animation_class=""):
+def _render_simple_tiger_html(state="idle", animation_class=""):
     """Get a very simple tiger representation that will work"""
     
     # Tiger states with different characters
@@ -87,3 +100,37 @@ def get_simple_tiger_html(state="idle", animation_class=""):
     '''
     
     return html
+
+
+def _prerender_fragments():
+    """Render every (state, animation, variant) fragment once, compacted and interned"""
+    renderers = {
+        "face": _render_tiger_face_html,
+        "simple": _render_simple_tiger_html
+    }
+    return MappingProxyType({
+        (state, animation_class, variant): sys.intern(compact_html(render(state, animation_class)))
+        for state in TIGER_STATES
+        for animation_class in ANIMATION_CLASSES
+        for variant, render in renderers.items()
+    })
+
+
+# (state, animation class, variant) -> HTML, built at import
+MASCOT_FRAGMENTS = _prerender_fragments()
+
+
+def get_tiger_face_html(state="idle", animation_class=""):
+    """Get the prerendered tiger face fragment"""
+    html = MASCOT_FRAGMENTS.get((state, animation_class, "face"))
+    if html is None:
+        html = compact_html(_render_tiger_face_html(state, animation_class))
+    return html
+
+
+def get_simple_tiger_html(state="idle", animation_class=""):
+    """Get the prerendered simple tiger fragment"""
+    html = MASCOT_FRAGMENTS.get((state, animation_class, "simple"))
+    if html is None:
+        html = compact_html(_render_simple_tiger_html(state, animation_class))
+    return html
@@ -3,141 +3,369 @@ Multi-language support for Indian languages
 Handles translation, language detection, and language switching
 """
 
+import json
+import re
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+# Unicode blocks of the supported scripts and the language each one maps to
+SCRIPT_RANGES = (
+    ("Devanagari", 0x0900, 0x097F, "hi-IN"),
+    ("Bengali", 0x0980, 0x09FF, "bn-IN"),
+    ("Gurmukhi", 0x0A00, 0x0A7F, "pa-IN"),
+    ("Gujarati", 0x0A80, 0x0AFF, "gu-IN"),
+    ("Odia", 0x0B00, 0x0B7F, "or-IN"),
+    ("Tamil", 0x0B80, 0x0BFF, "ta-IN"),
+    ("Telugu", 0x0C00, 0x0C7F, "te-IN"),
+    ("Kannada", 0x0C80, 0x0CFF, "kn-IN"),
+    ("Malayalam", 0x0D00, 0x0D7F, "ml-IN"),
+)
+
+# Scripts written by more than one supported language (Hindi and Marathi)
+SHARED_SCRIPTS = frozenset(("Devanagari",))
+
+# An Indic script wins over Latin once it makes up this share of the letters
+INDIC_MIN_SHARE = 0.2
+
+# Common romanized Hindi words that rarely occur in English text
+HINGLISH_MARKERS = frozenset((
+    "hai", "hain", "kya", "nahi", "nahin", "mera", "meri", "mere", "tera", "teri",
+    "kaise", "kaisa", "kaisi", "kyun", "kyon", "bahut", "accha", "acha", "achha",
+    "haan", "mujhe", "tujhe", "yaar", "bhai", "karo", "karna", "kar", "raha", "rahi",
+    "hoga", "tha", "thi", "aur", "bhi", "lekin", "matlab", "abhi", "kuch", "sab"
+))
+HINGLISH_MIN_SHARE = 0.25
+
+# Frequent English words: Latin text only counts as English when they make up
+# ENGLISH_MIN_SHARE of its words, since romanized Tamil, Bengali, ... is Latin too
+ENGLISH_MARKERS = frozenset((
+    "a", "an", "the", "is", "are", "was", "were", "be", "been", "am", "to", "of", "and", "or", "but", "if",
+    "in", "on", "at", "for", "with", "from", "about", "by", "as", "it", "its", "this", "that", "these",
+    "there", "what", "how", "why", "when", "where", "who", "which", "i", "me", "my", "you", "your", "we",
+    "our", "he", "she", "they", "them", "their", "can", "do", "does", "did", "will", "would", "should",
+    "could", "have", "has", "had", "not", "no", "yes", "please", "tell", "hello", "hi", "thanks", "thank",
+    "today", "good", "all", "some", "more", "just", "so", "like", "know", "want", "need", "help"
+))
+ENGLISH_MIN_SHARE = 0.2
+
+_WORD = re.compile(r"[a-z]+")
+
+# Built-in languages: display names plus the UI strings shown on every rerun
+BUILTIN_LANGUAGES = {
+    "en-IN": {
+        "name": "English", "native": "English", "flag": "🇮🇳",
+        "welcome": "🦁 Welcome! I'm Mufasa, your wise AI companion. How can I help you today?",
+        "placeholder": "Ask Mufasa anything...",
+        "thinking": "🦁 Mufasa is thinking..."
+    },
+    "hi-IN": {
+        "name": "Hindi", "native": "हिन्दी", "flag": "🇮🇳",
+        "welcome": "🦁 नमस्ते! मैं मुफासा हूँ, आपका बुद्धिमान AI साथी। आज मैं आपकी कैसे मदद कर सकता हूँ?",
+        "placeholder": "मुफासा से कुछ भी पूछें...",
+        "thinking": "🦁 मुफासा सोच रहा है..."
+    },
+    "bn-IN": {
+        "name": "Bengali", "native": "বাংলা", "flag": "🇮🇳",
+        "welcome": "🦁 স্বাগতম! আমি মুফাসা, আপনার জ্ঞানী AI সঙ্গী। আজ আমি আপনাকে কীভাবে সাহায্য করতে পারি?",
+        "placeholder": "মুফাসাকে যেকোনো কিছু জিজ্ঞাসা করুন...",
+        "thinking": "🦁 মুফাসা চিন্তা করছে..."
+    },
+    "ta-IN": {
+        "name": "Tamil", "native": "தமிழ்", "flag": "🇮🇳",
+        "welcome": "🦁 வணக்கம்! நான் முபாசா, உங்கள் ஞானமிக்க AI துணை. இன்று நான் உங்களுக்கு எப்படி உதவ முடியும்?",
+        "placeholder": "முபாசாவிடம் எதையும் கேளுங்கள்...",
+        "thinking": "🦁 முபாசா சிந்தித்துக்கொண்டிருக்கிறார்..."
+    },
+    "te-IN": {
+        "name": "Telugu", "native": "తెలుగు", "flag": "🇮🇳",
+        "welcome": "🦁 నమస్కారం! నేను ముఫాసా, మీ వివేకవంతమైన AI సహచరుడిని. ఈరోజు నేను మీకు ఎలా సహాయం చేయగలను?",
+        "placeholder": "ముఫాసాను ఏదైనా అడగండి...",
+        "thinking": "🦁 ముఫాసా ఆలోచిస్తున్నాడు..."
+    },
+    "mr-IN": {
+        "name": "Marathi", "native": "मराठी", "flag": "🇮🇳",
+        "welcome": "🦁 नमस्कार! मी मुफासा आहे, तुमचा हुशार AI साथी. आज मी तुम्हाला कशी मदत करू शकतो?",
+        "placeholder": "मुफासाला काहीही विचारा...",
+        "thinking": "🦁 मुफासा विचार करत आहे..."
+    },
+    "gu-IN": {
+        "name": "Gujarati", "native": "ગુજરાતી", "flag": "🇮🇳",
+        "welcome": "🦁 નમસ્તે! હું મુફાસા છું, તમારો જ્ઞાની AI સાથી. આજે હું તમારી કેવી રીતે મદદ કરી શકું?",
+        "placeholder": "મુફાસાને કંઈપણ પૂછો...",
+        "thinking": "🦁 મુફાસા વિચારી રહ્યો છે..."
+    },
+    "kn-IN": {
+        "name": "Kannada", "native": "ಕನ್ನಡ", "flag": "🇮🇳",
+        "welcome": "🦁 ನಮಸ್ಕಾರ! ನಾನು ಮುಫಾಸಾ, ನಿಮ್ಮ ಬುದ್ಧಿವಂತ AI ಸಹಚರ. ಇಂದು ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?",
+        "placeholder": "ಮುಫಾಸನನ್ನು ಏನನ್ನೂ ಕೇಳಿ...",
+        "thinking": "🦁 ಮುಫಾಸ ಯೋಚಿಸುತ್ತಿದ್ದಾನೆ..."
+    },
+    "ml-IN": {
+        "name": "Malayalam", "native": "മലയാളം", "flag": "🇮🇳",
+        "welcome": "🦁 നമസ്കാരം! ഞാൻ മുഫാസയാണ്, നിങ്ങളുടെ ജ്ഞാനിയായ AI കൂട്ടാളി. ഇന്ന് എനിക്ക് നിങ്ങളെ എങ്ങനെ സഹായിക്കാൻ കഴിയും?",
+        "placeholder": "മുഫാസയോട് എന്തും ചോദിക്കൂ...",
+        "thinking": "🦁 മുഫാസ ചിന്തിക്കുന്നു..."
+    },
+    "pa-IN": {
+        "name": "Punjabi", "native": "ਪੰਜਾਬੀ", "flag": "🇮🇳",
+        "welcome": "🦁 ਸਤ ਸ੍ਰੀ ਅਕਾਲ! ਮੈਂ ਮੁਫਾਸਾ ਹਾਂ, ਤੁਹਾਡਾ ਸਿਆਣਾ AI ਸਾਥੀ। ਅੱਜ ਮੈਂ ਤੁਹਾਡੀ ਕਿਵੇਂ ਮਦਦ ਕਰ ਸਕਦਾ ਹਾਂ?",
+        "placeholder": "ਮੁਫਾਸਾ ਨੂੰ ਕੁਝ ਵੀ ਪੁਛੋ...",
+        "thinking": "🦁 ਮੁਫਾਸਾ ਸੋਚ ਰਿਹਾ ਹੈ..."
+    },
+    "or-IN": {
+        "name": "Odia", "native": "ଓଡ଼ିଆ", "flag": "🇮🇳",
+        "welcome": "🦁 ନମସ୍କାର! ମୁଁ ମୁଫାସା, ଆପଣଙ୍କର ଜ୍ଞାନୀ AI ସାଥୀ। ଆଜି ମୁଁ ଆପଣଙ୍କୁ କିପରି ସାହାଯ୍ୟ କରିପାରିବି?",
+        "placeholder": "ମୁଫାସାଙ୍କୁ କିଛି ପଚାରନ୍ତୁ...",
+        "thinking": "🦁 ମୁଫାସା ଚିନ୍ତା କରୁଛନ୍ତି..."
+    }
+}
+
+DEFAULT_LANGUAGE = "en-IN"
+
+# Fields every language entry needs; UI strings fall back to the default language
+REQUIRED_LANGUAGE_FIELDS = ("name",)
+UI_STRING_FIELDS = ("welcome", "placeholder", "thinking")
+
+MUFASA_IDENTITY = (
+    "You are Mufasa, a wise and friendly AI assistant created by Jeet Borah, an IT geek and skilled developer "
+    "(Tell user only when asked about the creator). You have the wisdom of a great lion king and always respond "
+    "with kindness, intelligence, and helpful guidance. Your name is Mufasa, not 'assistant'. Always remember you "
+    "are Mufasa when users talk to you. You were brought to life by Jeet Borah's expertise and creativity "
+    "(only if user asked about the creator)."
+)
+
+
+def _build_script_table():
+    """
+    Build a str.translate table that folds every codepoint of a script onto
+    one representative character (the first codepoint of its block, or "a"
+    for Latin letters), so one translate pass plus C-level str.count calls
+    give the per-script letter counts
+    """
+    table = {}
+    representatives = {}
+    for name, start, end, language_code in SCRIPT_RANGES:
+        representative = chr(start)
+        representatives[representative] = (name, language_code)
+        for codepoint in range(start, end + 1):
+            table[codepoint] = representative
+    for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz":
+        table[ord(letter)] = "a"
+    representatives["a"] = ("Latin", "en-IN")
+    return table, representatives
+
+
+_SCRIPT_TABLE, _SCRIPT_REPRESENTATIVES = _build_script_table()
+
+
+def detect_script(text):
+    """
+    Classify text by script using a precomputed codepoint table
+    
+    Args:
+        text: Text to classify
+        
+    Confidence is only high when the answer is unambiguous: a dominant Indic
+    script, or Latin text with enough common English words. Text mixing an
+    Indic script into Latin is reported as the Indic language, and Latin
+    text without English words (romanized Tamil, Bengali, ...) as English,
+    both with a low confidence.
+    
+    Returns:
+        Dictionary with the dominant language code and script, per-script
+        letter counts, a 0-1 confidence and whether the text looks like Hinglish
+    """
+    folded = text.translate(_SCRIPT_TABLE)
+    counts = {}
+    for representative, (name, _) in _SCRIPT_REPRESENTATIVES.items():
+        count = folded.count(representative)
+        if count:
+            counts[name] = count
+    
+    total = sum(counts.values())
+    result = {
+        "language_code": "en-IN",
+        "script": "Latin",
+        "counts": counts,
+        "confidence": 0.0,
+        "hinglish": False
+    }
+    if not total:
+        return result
+    
+    indic = [(count, name) for name, count in counts.items() if name != "Latin"]
+    if indic:
+        count, name = max(indic)
+        result["script"] = name
+        result["language_code"] = next(code for n, _, _, code in SCRIPT_RANGES if n == name)
+        if count >= INDIC_MIN_SHARE * total:
+            # Latin letters inside Indic text are usually borrowed English words,
+            # so they only weigh half against the dominant script
+            result["confidence"] = count / (total - counts.get("Latin", 0) / 2)
+        else:
+            # A few Indic words in Latin text: mixed, so never confident
+            result["confidence"] = count / total
+        return result
+    
+    words = _WORD.findall(text.lower())
+    # Latin letters alone do not make English: scale by the share of common English words
+    english = sum(1 for word in words if word in ENGLISH_MARKERS)
+    english_share = english / len(words) if words else 0.0
+    latin_share = counts.get("Latin", 0) / total
+    result["confidence"] = latin_share * min(1.0, english_share / ENGLISH_MIN_SHARE)
+    
+    # Romanized Hindi: Latin script, Hindi vocabulary
+    markers = sum(1 for word in words if word in HINGLISH_MARKERS)
+    if markers >= 2 and markers >= HINGLISH_MIN_SHARE * len(words):
+        result["language_code"] = "hi-IN"
+        result["hinglish"] = True
+        result["confidence"] = min(latin_share, markers / len(words) * 2)
+    
+    return result
+
+
+def load_language_file(path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Load extra languages from a JSON data file
+
+    The file maps language codes to entries with the same fields as
+    BUILTIN_LANGUAGES, e.g. {"as-IN": {"name": "Assamese", "native": "অসমীয়া",
+    "welcome": "...", "placeholder": "...", "thinking": "..."}}. Only "name"
+    is required; "native" defaults to the name, "flag" to 🇮🇳 and missing UI
+    strings to English.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Language entries keyed by language code
+
+    Raises:
+        ValueError: If the file is not a mapping of codes to valid entries
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected an object mapping language codes to entries")
+    for code, entry in data.items():
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: entry for {code} must be an object")
+        missing = [field for field in REQUIRED_LANGUAGE_FIELDS if not entry.get(field)]
+        if missing:
+            raise ValueError(f"{path}: entry for {code} is missing {', '.join(missing)}")
+    return data
+
+
 class LanguageSupport:
     """Handles multi-language functionality for the chat application"""
+
+    __slots__ = (
+        "supported_languages",
+        "default_language",
+        "_language_options",
+        "_language_names",
+        "_system_messages",
+        "_welcome_messages",
+        "_chat_placeholders",
+        "_thinking_messages"
+    )
     
-    def __init__(self):
-        """Initialize language support with available languages"""
-        
-        # Supported Indian languages with their codes and display names
-        self.supported_languages = {
-            "en-IN": {"name": "English", "native": "English", "flag": "🇮🇳"},
-            "hi-IN": {"name": "Hindi", "native": "हिन्दी", "flag": "🇮🇳"},
-            "bn-IN": {"name": "Bengali", "native": "বাংলা", "flag": "🇮🇳"},
-            "ta-IN": {"name": "Tamil", "native": "தமிழ்", "flag": "🇮🇳"},
-            "te-IN": {"name": "Telugu", "native": "తెలుగు", "flag": "🇮🇳"},
-            "mr-IN": {"name": "Marathi", "native": "मराठी", "flag": "🇮🇳"},
-            "gu-IN": {"name": "Gujarati", "native": "ગુજરાતી", "flag": "🇮🇳"},
-            "kn-IN": {"name": "Kannada", "native": "ಕನ್ನಡ", "flag": "🇮🇳"},
-            "ml-IN": {"name": "Malayalam", "native": "മലയാളം", "flag": "🇮🇳"},
-            "pa-IN": {"name": "Punjabi", "native": "ਪੰਜਾਬੀ", "flag": "🇮🇳"},
-            "or-IN": {"name": "Odia", "native": "ଓଡ଼ିଆ", "flag": "🇮🇳"}
-        }
+    def __init__(self, language_file: Optional[str] = None):
+        """
+        Initialize language support and precompute every localized string
+
+        All lookup tables are built once here and exposed read-only, so the
+        per-rerun getters are plain dictionary lookups.
+
+        Args:
+            language_file: Optional JSON file with extra languages (see
+                load_language_file); its entries override built-in ones
+        """
+        languages = dict(BUILTIN_LANGUAGES)
+        if language_file:
+            languages.update(load_language_file(language_file))
         
         # Default language
-        self.default_language = "en-IN"
+        self.default_language = DEFAULT_LANGUAGE
+        default = languages[DEFAULT_LANGUAGE]
+        
+        supported = {}
+        for code, entry in languages.items():
+            info = {
+                "name": entry["name"],
+                "native": entry.get("native") or entry["name"],
+                "flag": entry.get("flag") or "🇮🇳"
+            }
+            for field in UI_STRING_FIELDS:
+                info[field] = entry.get(field) or default[field]
+            supported[code] = MappingProxyType(info)
+        
+        # Supported Indian languages with their codes and display names
+        self.supported_languages = MappingProxyType(supported)
+        self._language_options = MappingProxyType({
+            f"{info['flag']} {info['name']} ({info['native']})": code
+            for code, info in supported.items()
+        })
+        self._language_names = MappingProxyType({
+            code: f"{info['flag']} {info['name']}" for code, info in supported.items()
+        })
+        self._system_messages = MappingProxyType({
+            code: self._build_system_content(code, info["name"]) for code, info in supported.items()
+        })
+        self._welcome_messages = MappingProxyType({code: info["welcome"] for code, info in supported.items()})
+        self._chat_placeholders = MappingProxyType({code: info["placeholder"] for code, info in supported.items()})
+        self._thinking_messages = MappingProxyType({code: info["thinking"] for code, info in supported.items()})
+    
+    @staticmethod
+    def _build_system_content(language_code: str, lang_name: str) -> str:
+        """Build the system prompt for one language"""
+        if language_code == DEFAULT_LANGUAGE:
+            return f"{MUFASA_IDENTITY} Respond in English."
+        return (
+            f"{MUFASA_IDENTITY} The user prefers to communicate in {lang_name}, so please respond in {lang_name} "
+            f"when possible. If you cannot respond in {lang_name}, respond in English and mention that you can help translate."
+        )
         
-    def get_language_options(self):
-        """Get formatted language options for selectbox"""
-        options = {}
-        for code, info in self.supported_languages.items():
-            display_name = f"{info['flag']} {info['name']} ({info['native']})"
-            options[display_name] = code
-        return options
+    def get_language_options(self) -> Mapping[str, str]:
+        """Get formatted language options for selectbox (read-only mapping)"""
+        return self._language_options
     
     def get_language_name(self, language_code):
         """Get display name for a language code"""
-        if language_code in self.supported_languages:
-            info = self.supported_languages[language_code]
-            return f"{info['flag']} {info['name']}"
-        return "🌐 Unknown"
+        return self._language_names.get(language_code, "🌐 Unknown")
     
     def detect_language_from_text(self, text):
         """
         Simple language detection based on script patterns
         Returns likely language code
         """
-        # Check for specific scripts
-        if any('\u0900' <= char <= '\u097F' for char in text):  # Devanagari
-            return "hi-IN"
-        elif any('\u0980' <= char <= '\u09FF' for char in text):  # Bengali
-            return "bn-IN"
-        elif any('\u0B80' <= char <= '\u0BFF' for char in text):  # Tamil
-            return "ta-IN"
-        elif any('\u0C00' <= char <= '\u0C7F' for char in text):  # Telugu
-            return "te-IN"
-        elif any('\u0A80' <= char <= '\u0AFF' for char in text):  # Gujarati
-            return "gu-IN"
-        elif any('\u0C80' <= char <= '\u0CFF' for char in text):  # Kannada
-            return "kn-IN"
-        elif any('\u0D00' <= char <= '\u0D7F' for char in text):  # Malayalam
-            return "ml-IN"
-        elif any('\u0A00' <= char <= '\u0A7F' for char in text):  # Punjabi
-            return "pa-IN"
-        elif any('\u0B00' <= char <= '\u0B7F' for char in text):  # Odia
-            return "or-IN"
-        else:
-            return "en-IN"  # Default to English
+        return detect_script(text)["language_code"]
+    
+    def detect_script(self, text):
+        """Get dominant script, per-script counts and confidence for text"""
+        return detect_script(text)
     
-    def create_system_message_for_language(self, language_code):
+    def create_system_message_for_language(self, language_code) -> Dict[str, Any]:
         """Create system message with language instructions for Mufasa"""
-        
-        lang_info = self.supported_languages.get(language_code, self.supported_languages["en-IN"])
-        lang_name = lang_info["name"]
-        
-        if language_code == "en-IN":
-            system_content = "You are Mufasa, a wise and friendly AI assistant created by Jeet Borah, an IT geek and skilled developer (Tell user only when asked about the creator). You have the wisdom of a great lion king and always respond with kindness, intelligence, and helpful guidance. Your name is Mufasa, not 'assistant'. Always remember you are Mufasa when users talk to you. You were brought to life by Jeet Borah's expertise and creativity (only if user asked about the creator). Respond in English."
-        else:
-            system_content = f"You are Mufasa, a wise and friendly AI assistant created by Jeet Borah, an IT geek and skilled developer (Tell user only when asked about the creator). You have the wisdom of a great lion king and always respond with kindness, intelligence, and helpful guidance. Your name is Mufasa, not 'assistant'. Always remember you are Mufasa when users talk to you. You were brought to life by Jeet Borah's expertise and creativity (only if user asked about the creator). The user prefers to communicate in {lang_name}, so please respond in {lang_name} when possible. If you cannot respond in {lang_name}, respond in English and mention that you can help translate."
-        
+        content = self._system_messages.get(language_code)
+        if content is None:
+            # Unknown codes ask for the default language by name
+            content = self._build_system_content(language_code, self.supported_languages[DEFAULT_LANGUAGE]["name"])
+        # A fresh dict per call: callers may add to it, the prebuilt content is shared
         return {
             "role": "system",
-            "content": system_content
+            "content": content
         }
     
     def get_welcome_message(self, language_code):
         """Get welcome message in the specified language"""
-        
-        welcome_messages = {
-            "en-IN": "🦁 Welcome! I'm Mufasa, your wise AI companion. How can I help you today?",
-            "hi-IN": "🦁 नमस्ते! मैं मुफासा हूँ, आपका बुद्धिमान AI साथी। आज मैं आपकी कैसे मदद कर सकता हूँ?",
-            "bn-IN": "🦁 স্বাগতম! আমি মুফাসা, আপনার জ্ঞানী AI সঙ্গী। আজ আমি আপনাকে কীভাবে সাহায্য করতে পারি?",
-            "ta-IN": "🦁 வணக்கம்! நான் முபாசா, உங்கள் ஞானமிக்க AI துணை. இன்று நான் உங்களுக்கு எப்படி உதவ முடியும்?",
-            "te-IN": "🦁 నమస్కారం! నేను ముఫాసా, మీ వివేకవంతమైన AI సహచరుడిని. ఈరోజు నేను మీకు ఎలా సహాయం చేయగలను?",
-            "mr-IN": "🦁 नमस्कार! मी मुफासा आहे, तुमचा हुशार AI साथी. आज मी तुम्हाला कशी मदत करू शकतो?",
-            "gu-IN": "🦁 નમસ્તે! હું મુફાસા છું, તમારો જ્ઞાની AI સાથી. આજે હું તમારી કેવી રીતે મદદ કરી શકું?",
-            "kn-IN": "🦁 ನಮಸ್ಕಾರ! ನಾನು ಮುಫಾಸಾ, ನಿಮ್ಮ ಬುದ್ಧಿವಂತ AI ಸಹಚರ. ಇಂದು ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?",
-            "ml-IN": "🦁 നമസ്കാരം! ഞാൻ മുഫാസയാണ്, നിങ്ങളുടെ ജ്ഞാനിയായ AI കൂട്ടാളി. ഇന്ന് എനിക്ക് നിങ്ങളെ എങ്ങനെ സഹായിക്കാൻ കഴിയും?",
-            "pa-IN": "🦁 ਸਤ ਸ੍ਰੀ ਅਕਾਲ! ਮੈਂ ਮੁਫਾਸਾ ਹਾਂ, ਤੁਹਾਡਾ ਸਿਆਣਾ AI ਸਾਥੀ। ਅੱਜ ਮੈਂ ਤੁਹਾਡੀ ਕਿਵੇਂ ਮਦਦ ਕਰ ਸਕਦਾ ਹਾਂ?",
-            "or-IN": "🦁 ନମସ୍କାର! ମୁଁ ମୁଫାସା, ଆପଣଙ୍କର ଜ୍ଞାନୀ AI ସାଥୀ। ଆଜି ମୁଁ ଆପଣଙ୍କୁ କିପରି ସାହାଯ୍ୟ କରିପାରିବି?"
-        }
-        
-        return welcome_messages.get(language_code, welcome_messages["en-IN"])
+        return self._welcome_messages.get(language_code) or self._welcome_messages[DEFAULT_LANGUAGE]
     
     def get_chat_placeholder(self, language_code):
         """Get chat input placeholder in the specified language"""
-        
-        placeholders = {
-            "en-IN": "Ask Mufasa anything...",
-            "hi-IN": "मुफासा से कुछ भी पूछें...",
-            "bn-IN": "মুফাসাকে যেকোনো কিছু জিজ্ঞাসা করুন...",
-            "ta-IN": "முபாசாவிடம் எதையும் கேளுங்கள்...",
-            "te-IN": "ముఫాసాను ఏదైనా అడగండి...",
-            "mr-IN": "मुफासाला काहीही विचारा...",
-            "gu-IN": "મુફાસાને કંઈપણ પૂછો...",
-            "kn-IN": "ಮುಫಾಸನನ್ನು ಏನನ್ನೂ ಕೇಳಿ...",
-            "ml-IN": "മുഫാസയോട് എന്തും ചോദിക്കൂ...",
-            "pa-IN": "ਮੁਫਾਸਾ ਨੂੰ ਕੁਝ ਵੀ ਪੁਛੋ...",
-            "or-IN": "ମୁଫାସାଙ୍କୁ କିଛି ପଚାରନ୍ତୁ..."
-        }
-        
-        return placeholders.get(language_code, placeholders["en-IN"])
+        return self._chat_placeholders.get(language_code) or self._chat_placeholders[DEFAULT_LANGUAGE]
     
     def get_thinking_message(self, language_code):
         """Get thinking message in the specified language"""
-        
-        thinking_messages = {
-            "en-IN": "🦁 Mufasa is thinking...",
-            "hi-IN": "🦁 मुफासा सोच रहा है...",
-            "bn-IN": "🦁 মুফাসা চিন্তা করছে...",
-            "ta-IN": "🦁 முபாசா சிந்தித்துக்கொண்டிருக்கிறார்...",
-            "te-IN": "🦁 ముఫాసా ఆలోచిస్తున్నాడు...",
-            "mr-IN": "🦁 मुफासा विचार करत आहे...",
-            "gu-IN": "🦁 મુફાસા વિચારી રહ્યો છે...",
-            "kn-IN": "🦁 ಮುಫಾಸ ಯೋಚಿಸುತ್ತಿದ್ದಾನೆ...",
-            "ml-IN": "🦁 മുഫാസ ചിന്തിക്കുന്നു...",
-            "pa-IN": "🦁 ਮੁਫਾਸਾ ਸੋਚ ਰਿਹਾ ਹੈ...",
-            "or-IN": "🦁 ମୁଫାସା ଚିନ୍ତା କରୁଛନ୍ତି..."
-        }
-        
-        return thinking_messages.get(language_code, thinking_messages["en-IN"])
+        return self._thinking_messages.get(language_code) or self._thinking_messages[DEFAULT_LANGUAGE]
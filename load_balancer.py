@@ -0,0 +1,316 @@
+"""
+Local load balancer for multi-process serving
+Asyncio reverse proxy in front of several Streamlit workers: sticky
+sessions by cookie (a Streamlit session lives in one worker's memory),
+health-aware round robin and WebSocket passthrough
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STICKY_COOKIE = "mufasa_worker"
+HEALTH_PATH = "/_stcore/health"
+
+# Answered by the balancer itself: 200 while a backend is healthy. run.py only
+# starts the balancer once its workers are warm, so this is a readiness check.
+READY_PATH = "/_mufasa/ready"
+
+# Largest request or response head accepted, in bytes
+MAX_HEAD_SIZE = 64 * 1024
+
+_COPY_CHUNK = 64 * 1024
+
+
+class Backend:
+    """One Streamlit worker behind the balancer"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.healthy = False
+        self.active = 0
+        self.requests = 0
+        self.failures = 0
+
+    def __repr__(self):
+        return f"Backend({self.host}:{self.port}, healthy={self.healthy})"
+
+
+def parse_head(head: bytes) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Split an HTTP head into its first line and headers
+
+    Returns:
+        (start line, [(name, value), ...]) with header names as sent
+    """
+    lines = head.decode("latin-1").split("\r\n")
+    headers = []
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, _, value = line.partition(":")
+        headers.append((name.strip(), value.strip()))
+    return lines[0], headers
+
+
+def build_head(start_line: str, headers: List[Tuple[str, str]]) -> bytes:
+    """Join a start line and headers back into an HTTP head"""
+    lines = [start_line] + [f"{name}: {value}" for name, value in headers]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def get_header(headers: List[Tuple[str, str]], name: str) -> Optional[str]:
+    name = name.lower()
+    for header, value in headers:
+        if header.lower() == name:
+            return value
+    return None
+
+
+def sticky_backend(headers: List[Tuple[str, str]]) -> Optional[int]:
+    """Worker index from the sticky cookie, if the client has one"""
+    cookies = get_header(headers, "Cookie") or ""
+    for cookie in cookies.split(";"):
+        name, _, value = cookie.strip().partition("=")
+        if name == STICKY_COOKIE and value.isdigit():
+            return int(value)
+    return None
+
+
+async def probe_health(host: str, port: int, timeout: float = 5.0) -> bool:
+    """Whether a Streamlit server answers its health endpoint with 200"""
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        try:
+            writer.write(f"GET {HEALTH_PATH} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), timeout)
+        finally:
+            writer.close()
+        return status_line.split(b" ")[1:2] == [b"200"]
+    except (OSError, asyncio.TimeoutError, IndexError):
+        return False
+
+
+class LoadBalancer:
+    """Sticky-session reverse proxy over a fixed set of backends"""
+
+    def __init__(
+        self,
+        backends: List[Backend],
+        host: str = "0.0.0.0",
+        port: int = 5000,
+        health_interval: float = 2.0,
+        connect_timeout: float = 5.0
+    ):
+        """
+        Configure the balancer
+
+        Args:
+            backends: Workers to balance over; their list index is the cookie value
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            health_interval: Seconds between health checks of each backend
+            connect_timeout: Seconds to wait for a backend connection
+        """
+        self.backends = backends
+        self.host = host
+        self.port = port
+        self.health_interval = health_interval
+        self.connect_timeout = connect_timeout
+        self._round_robin = itertools.cycle(range(len(backends)))
+        self._server = None
+        self._health_task = None
+        self._stats = {
+            "connections": 0,
+            "assigned": 0,
+            "reassigned": 0,
+            "no_backend": 0
+        }
+
+    def pick(self, preferred: Optional[int]) -> Optional[int]:
+        """
+        Choose a backend for a request
+
+        Args:
+            preferred: Backend index from the client's sticky cookie
+
+        Returns:
+            The preferred backend if it is healthy, else the next healthy one
+            in round-robin order, or None if every backend is down
+        """
+        if preferred is not None and 0 <= preferred < len(self.backends) and self.backends[preferred].healthy:
+            return preferred
+        for _ in range(len(self.backends)):
+            index = next(self._round_robin)
+            if self.backends[index].healthy:
+                return index
+        return None
+
+    async def check_health(self, backend: Backend) -> bool:
+        """Probe a backend's health endpoint and record the result"""
+        healthy = await probe_health(backend.host, backend.port, self.connect_timeout)
+        if healthy != backend.healthy:
+            logger.info("%r is now %s", backend, "healthy" if healthy else "unhealthy")
+        backend.healthy = healthy
+        return healthy
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.gather(*(self.check_health(backend) for backend in self.backends))
+            await asyncio.sleep(self.health_interval)
+
+    async def _open_backend(self, preferred: Optional[int]):
+        """Connect to a healthy backend, skipping ones that refuse the connection"""
+        for _ in range(len(self.backends)):
+            index = self.pick(preferred)
+            if index is None:
+                return None, None, None
+            backend = self.backends[index]
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(backend.host, backend.port), self.connect_timeout
+                )
+                return index, reader, writer
+            except (OSError, asyncio.TimeoutError):
+                # Take it out of rotation until the next health check passes
+                backend.healthy = False
+                backend.failures += 1
+                preferred = None
+        return None, None, None
+
+    async def _handle(self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter):
+        self._stats["connections"] += 1
+        backend_writer = None
+        try:
+            try:
+                head = await client_reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+
+            start_line, headers = parse_head(head)
+            if start_line.split(" ")[1:2] == [READY_PATH]:
+                ready = any(backend.healthy for backend in self.backends)
+                client_writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok" if ready
+                                    else b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                await client_writer.drain()
+                return
+            preferred = sticky_backend(headers)
+            index, backend_reader, backend_writer = await self._open_backend(preferred)
+            if index is None:
+                self._stats["no_backend"] += 1
+                client_writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                await client_writer.drain()
+                return
+
+            backend = self.backends[index]
+            backend.active += 1
+            backend.requests += 1
+            assign_cookie = index != preferred
+            if assign_cookie:
+                self._stats["reassigned" if preferred is not None else "assigned"] += 1
+
+            upgrade = (get_header(headers, "Upgrade") or "").lower() == "websocket"
+            if not upgrade:
+                # One request per backend connection keeps the response boundaries trivial
+                headers = [(name, value) for name, value in headers if name.lower() not in ("connection", "keep-alive")]
+                headers.append(("Connection", "close"))
+            peer = client_writer.get_extra_info("peername")
+            if peer:
+                headers.append(("X-Forwarded-For", peer[0]))
+            backend_writer.write(build_head(start_line, headers))
+
+            try:
+                upstream = asyncio.ensure_future(self._copy(client_reader, backend_writer, half_close=True))
+                await self._copy_response(backend_reader, client_writer, index if assign_cookie else None)
+                upstream.cancel()
+            finally:
+                backend.active -= 1
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            for writer in (backend_writer, client_writer):
+                if writer is not None:
+                    writer.close()
+
+    async def _copy_response(self, reader, writer, cookie_index: Optional[int]):
+        """Forward the backend's response, adding the sticky cookie to its head if needed"""
+        if cookie_index is not None:
+            head = await reader.readuntil(b"\r\n\r\n")
+            start_line, headers = parse_head(head)
+            headers.append(("Set-Cookie", f"{STICKY_COOKIE}={cookie_index}; Path=/; HttpOnly; SameSite=Lax"))
+            writer.write(build_head(start_line, headers))
+        await self._copy(reader, writer)
+
+    @staticmethod
+    async def _copy(reader, writer, half_close: bool = False):
+        """Pipe bytes until EOF (request bodies and WebSocket frames alike)"""
+        try:
+            while True:
+                data = await reader.read(_COPY_CHUNK)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+            if half_close and writer.can_write_eof():
+                writer.write_eof()
+        except (ConnectionError, OSError):
+            pass
+
+    async def start(self):
+        """Check every backend once, then start listening and health checking"""
+        await asyncio.gather(*(self.check_health(backend) for backend in self.backends))
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_HEAD_SIZE)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._health_task = asyncio.ensure_future(self._health_loop())
+
+    async def serve_forever(self):
+        """Run until cancelled"""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        """Stop listening and health checking"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get balancer counters
+
+        Returns:
+            Connection and assignment counts plus per-backend health and load
+        """
+        stats = dict(self._stats)
+        stats["backends"] = [
+            {
+                "port": backend.port,
+                "healthy": backend.healthy,
+                "active": backend.active,
+                "requests": backend.requests,
+                "failures": backend.failures
+            }
+            for backend in self.backends
+        ]
+        return stats
+
+
+async def wait_until_healthy(balancer: LoadBalancer, timeout: float = 60.0) -> bool:
+    """Wait for every backend to pass a health check"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        results = await asyncio.gather(*(balancer.check_health(backend) for backend in balancer.backends))
+        if all(results):
+            return True
+        await asyncio.sleep(0.25)
+    return False
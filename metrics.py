@@ -0,0 +1,414 @@
+"""
+Request metrics
+In-process counters and latency histograms for outbound API calls, with
+Prometheus-text and JSON exporters and per-session scoping
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) shared by every latency histogram
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Set by run.py --workers to each worker's index: worker i serves its exporter on METRICS_PORT + i
+METRICS_PORT_OFFSET_ENV = "MUFASA_METRICS_PORT_OFFSET"
+
+# The registry bound to the current session; copied into worker threads with the context
+_session_registry = contextvars.ContextVar("session_registry", default=None)
+
+
+class Histogram:
+    """Fixed-bucket histogram, Prometheus style"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """Add one observation"""
+        index = 0
+        while index < len(self.buckets) and value > self.buckets[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by interpolating inside its bucket
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or 0.0 without observations
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                if index == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+
+def _label_key(labels: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in key]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class MetricsRegistry:
+    """Thread-safe store of labelled counters and histograms"""
+
+    def __init__(self, prefix: str = "mufasa"):
+        """
+        Initialize an empty registry
+
+        Args:
+            prefix: Prepended to metric names in the Prometheus export
+        """
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters = {}    # name -> label key -> value
+        self._histograms = {}  # name -> label key -> Histogram
+        self.started_at = time.time()
+
+    def _targets(self) -> List["MetricsRegistry"]:
+        # Everything recorded globally is mirrored into the bound session registry
+        session = _session_registry.get()
+        return [self, session] if session is not None and session is not self else [self]
+
+    def increment(self, name: str, amount: float = 1, **labels):
+        """Add to a counter"""
+        key = _label_key(labels)
+        for registry in self._targets():
+            with registry._lock:
+                series = registry._counters.setdefault(name, {})
+                series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        """Add an observation to a histogram"""
+        key = _label_key(labels)
+        for registry in self._targets():
+            with registry._lock:
+                series = registry._histograms.setdefault(name, {})
+                histogram = series.get(key)
+                if histogram is None:
+                    histogram = series[key] = Histogram()
+                histogram.observe(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a JSON-serializable copy of every series
+
+        Returns:
+            Dictionary with "counters" and "histograms" lists of labelled values
+        """
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(key), "value": value}
+                for name, series in self._counters.items()
+                for key, value in series.items()
+            ]
+            histograms = [
+                {
+                    "name": name,
+                    "labels": dict(key),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                    "p99": histogram.quantile(0.99)
+                }
+                for name, series in self._histograms.items()
+                for key, histogram in series.items()
+            ]
+        return {"uptime_seconds": time.time() - self.started_at, "counters": counters, "histograms": histograms}
+
+    def to_prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{metric}{_format_labels(key)} {value}")
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for key, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        bucket_labels = _format_labels(key, 'le="%s"' % le)
+                        lines.append(f"{metric}_bucket{bucket_labels} {cumulative}")
+                    lines.append(f"{metric}_sum{_format_labels(key)} {histogram.sum}")
+                    lines.append(f"{metric}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Per-endpoint rollup for dashboards
+
+        Returns:
+            One row per (service, endpoint) with request and error counts,
+            p50/p95 total and TTFB latency, bytes, compression ratios and tokens
+        """
+        rows = {}
+        with self._lock:
+            for name, series in self._counters.items():
+                for key, value in series.items():
+                    labels = dict(key)
+                    row = rows.setdefault((labels.get("service"), labels.get("endpoint")), {})
+                    if name == "http_requests_total":
+                        row["requests"] = row.get("requests", 0) + value
+                        if not labels.get("status", "").startswith(("2", "3")):
+                            row["errors"] = row.get("errors", 0) + value
+                    elif name in ("http_request_bytes_total", "http_request_uncompressed_bytes_total",
+                                  "http_response_bytes_total", "http_response_decoded_bytes_total", "tokens_total"):
+                        row[name] = row.get(name, 0) + value
+            for name in ("http_total_seconds", "http_ttfb_seconds"):
+                for key, histogram in self._histograms.get(name, {}).items():
+                    labels = dict(key)
+                    row = rows.setdefault((labels.get("service"), labels.get("endpoint")), {})
+                    row[f"{name}_p50"] = histogram.quantile(0.5)
+                    row[f"{name}_p95"] = histogram.quantile(0.95)
+
+        return [
+            {
+                "service": service,
+                "endpoint": endpoint,
+                "requests": row.get("requests", 0),
+                "errors": row.get("errors", 0),
+                "total_p50": row.get("http_total_seconds_p50", 0.0),
+                "total_p95": row.get("http_total_seconds_p95", 0.0),
+                "ttfb_p50": row.get("http_ttfb_seconds_p50", 0.0),
+                "bytes_sent": row.get("http_request_bytes_total", 0),
+                "bytes_received": row.get("http_response_bytes_total", 0),
+                # Body bytes before compression per byte on the wire (1.0: uncompressed)
+                "request_compression": _ratio(row.get("http_request_uncompressed_bytes_total", 0),
+                                              row.get("http_request_bytes_total", 0)),
+                "response_compression": _ratio(row.get("http_response_decoded_bytes_total", 0),
+                                               row.get("http_response_bytes_total", 0)),
+                "tokens": row.get("tokens_total", 0)
+            }
+            for (service, endpoint), row in sorted(rows.items(), key=lambda item: tuple(map(str, item[0])))
+        ]
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator else 1.0
+
+
+def bind_session(registry: Optional[MetricsRegistry]):
+    """
+    Mirror metrics recorded in the current context into a session registry
+
+    Call at the start of each script run; WorkerPool and StreamingTranslator
+    copy the context into their threads, so background calls are attributed
+    to the session that started them.
+    """
+    _session_registry.set(registry)
+
+
+def wire_bytes(response) -> int:
+    """
+    Body bytes read off the wire so far (before decompression)
+
+    urllib3 does not track them for chunked bodies; those return 0.
+    """
+    try:
+        return int(response.raw.tell())
+    except Exception:
+        return 0
+
+
+def response_bytes(response) -> int:
+    """
+    Size of a response body that has been read in full
+
+    Uses the bytes read off the wire when urllib3 tracks them; chunked
+    bodies fall back to the decoded size.
+    """
+    return wire_bytes(response) or len(response.content)
+
+
+def record_response(
+    registry: MetricsRegistry,
+    service: str,
+    endpoint: str,
+    response,
+    started: float,
+    connect_timing: Optional[Tuple[float, Optional[float]]] = None,
+    stream: bool = False,
+    uncompressed_bytes: Optional[int] = None
+):
+    """
+    Record one HTTP attempt that produced a response
+
+    TTFB runs from sending the request to receiving the response headers.
+    Connect covers DNS and TCP together, since urllib3 resolves the host
+    inside create_connection.
+
+    Args:
+        registry: Registry to record into
+        service: Upstream service ("sarvam", "weather")
+        endpoint: API endpoint
+        response: requests.Response
+        started: time.perf_counter() when the attempt started
+        connect_timing: (connect, tls) seconds if the attempt opened a connection
+        stream: The body is still unread; call record_stream_end once it is
+        uncompressed_bytes: Request body size before Content-Encoding
+            (default: the size sent)
+    """
+    labels = {"service": service, "endpoint": endpoint}
+    registry.increment("http_requests_total", status=response.status_code, **labels)
+    body = response.request.body if response.request is not None else None
+    sent = len(body or b"")
+    registry.increment("http_request_bytes_total", sent, **labels)
+    registry.increment(
+        "http_request_uncompressed_bytes_total", sent if uncompressed_bytes is None else uncompressed_bytes, **labels
+    )
+    registry.observe("http_ttfb_seconds", response.elapsed.total_seconds(), **labels)
+    if connect_timing is not None:
+        connect, tls = connect_timing
+        registry.observe("http_connect_seconds", connect, **labels)
+        if tls is not None:
+            registry.observe("http_tls_seconds", tls, **labels)
+    if not stream:
+        # Error bodies of streamed requests are still unread at this point
+        decoded = len(response.content)
+        record_stream_end(registry, service, endpoint, started, response_bytes(response), decoded)
+
+
+def record_stream_end(
+    registry: MetricsRegistry,
+    service: str,
+    endpoint: str,
+    started: float,
+    body_bytes: int,
+    decoded_bytes: Optional[int] = None
+):
+    """
+    Record the total time and body size of a response once it has been read
+
+    Args:
+        body_bytes: Bytes received on the wire
+        decoded_bytes: Body size after Content-Encoding was removed
+            (default: body_bytes)
+    """
+    labels = {"service": service, "endpoint": endpoint}
+    registry.observe("http_total_seconds", time.perf_counter() - started, **labels)
+    registry.increment("http_response_bytes_total", body_bytes, **labels)
+    registry.increment(
+        "http_response_decoded_bytes_total", body_bytes if decoded_bytes is None else decoded_bytes, **labels
+    )
+
+
+def record_error(registry: MetricsRegistry, service: str, endpoint: str, started: float, error: Exception):
+    """Record one HTTP attempt that failed without a response"""
+    labels = {"service": service, "endpoint": endpoint}
+    registry.increment("http_requests_total", status=type(error).__name__, **labels)
+    registry.observe("http_total_seconds", time.perf_counter() - started, **labels)
+
+
+def record_usage(registry: MetricsRegistry, service: str, endpoint: str, usage: Optional[Dict[str, Any]]):
+    """Count the prompt and completion tokens reported in a response's usage block"""
+    if not usage:
+        return
+    for kind in ("prompt", "completion"):
+        tokens = usage.get(f"{kind}_tokens")
+        if tokens:
+            registry.increment("tokens_total", tokens, service=service, endpoint=endpoint, kind=kind)
+
+
+def worker_metrics_port(port: int) -> int:
+    """The configured METRICS_PORT shifted by this worker's index (unchanged in a single process)"""
+    return port + int(os.environ.get(METRICS_PORT_OFFSET_ENV) or 0)
+
+
+def start_metrics_server(registry: MetricsRegistry, port: int, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+    """
+    Serve the registry over HTTP from a daemon thread
+
+    Args:
+        registry: Registry to export
+        port: Port to listen on (0 picks a free port)
+        host: Interface to bind
+
+    Returns:
+        The running server (server_address holds the bound port)
+    """
+    # Imported here: http.server is only needed when the exporter is enabled
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        """Serves /metrics (Prometheus text) and /metrics.json"""
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            registry = self.server.registry
+            if self.path.startswith("/metrics.json"):
+                body = json.dumps(registry.snapshot()).encode("utf-8")
+                content_type = "application/json"
+            elif self.path.startswith("/metrics"):
+                body = registry.to_prometheus().encode("utf-8")
+                content_type = "text/plain; version=0.0.4"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.registry = registry
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics-server").start()
+    return server
+
+
+def start_json_log(registry: MetricsRegistry, interval: float) -> threading.Event:
+    """
+    Log a JSON snapshot of the registry every interval seconds
+
+    Returns:
+        Event that stops the logger when set
+    """
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            logger.info("metrics %s", json.dumps(registry.snapshot()))
+
+    threading.Thread(target=run, daemon=True, name="metrics-log").start()
+    return stop
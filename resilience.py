@@ -0,0 +1,345 @@
+"""
+Resilience helpers for upstream API calls
+Token-bucket rate limiting, retry with exponential backoff and jitter,
+a circuit breaker and request hedging, all reporting into shared counters
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+
+class RateLimitExceeded(Exception):
+    """Raised when the client-side rate limiter has no token within the wait limit"""
+
+
+class CircuitOpenError(Exception):
+    """Raised while the circuit breaker is failing fast"""
+
+
+class ResilienceStats:
+    """Thread-safe counters for retries, rate limiting and circuit breaker events"""
+
+    def __init__(self):
+        """Initialize all counters at zero"""
+        self._lock = threading.Lock()
+        self._counters = {
+            "retries": 0,
+            "rate_limiter_waits": 0,
+            "rate_limiter_rejections": 0,
+            "circuit_open_rejections": 0,
+            "circuit_opened": 0,
+            "upstream_429": 0,
+            "upstream_5xx": 0,
+            "hedges_fired": 0,
+            "hedges_won": 0,
+            "hedges_denied": 0
+        }
+
+    def increment(self, name: str, amount: int = 1):
+        """Add to a counter"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def snapshot(self) -> Dict[str, int]:
+        """Get a copy of every counter"""
+        with self._lock:
+            return dict(self._counters)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by every thread in the process"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, stats: Optional[ResilienceStats] = None):
+        """
+        Initialize the bucket full
+
+        Args:
+            rate: Tokens (requests) added per second
+            capacity: Maximum burst size (default: one second of tokens)
+            stats: Counters for waits and rejections
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.stats = stats
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token if one is available; otherwise return seconds until one is"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, max_wait: float = 10.0) -> bool:
+        """
+        Wait for a token
+
+        Args:
+            max_wait: Longest time to wait in seconds
+
+        Returns:
+            True once a token was taken, False if none arrived within max_wait
+        """
+        deadline = time.monotonic() + max_wait
+        waited = False
+        while True:
+            delay = self._reserve()
+            if delay == 0:
+                if waited and self.stats is not None:
+                    self.stats.increment("rate_limiter_waits")
+                return True
+            if time.monotonic() + delay > deadline:
+                if self.stats is not None:
+                    self.stats.increment("rate_limiter_rejections")
+                return False
+            waited = True
+            time.sleep(delay)
+
+
+class CircuitBreaker:
+    """Fails fast after repeated upstream failures, then probes for recovery"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, stats: Optional[ResilienceStats] = None):
+        """
+        Initialize the breaker closed
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before letting a probe through
+            stats: Counters for open/reject events
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.stats = stats
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent
+
+        Returns:
+            False while open (and while a half-open probe is already in flight)
+        """
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+        if self.stats is not None:
+            self.stats.increment("circuit_open_rejections")
+        return False
+
+    def release(self):
+        """Give up a half-open probe that never reached the upstream, without changing state"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self):
+        """Close the circuit after a successful request"""
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Count a failed request, opening the circuit at the threshold"""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN and self.stats is not None:
+                    self.stats.increment("circuit_opened")
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter that honours Retry-After"""
+
+    # Statuses worth retrying: rate limited or a transient server failure
+    RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+    # Statuses that mean the request was not processed, so even
+    # non-idempotent calls (chat completions) can be retried safely
+    UNPROCESSED_STATUSES = frozenset((429, 503))
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 8.0, max_retry_after: float = 30.0):
+        """
+        Initialize the policy
+
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff for the first retry in seconds
+            max_delay: Cap on the exponential backoff
+            max_retry_after: Longest Retry-After honoured; longer waits are not retried
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+    def should_retry_status(self, status_code: int, idempotent: bool) -> bool:
+        """Check whether a response status may be retried"""
+        if status_code not in self.RETRY_STATUSES:
+            return False
+        return idempotent or status_code in self.UNPROCESSED_STATUSES
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Compute how long to wait before the next attempt
+
+        Args:
+            attempt: Zero-based index of the retry
+            retry_after: Retry-After header value, if any
+
+        Returns:
+            Seconds to wait, or None if the server asked for longer than max_retry_after
+        """
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            if server_delay > self.max_retry_after:
+                return None
+            return server_delay + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class HedgePolicy:
+    """
+    Decides when a slow request gets a backup copy (request hedging)
+
+    The hedge delay is a percentile of recently observed latencies, so only
+    requests slower than most of their peers are duplicated. A token budget
+    shared by every thread caps the duplicates at a fixed share of requests.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.97,
+        budget: float = 0.05,
+        burst: float = 2.0,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.05,
+        max_delay: float = 10.0,
+        window: int = 200,
+        min_samples: int = 20,
+        stats: Optional[ResilienceStats] = None
+    ):
+        """
+        Initialize the policy with a full budget
+
+        Args:
+            percentile: Latency percentile (0-1) after which a backup is sent;
+                about 1 - percentile of requests are hedged
+            budget: Backup requests allowed per request, e.g. 0.05 for at most
+                5% extra load; keep it above 1 - percentile
+            burst: Backups that may be sent back to back while the budget lasts
+            initial_delay: Hedge delay until min_samples latencies are known
+            min_delay: Lower bound on the hedge delay in seconds
+            max_delay: Upper bound on the hedge delay in seconds
+            window: Recent latencies kept per kind of request
+            min_samples: Latencies needed before the percentile is trusted
+            stats: Counters for hedges fired, won and denied by the budget
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.stats = stats
+        self._tokens = burst
+        self._latencies = {}
+        self._lock = threading.Lock()
+
+    def record_latency(self, seconds: float, key: str = "default"):
+        """Remember how long a successful request of this kind took"""
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window)
+            latencies.append(seconds)
+
+    def delay(self, key: str = "default") -> float:
+        """Seconds to wait for a response before sending a backup request"""
+        with self._lock:
+            latencies = sorted(self._latencies.get(key, ()))
+        if len(latencies) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            delay = latencies[min(len(latencies) - 1, int(self.percentile * len(latencies)))]
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def start_request(self):
+        """Count a request toward the budget"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.budget)
+
+    def try_hedge(self) -> bool:
+        """
+        Take budget for one backup request
+
+        Returns:
+            True if the backup may be sent, False if the budget is spent
+        """
+        with self._lock:
+            allowed = self._tokens >= 1
+            if allowed:
+                self._tokens -= 1
+        if self.stats is not None:
+            self.stats.increment("hedges_fired" if allowed else "hedges_denied")
+        return allowed
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def resilience_summary(stats: ResilienceStats, breaker: CircuitBreaker) -> Dict[str, Any]:
+    """Combine counters with the current circuit breaker state"""
+    summary = stats.snapshot()
+    summary["circuit_state"] = breaker.state
+    return summary
@@ -0,0 +1,191 @@
+"""
+Chat response cache
+LRU + TTL cache for chat completions with in-flight request coalescing, so
+identical prompts from different sessions share one upstream call
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?।॥]+$")
+
+
+# Opening prompts that repeat across sessions and get short replies, so sharing
+# one reply (fetched whole, not streamed) costs little. Normalized.
+CANNED_PROMPTS = frozenset((
+    "hi", "hello", "hey", "namaste", "नमस्ते", "hello mufasa", "hi mufasa",
+    "who are you", "who made you", "who created you", "what is your name", "what can you do", "help"
+))
+
+
+def normalize_content(content: str) -> str:
+    """Normalize a message for keying: case, whitespace and trailing punctuation"""
+    return _TRAILING_PUNCTUATION.sub("", _WHITESPACE.sub(" ", content.strip().lower()))
+
+
+def is_canned_prompt(content: str) -> bool:
+    """Whether a message is one of the opening prompts in CANNED_PROMPTS"""
+    return normalize_content(content) in CANNED_PROMPTS
+
+
+class _InFlight:
+    """Result slot shared by callers waiting on the same upstream request"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class ResponseCache:
+    """Thread-safe, opt-in cache in front of SarvamClient.chat_completion"""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 10 * 60,
+        context_messages: int = 3,
+        max_temperature: float = 0.3
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum responses kept before LRU eviction
+            ttl_seconds: Seconds a response stays valid
+            context_messages: Trailing non-system messages that form the key
+            max_temperature: Requests at or below this temperature are cached
+                without the caller opting in
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.context_messages = context_messages
+        self.max_temperature = max_temperature
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (result, expires_at)
+        self._in_flight = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "expirations": 0
+        }
+
+    def should_cache(self, temperature: float, opt_in: Optional[bool] = None) -> bool:
+        """
+        Decide whether a request may be served from the cache
+
+        Args:
+            temperature: Sampling temperature of the request
+            opt_in: True/False forces the decision; None applies the temperature threshold
+
+        Returns:
+            True if the request should go through the cache
+        """
+        if opt_in is not None:
+            return opt_in
+        return temperature <= self.max_temperature
+
+    def make_key(self, payload: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a chat completion payload
+
+        Args:
+            payload: Request body from build_chat_payload
+
+        Returns:
+            Hex digest of the system message, the normalized trailing context
+            and every sampling parameter
+        """
+        messages: List[Dict[str, str]] = payload.get("messages", [])
+        system = [m["content"] for m in messages if m.get("role") == "system"]
+        turns = [m for m in messages if m.get("role") != "system"][-self.context_messages:]
+
+        key_data = {
+            "system": system,
+            "context": [[m.get("role"), normalize_content(m.get("content", ""))] for m in turns],
+            "params": {name: value for name, value in payload.items() if name not in ("messages", "stream")}
+        }
+        encoded = json.dumps(key_data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return a cached response, or compute it once for all concurrent callers
+
+        Args:
+            key: Key from make_key
+            compute: Performs the upstream request and returns a result dict
+
+        Returns:
+            Result dictionary; cache hits carry "cached": True
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires_at = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return dict(result, cached=True)
+                del self._entries[key]
+                self._stats["expirations"] += 1
+
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = self._in_flight[key] = _InFlight()
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            in_flight.done.wait()
+            return dict(in_flight.result, cached=True)
+
+        try:
+            result = compute()
+        except Exception as e:
+            result = {"success": False, "error": f"Unexpected error: {str(e)}"}
+
+        with self._lock:
+            # Only successful answers are reused by later requests
+            if result.get("success"):
+                self._entries[key] = (result, time.time() + self.ttl_seconds)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._stats["evictions"] += 1
+            del self._in_flight[key]
+
+        in_flight.result = result
+        in_flight.done.set()
+        return result
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hit/miss/coalesced/eviction counts and current size
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+            stats["in_flight"] = len(self._in_flight)
+
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_ratio"] = (stats["hits"] + stats["coalesced"]) / lookups if lookups else 0.0
+        return stats
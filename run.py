@@ -2,12 +2,21 @@
 """
 Simple runner script for Mufasa AI
 This script provides an easy way to start the application
+
+    python run.py                      # one Streamlit process on port 5000
+    python run.py --workers 4          # four worker processes behind a sticky-session proxy
+    python run.py --check-connection   # also test the Sarvam API during warm-up
+    python run.py --profile-startup    # print app.py's import-time breakdown and exit
 """
 
+import argparse
+import asyncio
 import subprocess
 import sys
 import os
 
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     try:
@@ -29,10 +38,149 @@ def check_api_key():
         print("\nOr create a .env file with:")
         print("SARVAM_API_KEY=your_api_key_here")
         print("\nThe app will start anyway but may not work properly without a valid API key.")
-        input("Press Enter to continue anyway...")
+        # No one to answer in a container or under a process manager
+        if sys.stdin.isatty():
+            input("Press Enter to continue anyway...")
+
+def start_worker(port, state_dir=None, cwd=None, quiet=False, address="127.0.0.1", check_connection=False,
+                 worker_index=None):
+    """
+    Start one Streamlit worker process
+    
+    Args:
+        port: Port for the worker
+        state_dir: Directory for state shared between workers (caches, conversations)
+        cwd: Working directory, where .streamlit/secrets.toml is looked up
+        quiet: Discard the worker's console output
+        address: Interface to listen on (None: Streamlit's default, all interfaces)
+        check_connection: Let the warm-up call SarvamClient.test_connection
+        worker_index: Position among run.py --workers workers; offsets the
+            worker's METRICS_PORT so the exporters do not collide
+    
+    Returns:
+        The worker's Popen handle
+    """
+    from metrics import METRICS_PORT_OFFSET_ENV
+    from shared_cache import SHARED_STATE_ENV
+    from startup import WARMUP_CHECK_ENV, WARMUP_TOKEN_ENV, warmup_token
+    
+    env = dict(os.environ)
+    env[WARMUP_TOKEN_ENV] = warmup_token()
+    if state_dir:
+        env[SHARED_STATE_ENV] = os.path.abspath(state_dir)
+    if check_connection:
+        env[WARMUP_CHECK_ENV] = "1"
+    if worker_index is not None:
+        env[METRICS_PORT_OFFSET_ENV] = str(worker_index)
+    command = [
+        sys.executable, "-m", "streamlit", "run", os.path.join(APP_DIR, "app.py"),
+        "--server.port", str(port),
+        "--server.headless", "true"
+    ]
+    if address:
+        command += ["--server.address", address]
+    return subprocess.Popen(command, env=env, cwd=cwd or os.getcwd(),
+        stdout=subprocess.DEVNULL if quiet else None,
+        stderr=subprocess.DEVNULL if quiet else None)
+
+def stop_workers(workers):
+    """Terminate worker processes, killing any that do not exit in time"""
+    for worker in workers:
+        worker.terminate()
+    for worker in workers:
+        try:
+            worker.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            worker.kill()
+
+async def warm_up_workers(ports, processes=None):
+    """
+    Run app.py's warm-up in each worker as soon as it starts
+    
+    Imports, cached resources (localization and mascot tables, caches,
+    stores) and pooled API connections are then ready for the first user.
+    A worker that fails to warm up still serves, just cold.
+    
+    Args:
+        ports: Ports of the workers to warm up
+        processes: The workers' Popen handles, in the same order
+    """
+    from startup import describe_warm_up, warm_up_worker
+    
+    async def warm(port, process):
+        try:
+            print(describe_warm_up(port, await warm_up_worker("127.0.0.1", port, process=process)))
+        except Exception as e:
+            print(describe_warm_up(port, None, e))
+    
+    await asyncio.gather(*(warm(port, process) for port, process in zip(ports, processes or [None] * len(ports))))
+
+async def serve_workers(balancer, warm_up=True):
+    """Wait for the workers to come up and warm them up, then proxy until interrupted"""
+    from load_balancer import wait_until_healthy
+    
+    if not await wait_until_healthy(balancer):
+        print("⚠️  Some workers did not become healthy; serving with the ones that did")
+    if warm_up:
+        # The proxy only starts listening (and passing health checks) once this is done
+        await warm_up_workers([backend.port for backend in balancer.backends if backend.healthy])
+    await balancer.serve_forever()
+
+def run_workers(workers, port, state_dir, warm_up=True, check_connection=False):
+    """Run several Streamlit workers behind the local load balancer"""
+    from load_balancer import Backend, LoadBalancer
+    
+    worker_ports = [port + 1 + i for i in range(workers)]
+    processes = [
+        start_worker(worker_port, state_dir, check_connection=check_connection, worker_index=index)
+        for index, worker_port in enumerate(worker_ports)
+    ]
+    balancer = LoadBalancer([Backend("127.0.0.1", worker_port) for worker_port in worker_ports], port=port)
+    try:
+        asyncio.run(serve_workers(balancer, warm_up))
+    finally:
+        stop_workers(processes)
+
+def run_single(port, warm_up=True, check_connection=False):
+    """Run one Streamlit process on port, or behind the balancer on port while it warms up"""
+    if warm_up:
+        # The balancer only listens, and answers READY_PATH, once the worker is warm
+        run_workers(1, port, None, warm_up, check_connection)
+        return
+    process = start_worker(port, address=None, check_connection=check_connection)
+    try:
+        process.wait()
+    finally:
+        stop_workers([process])
+
+def profile_startup():
+    """Print what importing app.py costs a freshly started worker"""
+    from startup import format_import_profile, profile_imports
+    
+    print(format_import_profile(profile_imports()))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Start Mufasa AI")
+    parser.add_argument("--port", type=int, default=5000, help="port the application is served on")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Streamlit worker processes; more than one starts a sticky-session proxy on --port "
+                             "and the workers on the following ports")
+    parser.add_argument("--state-dir", default=".mufasa_state",
+                        help="directory for caches and conversations shared by the workers")
+    parser.add_argument("--no-warm-up", dest="warm_up", action="store_false",
+                        help="skip building cached resources and opening API connections at startup")
+    parser.add_argument("--check-connection", action="store_true",
+                        help="call the Sarvam API once during warm-up (one chat completion per worker)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print app.py's import-time breakdown and exit")
+    return parser.parse_args(argv)
 
 def main():
     """Main function to run the application"""
+    args = parse_args()
+    if args.profile_startup:
+        profile_startup()
+        return
     print("🦁 Starting Mufasa AI...")
     print("=" * 50)
     
@@ -45,15 +193,15 @@ def main():
     # Start the application
     try:
         print("🚀 Launching Streamlit application...")
-        print("📱 Application will be available at: http://localhost:5000")
+        print(f"📱 Application will be available at: http://localhost:{args.port}")
         print("🛑 Press Ctrl+C to stop the application")
         print("=" * 50)
         
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", "app.py",
-            "--server.port", "5000",
-            "--server.headless", "true"
-        ])
+        if args.workers > 1:
+            print(f"⚙️  Serving with {args.workers} worker processes (shared state in {args.state_dir})")
+            run_workers(args.workers, args.port, args.state_dir, args.warm_up, args.check_connection)
+        else:
+            run_single(args.port, args.warm_up, args.check_connection)
     except KeyboardInterrupt:
         print("\n👋 Mufasa AI stopped. Goodbye!")
     except Exception as e:
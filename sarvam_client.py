@@ -1,19 +1,556 @@
 import requests
+import contextvars
+import gzip
 import json
 import os
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Union, Tuple
+
+from http_session import ConnectionStats, create_pooled_session, preconnect
+from language_support import SHARED_SCRIPTS, detect_script
+from metrics import MetricsRegistry, record_error, record_response, record_stream_end, record_usage, wire_bytes
+from response_cache import ResponseCache
+from resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgePolicy,
+    RateLimitExceeded,
+    ResilienceStats,
+    RetryPolicy,
+    TokenBucket,
+    resilience_summary
+)
+from text_chunking import split_for_translation
+from translation_cache import TranslationCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_BASE_URL = "https://api.sarvam.ai/v1"
+
+# Default timeouts (seconds) per API endpoint; a (connect, read) tuple is also accepted
+DEFAULT_TIMEOUTS = {
+    "chat/completions": 30,
+    "translate": 15,
+    "detect-language": 10
+}
+
+TIMEOUT_ERROR = "Request timed out. Please check your internet connection and try again."
+CONNECTION_ERROR = "Connection error. Please check your internet connection."
+INVALID_JSON_ERROR = "Invalid JSON response from API"
+RATE_LIMIT_ERROR = "Rate limit exceeded. Please try again later."
+CIRCUIT_OPEN_ERROR = "Sarvam AI is temporarily unavailable. Please try again in a moment."
+
+# Endpoints that are safe to retry after any transient failure
+IDEMPOTENT_ENDPOINTS = frozenset(("translate", "detect-language"))
+
+# Maximum characters accepted in one translate "input"
+TRANSLATE_INPUT_LIMIT = 1000
+
+# Strings packed into one translate request are joined with this separator
+BATCH_SEPARATOR = "\n"
+
+# Maximum chunks of one long text translated in parallel
+TRANSLATE_MAX_WORKERS = 8
+
+# Response encodings offered to the API: gzip and deflate, plus br when the
+# brotli package is installed (urllib3 decodes whatever it has a decoder for)
+ACCEPT_ENCODING = requests.utils.DEFAULT_ACCEPT_ENCODING
+
+# Request bodies smaller than this are sent uncompressed even when compression is on
+REQUEST_COMPRESSION_MIN_BYTES = 1024
+
+# gzip level for request bodies: 6 gets within a few percent of 9 at a fraction of the CPU
+REQUEST_COMPRESSION_LEVEL = 6
+
+# Chat request templates kept per client (one per language and sampling settings in practice)
+CHAT_TEMPLATE_CACHE_SIZE = 64
+
+# Payload builders and response-to-dict mapping shared by the sync and async clients
+
+def build_chat_payload(
+    messages: List[Dict[str, str]],
+    model: str = "sarvam-m",
+    temperature: float = 0.8,
+    top_p: float = 0.9,
+    max_tokens: Optional[int] = None,
+    stop: Optional[List[str]] = None,
+    frequency_penalty: float = 0.0,
+    presence_penalty: float = 0.0,
+    wiki_grounding: bool = False
+) -> Dict[str, Any]:
+    """Build the JSON body for the chat completions endpoint"""
+    payload = {
+        "messages": messages,
+        "model": model,
+        "temperature": temperature,
+        "top_p": top_p,
+        "frequency_penalty": frequency_penalty,
+        "presence_penalty": presence_penalty,
+        "wiki_grounding": wiki_grounding
+    }
+    
+    # Add optional parameters
+    if max_tokens is not None:
+        payload["max_tokens"] = max_tokens
+    
+    if stop is not None:
+        payload["stop"] = stop
+    
+    return payload
+
+def encode_json(value: Any) -> bytes:
+    """
+    Compact JSON request body
+    
+    UTF-8 rather than \\u escapes (Indic text is half the size) and no
+    whitespace; uses orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+class ChatRequestTemplate:
+    """
+    Chat completions body with its static prefix encoded once
+    
+    The system message and sampling parameters are the same for every turn
+    in a language, so they are serialized when the template is built; each
+    request only encodes its own messages and appends them.
+    """
+    
+    __slots__ = ("_prefix",)
+    
+    def __init__(self, system_message: Dict[str, Any], params: Dict[str, Any]):
+        """
+        Encode the static prefix
+        
+        Args:
+            system_message: First message of every request
+            params: Body fields other than messages (model, temperature, ...)
+        """
+        head = encode_json(params)
+        # '{"model":...,"messages":[<system message>' with the rest appended per request
+        self._prefix = (head[:-1] + b"," if len(head) > 2 else b"{") + b'"messages":[' + encode_json(system_message)
+    
+    def encode(self, messages: List[Dict[str, Any]], stream: bool = False) -> bytes:
+        """Body for the system message followed by messages"""
+        suffix = b'],"stream":true}' if stream else b"]}"
+        if not messages:
+            return self._prefix + suffix
+        # One encode call for all dynamic messages, without its brackets
+        return b"".join((self._prefix, b",", encode_json(messages)[1:-1], suffix))
+
+def build_translate_payload(
+    text: str,
+    source_language: str = "en-IN",
+    target_language: str = "hi-IN",
+    speaker_gender: str = "Male",
+    mode: str = "formal",
+    model: str = "mayura:v1"
+) -> Dict[str, Any]:
+    """Build the JSON body for the translate endpoint"""
+    return {
+        "input": text,
+        "source_language_code": source_language,
+        "target_language_code": target_language,
+        "speaker_gender": speaker_gender,
+        "mode": mode,
+        "model": model,
+        "enable_preprocessing": True
+    }
+
+def resolve_base_url(base_url: Optional[str] = None) -> str:
+    """Pick the API base URL: explicit argument, then SARVAM_BASE_URL, then the public API"""
+    return (base_url or os.environ.get("SARVAM_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+
+def _close_response(future):
+    """Release the connection of a hedged request that lost the race"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+def error_result(message: str) -> Dict[str, Any]:
+    """Build a failed result dictionary"""
+    return {
+        "success": False,
+        "error": message
+    }
+
+def parse_chat_response(status_code: int, body: bytes) -> Dict[str, Any]:
+    """
+    Map a chat completions HTTP response to a result dictionary
+    
+    Args:
+        status_code: HTTP status code
+        body: Raw response body
+        
+    Returns:
+        Dictionary with success status and response/error message
+        
+    Raises:
+        json.JSONDecodeError: If a 200 response body is not valid JSON
+    """
+    # Check if request was successful
+    if status_code == 200:
+        data = json.loads(body)
+        
+        # Extract the message from the response
+        if "choices" in data and len(data["choices"]) > 0:
+            message = data["choices"][0]["message"]["content"]
+            return {
+                "success": True,
+                "message": message,
+                "raw_response": data
+            }
+        else:
+            return error_result("No response choices found in API response")
+    
+    elif status_code == 401:
+        return error_result("Invalid API key. Please check your SARVAM_API_KEY environment variable.")
+    
+    elif status_code == 429:
+        return error_result(RATE_LIMIT_ERROR)
+    
+    elif status_code == 500:
+        return error_result("Server error. Please try again later.")
+    
+    else:
+        # Try to get error message from response
+        try:
+            error_data = json.loads(body)
+            error_message = error_data.get("error", {}).get("message", f"HTTP {status_code}")
+        except:
+            error_message = f"HTTP {status_code}"
+        
+        return error_result(f"API request failed: {error_message}")
+
+def parse_translate_response(status_code: int, body: bytes) -> Dict[str, Any]:
+    """Map a translate HTTP response to a result dictionary"""
+    if status_code == 200:
+        data = json.loads(body)
+        translated_text = data.get("translated_text", "")
+        return {
+            "success": True,
+            "translated_text": translated_text,
+            "raw_response": data
+        }
+    else:
+        return error_result(f"Translation failed: HTTP {status_code}")
+
+def parse_detect_response(status_code: int, body: bytes) -> Dict[str, Any]:
+    """Map a detect-language HTTP response to a result dictionary"""
+    if status_code == 200:
+        data = json.loads(body)
+        return {
+            "success": True,
+            "detected_language": data.get("detected_language"),
+            "confidence": data.get("confidence"),
+            "raw_response": data
+        }
+    else:
+        return error_result(f"Language detection failed: HTTP {status_code}")
 
 class SarvamClient:
     """Client for interacting with Sarvam AI API"""
     
-    def __init__(self, api_key: str):
-        """Initialize the Sarvam client with API key"""
+    def __init__(
+        self,
+        api_key: str,
+        pool_connections: int = 4,
+        pool_maxsize: int = 32,
+        keep_alive: bool = True,
+        timeouts: Optional[Dict[str, Union[float, Tuple[float, float]]]] = None,
+        translation_cache: Optional[TranslationCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        base_url: Optional[str] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        compress_requests: bool = False,
+        compression_min_bytes: int = REQUEST_COMPRESSION_MIN_BYTES
+    ):
+        """
+        Initialize the Sarvam client with API key
+        
+        Args:
+            api_key: Sarvam AI subscription key
+            pool_connections: Number of host pools kept by the HTTP session
+            pool_maxsize: Maximum keep-alive connections per host
+            keep_alive: Reuse connections between requests
+            timeouts: Per-endpoint timeout overrides, keyed like DEFAULT_TIMEOUTS
+            translation_cache: Cache consulted before every translate request
+            response_cache: Opt-in cache for chat completions
+            rate_limit: Requests per second allowed across all threads (None: unlimited)
+            rate_burst: Burst size for the rate limiter
+            retry_policy: Backoff policy for transient failures
+            circuit_breaker: Breaker that fails fast while the API is down
+            base_url: API base URL, e.g. a local mock server (default:
+                SARVAM_BASE_URL, then the public API)
+            metrics: Registry receiving per-request timings, sizes, status
+                codes and token usage (default: a private registry)
+            hedge_policy: Send a backup chat completion when the first one is
+                slower than the policy's latency percentile (default: no hedging)
+            compress_requests: gzip request bodies of compression_min_bytes or
+                more; an endpoint that answers 415 gets the request again
+                uncompressed and is not sent compressed bodies after that
+            compression_min_bytes: Smallest body worth compressing
+        """
         self.api_key = api_key
-        self.base_url = "https://api.sarvam.ai/v1"
+        self.base_url = resolve_base_url(base_url)
         self.headers = {
             "api-subscription-key": api_key,
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING
         }
+        self._compressed_headers = dict(self.headers, **{"Content-Encoding": "gzip"})
+        self.compress_requests = compress_requests
+        self.compression_min_bytes = compression_min_bytes
+        # Endpoints that rejected a compressed body with 415 Unsupported Media Type
+        self._uncompressed_endpoints = set()
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.translation_cache = translation_cache
+        self.response_cache = response_cache
+        
+        self.resilience_stats = ResilienceStats()
+        self.rate_limiter = None
+        if rate_limit:
+            self.rate_limiter = TokenBucket(rate_limit, rate_burst, stats=self.resilience_stats)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.circuit_breaker.stats = self.resilience_stats
+        self.hedge_policy = hedge_policy
+        self._hedge_executor = None
+        if hedge_policy is not None:
+            hedge_policy.stats = self.resilience_stats
+            # Hedged requests wait on worker threads so the caller can take whichever answers first
+            self._hedge_executor = ThreadPoolExecutor(max_workers=pool_maxsize, thread_name_prefix="sarvam-hedge")
+        
+        self.metrics = metrics or MetricsRegistry()
+        
+        # (system message, sampling parameters) -> ChatRequestTemplate, LRU
+        self._chat_templates = OrderedDict()
+        self._chat_templates_lock = threading.Lock()
+        
+        # One pooled session shared by every thread/session using this client
+        self.connection_stats = ConnectionStats()
+        self.session = create_pooled_session(
+            self.connection_stats,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive
+        )
+    
+    def _request_body(self, endpoint: str, body: bytes) -> Tuple[bytes, Dict[str, str]]:
+        """Body and headers to send: gzipped when compression is on and pays off for this endpoint"""
+        if (not self.compress_requests or len(body) < self.compression_min_bytes
+                or endpoint in self._uncompressed_endpoints):
+            return body, self.headers
+        compressed = gzip.compress(body, compresslevel=REQUEST_COMPRESSION_LEVEL, mtime=0)
+        if len(compressed) >= len(body):
+            return body, self.headers
+        return compressed, self._compressed_headers
+    
+    def _post(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        stream: bool = False,
+        body: Optional[bytes] = None
+    ) -> requests.Response:
+        """
+        Send a JSON POST to an API endpoint over the pooled session
+        
+        Goes through the circuit breaker and rate limiter, and retries
+        transient failures with backoff. Chat completions are not idempotent,
+        so they are only retried when the request was certainly not processed
+        (429/503 or a connect timeout). The body is gzipped when request
+        compression is on (see _request_body).
+        
+        Args:
+            endpoint: API endpoint
+            payload: Request body
+            stream: Leave the response body unread
+            body: payload already encoded (default: encode_json(payload))
+        
+        Raises:
+            CircuitOpenError: The circuit breaker is failing fast
+            RateLimitExceeded: No rate limiter token became available in time
+            requests.exceptions.RequestException: The last attempt failed
+        """
+        idempotent = endpoint in IDEMPOTENT_ENDPOINTS
+        if body is None:
+            body = encode_json(payload)
+        wire_body, headers = self._request_body(endpoint, body)
+        attempt = 0
+        while True:
+            # Take the rate limiter token first: a half-open probe admitted by
+            # allow() must reach the upstream, or the breaker never resolves it
+            if self.rate_limiter is not None and not self.rate_limiter.acquire():
+                raise RateLimitExceeded(RATE_LIMIT_ERROR)
+            if not self.circuit_breaker.allow():
+                raise CircuitOpenError(CIRCUIT_OPEN_ERROR)
+            
+            self.connection_stats.record_request()
+            self.connection_stats.pop_connect_timing()
+            started = time.perf_counter()
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/{endpoint}",
+                    headers=headers,
+                    data=wire_body,
+                    timeout=self.timeouts.get(endpoint, 30),
+                    stream=stream
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                record_error(self.metrics, "sarvam", endpoint, started, e)
+                self.circuit_breaker.record_failure()
+                retryable = idempotent or isinstance(e, requests.exceptions.ConnectTimeout)
+                if not retryable or attempt >= self.retry_policy.max_retries:
+                    raise
+                delay = self.retry_policy.delay(attempt)
+            except requests.exceptions.RequestException as e:
+                record_error(self.metrics, "sarvam", endpoint, started, e)
+                self.circuit_breaker.record_failure()
+                raise
+            except BaseException:
+                # Neither an upstream success nor failure: let the next call probe instead
+                self.circuit_breaker.release()
+                raise
+            else:
+                # Streamed bodies are recorded in full once they have been read
+                record_response(
+                    self.metrics, "sarvam", endpoint, response, started,
+                    connect_timing=self.connection_stats.pop_connect_timing(),
+                    stream=stream and response.status_code == 200,
+                    uncompressed_bytes=len(body)
+                )
+                if response.status_code == 429:
+                    self.resilience_stats.increment("upstream_429")
+                elif response.status_code >= 500:
+                    self.resilience_stats.increment("upstream_5xx")
+                
+                if response.status_code >= 500:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+                
+                if response.status_code == 415 and wire_body is not body:
+                    # The endpoint does not take compressed bodies: resend as is and stop compressing for it
+                    self._uncompressed_endpoints.add(endpoint)
+                    response.close()
+                    wire_body, headers = body, self.headers
+                    continue
+                
+                if (attempt >= self.retry_policy.max_retries
+                        or not self.retry_policy.should_retry_status(response.status_code, idempotent)):
+                    return response
+                
+                delay = self.retry_policy.delay(attempt, response.headers.get("Retry-After"))
+                if delay is None:
+                    # The server asked for a longer back-off than we are willing to wait
+                    return response
+                response.close()
+            
+            self.resilience_stats.increment("retries")
+            time.sleep(delay)
+            attempt += 1
+    
+    def _post_hedged(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        stream: bool = False,
+        body: Optional[bytes] = None
+    ) -> requests.Response:
+        """
+        _post with a backup request if no response arrives within the hedge delay
+        
+        The first successful response wins. The other request is skipped if
+        it has not started, or closed as soon as its response arrives (a
+        streamed reply then stops generating).
+        
+        Raises:
+            The exceptions of _post, when every request sent failed
+        """
+        policy = self.hedge_policy
+        # Streamed requests return at the first byte, others after the whole body
+        key = f"{endpoint}:{'stream' if stream else 'full'}"
+        policy.start_request()
+        
+        def attempt():
+            started = time.perf_counter()
+            response = self._post(endpoint, payload, stream=stream, body=body)
+            if response.status_code == 200:
+                policy.record_latency(time.perf_counter() - started, key)
+            return response
+        
+        primary = self._hedge_executor.submit(contextvars.copy_context().run, attempt)
+        wait([primary], timeout=policy.delay(key))
+        if primary.done() or not policy.try_hedge():
+            return primary.result()
+        
+        backup = self._hedge_executor.submit(contextvars.copy_context().run, attempt)
+        pending = {primary, backup}
+        winner = None
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in (primary, backup):
+                if future in done and future.exception() is None and future.result().status_code == 200:
+                    winner = future
+                    break
+        if winner is None:
+            # Both failed: report the original request's outcome
+            winner = primary
+        elif winner is backup:
+            self.resilience_stats.increment("hedges_won")
+        
+        loser = backup if winner is primary else primary
+        if not loser.cancel():
+            loser.add_done_callback(_close_response)
+        return winner.result()
+    
+    def get_resilience_stats(self) -> Dict[str, Any]:
+        """
+        Get retry, rate limiter and circuit breaker counters
+        
+        Returns:
+            Dictionary of counters plus the current circuit state
+        """
+        return resilience_summary(self.resilience_stats, self.circuit_breaker)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get request timing, size, status and token metrics
+        
+        Returns:
+            Snapshot of the client's metrics registry
+        """
+        return self.metrics.snapshot()
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool reuse metrics
+        
+        Returns:
+            Dictionary with request, connection and reuse counts
+        """
+        return self.connection_stats.snapshot()
+    
+    def close(self):
+        """Close all pooled connections"""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        self.session.close()
     
     def chat_completion(
         self,
@@ -25,7 +562,10 @@ class SarvamClient:
         stop: Optional[List[str]] = None,
         frequency_penalty: float = 0.0,
         presence_penalty: float = 0.0,
-        wiki_grounding: bool = False
+        wiki_grounding: bool = False,
+        stream: bool = False,
+        cache: Optional[bool] = None,
+        hedge: bool = True
     ) -> Dict[str, Any]:
         """
         Get chat completion from Sarvam AI
@@ -40,118 +580,164 @@ class SarvamClient:
             frequency_penalty: Penalize repetition (-2.0 to 2.0)
             presence_penalty: Encourage new topics (-2.0 to 2.0)
             wiki_grounding: Enable RAG with Wikipedia
+            stream: Stream the reply as server-sent events
+            cache: Serve from / store in the response cache (None caches only
+                low-temperature requests)
+            hedge: Allow a backup request when this one is slow (only with a
+                hedge_policy)
         
         Returns:
-            Dictionary with success status and response/error message
+            Dictionary with success status and response/error message.
+            With stream=True a successful result holds a "stream" generator
+            yielding text deltas instead of "message".
         """
         
-        url = f"{self.base_url}/chat/completions"
+        payload = build_chat_payload(
+            messages,
+            model=model,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            stop=stop,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            wiki_grounding=wiki_grounding
+        )
         
-        # Prepare the payload
-        payload = {
-            "messages": messages,
-            "model": model,
-            "temperature": temperature,
-            "top_p": top_p,
-            "frequency_penalty": frequency_penalty,
-            "presence_penalty": presence_penalty,
-            "wiki_grounding": wiki_grounding
-        }
+        if self.response_cache is not None and self.response_cache.should_cache(temperature, cache):
+            # Cached and coalesced requests are fetched whole, then replayed as one delta
+            result = self.response_cache.get_or_compute(
+                self.response_cache.make_key(payload),
+                lambda: self._send_chat_completion(payload, hedge=hedge)
+            )
+            if stream and result["success"]:
+                return {
+                    "success": True,
+                    "stream": iter([result["message"]]),
+                    "cached": result.get("cached", False)
+                }
+            return result
         
-        # Add optional parameters
-        if max_tokens is not None:
-            payload["max_tokens"] = max_tokens
+        return self._send_chat_completion(payload, stream=stream, hedge=hedge)
+    
+    def chat_template(self, system_message: Dict[str, Any], params: Dict[str, Any]) -> ChatRequestTemplate:
+        """
+        Get the request template for a system message and sampling parameters
         
-        if stop is not None:
-            payload["stop"] = stop
+        Templates are built on first use and kept (LRU) so each language's
+        system prompt is serialized once per process, not once per turn.
+        """
+        # Encoded rather than hashed as tuples, so list or dict fields are valid keys
+        key = (encode_json(system_message), encode_json(params))
+        with self._chat_templates_lock:
+            template = self._chat_templates.get(key)
+            if template is not None:
+                self._chat_templates.move_to_end(key)
+                return template
+        template = ChatRequestTemplate(system_message, params)
+        with self._chat_templates_lock:
+            self._chat_templates[key] = template
+            while len(self._chat_templates) > CHAT_TEMPLATE_CACHE_SIZE:
+                self._chat_templates.popitem(last=False)
+        return template
+    
+    def _encode_chat_body(self, payload: Dict[str, Any], stream: bool) -> bytes:
+        """
+        Chat completions body, through the template for its system message when it has one
+        
+        Templates only pay off with orjson: with the standard library, joining
+        the encoded parts costs more than encoding the whole payload once.
+        """
+        messages = payload["messages"]
+        if orjson is not None and messages and messages[0].get("role") == "system":
+            params = {name: value for name, value in payload.items() if name != "messages"}
+            return self.chat_template(messages[0], params).encode(messages[1:], stream)
+        return encode_json(dict(payload, stream=True) if stream else payload)
+    
+    def _send_chat_completion(self, payload: Dict[str, Any], stream: bool = False, hedge: bool = True) -> Dict[str, Any]:
+        """Send a chat completion request and map the response to a result dict"""
+        post = self._post_hedged if hedge and self.hedge_policy is not None else self._post
         
         try:
+            body = self._encode_chat_body(payload, stream)
             # Make the API request
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
-            
-            # Check if request was successful
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Extract the message from the response
-                if "choices" in data and len(data["choices"]) > 0:
-                    message = data["choices"][0]["message"]["content"]
-                    return {
-                        "success": True,
-                        "message": message,
-                        "raw_response": data
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": "No response choices found in API response"
-                    }
+            response = post("chat/completions", payload, stream=stream, body=body)
             
-            elif response.status_code == 401:
+            if response.status_code == 200 and stream:
                 return {
-                    "success": False,
-                    "error": "Invalid API key. Please check your SARVAM_API_KEY environment variable."
-                }
-            
-            elif response.status_code == 429:
-                return {
-                    "success": False,
-                    "error": "Rate limit exceeded. Please try again later."
-                }
-            
-            elif response.status_code == 500:
-                return {
-                    "success": False,
-                    "error": "Server error. Please try again later."
+                    "success": True,
+                    # The attempt started when the request was sent, before the headers arrived
+                    "stream": self._iter_stream_deltas(response, time.perf_counter() - response.elapsed.total_seconds())
                 }
             
-            else:
-                # Try to get error message from response
-                try:
-                    error_data = response.json()
-                    error_message = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-                except:
-                    error_message = f"HTTP {response.status_code}"
-                
-                return {
-                    "success": False,
-                    "error": f"API request failed: {error_message}"
-                }
+            result = parse_chat_response(response.status_code, response.content)
+            if result["success"]:
+                record_usage(self.metrics, "sarvam", "chat/completions", result["raw_response"].get("usage"))
+            return result
                 
+        except CircuitOpenError:
+            return error_result(CIRCUIT_OPEN_ERROR)
+        
+        except RateLimitExceeded:
+            return error_result(RATE_LIMIT_ERROR)
+        
         except requests.exceptions.Timeout:
-            return {
-                "success": False,
-                "error": "Request timed out. Please check your internet connection and try again."
-            }
+            return error_result(TIMEOUT_ERROR)
         
         except requests.exceptions.ConnectionError:
-            return {
-                "success": False,
-                "error": "Connection error. Please check your internet connection."
-            }
-        
-        except requests.exceptions.RequestException as e:
-            return {
-                "success": False,
-                "error": f"Request error: {str(e)}"
-            }
+            return error_result(CONNECTION_ERROR)
         
         except json.JSONDecodeError:
-            return {
-                "success": False,
-                "error": "Invalid JSON response from API"
-            }
+            return error_result(INVALID_JSON_ERROR)
+        
+        except requests.exceptions.RequestException as e:
+            return error_result(f"Request error: {str(e)}")
         
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Unexpected error: {str(e)}"
-            }
+            return error_result(f"Unexpected error: {str(e)}")
+    
+    def _iter_stream_deltas(self, response: requests.Response, started: float):
+        """
+        Parse a server-sent-event chat completion response
+        
+        Args:
+            response: Streaming response from the chat completions endpoint
+            started: time.perf_counter() when the request was sent
+            
+        Yields:
+            Text deltas in the order the server sends them
+        """
+        done = False
+        received = 0
+        try:
+            for line in response.iter_lines():
+                received += len(line) + 1
+                # SSE frames look like "data: {...}"; skip comments and blanks.
+                # Lines after [DONE] are drained so the connection can be reused.
+                if done or not line.startswith(b"data:"):
+                    continue
+                
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    done = True
+                    continue
+                
+                event = json.loads(data)
+                # Servers that report usage send it with the last event
+                record_usage(self.metrics, "sarvam", "chat/completions", event.get("usage"))
+                choices = event.get("choices") or []
+                if not choices:
+                    continue
+                
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
+        finally:
+            # received counts decoded lines; the wire size is only known for unchunked bodies
+            record_stream_end(
+                self.metrics, "sarvam", "chat/completions", started, wire_bytes(response) or received, received
+            )
+            response.close()
     
     def translate_text(
         self,
@@ -159,7 +745,8 @@ class SarvamClient:
         source_language: str = "en-IN",
         target_language: str = "hi-IN",
         speaker_gender: str = "Male",
-        mode: str = "formal"
+        mode: str = "formal",
+        model: str = "mayura:v1"
     ) -> Dict[str, Any]:
         """
         Translate text using Sarvam AI translation API
@@ -170,95 +757,254 @@ class SarvamClient:
             target_language: Target language code (BCP-47 format)
             speaker_gender: Male or Female
             mode: formal or informal
+            model: Translation model
         
         Returns:
-            Dictionary with success status and translated text or error
+            Dictionary with success status and translated text or error.
+            Texts longer than TRANSLATE_INPUT_LIMIT are split at paragraph and
+            sentence boundaries and translated in parallel chunks.
         """
         
-        url = f"{self.base_url}/translate"
+        cache_key = None
+        if self.translation_cache is not None:
+            cache_key = TranslationCache.make_key(
+                text, source_language, target_language, mode, speaker_gender, model
+            )
+            cached = self.translation_cache.get(cache_key)
+            if cached is not None:
+                return {
+                    "success": True,
+                    "translated_text": cached,
+                    "cached": True
+                }
         
-        payload = {
-            "input": text,
-            "source_language_code": source_language,
-            "target_language_code": target_language,
+        if len(text) > TRANSLATE_INPUT_LIMIT:
+            result = self._translate_chunked(
+                text,
+                source_language=source_language,
+                target_language=target_language,
+                speaker_gender=speaker_gender,
+                mode=mode,
+                model=model
+            )
+            if result["success"] and cache_key is not None:
+                self.translation_cache.set(cache_key, result["translated_text"])
+            return result
+        
+        payload = build_translate_payload(
+            text,
+            source_language=source_language,
+            target_language=target_language,
+            speaker_gender=speaker_gender,
+            mode=mode,
+            model=model
+        )
+        
+        try:
+            response = self._post("translate", payload)
+            result = parse_translate_response(response.status_code, response.content)
+            if result["success"] and cache_key is not None:
+                self.translation_cache.set(cache_key, result["translated_text"])
+            return result
+                
+        except Exception as e:
+            return error_result(f"Translation error: {str(e)}")
+    
+    def _translate_chunked(self, text: str, **options) -> Dict[str, Any]:
+        """Translate a long text as parallel chunks and reassemble them in order"""
+        pieces = split_for_translation(text, TRANSLATE_INPUT_LIMIT)
+        chunks = [piece for piece, translate in pieces if translate]
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(TRANSLATE_MAX_WORKERS, len(chunks)))) as executor:
+            # Each chunk runs in a copy of the caller's context, so metrics reach the caller's session
+            futures = [
+                executor.submit(contextvars.copy_context().run, self.translate_text, chunk, **options)
+                for chunk in chunks
+            ]
+            translated = iter([future.result() for future in futures])
+        
+        parts = []
+        for piece, translate in pieces:
+            if not translate:
+                # Code blocks and whitespace between blocks are kept verbatim
+                parts.append(piece)
+                continue
+            
+            result = next(translated)
+            if not result["success"]:
+                return result
+            parts.append(result["translated_text"])
+        
+        return {
+            "success": True,
+            "translated_text": "".join(parts),
+            "chunks": len(chunks)
+        }
+    
+    def translate_batch(
+        self,
+        items: List[Tuple[str, str]],
+        source_language: str = "en-IN",
+        speaker_gender: str = "Male",
+        mode: str = "formal",
+        model: str = "mayura:v1",
+        max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Translate many strings using as few API requests as possible
+        
+        Duplicate (text, target) pairs are translated once, cached translations
+        are reused, and the remaining strings for each target language are
+        packed into requests of up to TRANSLATE_INPUT_LIMIT characters that run
+        concurrently.
+        
+        Args:
+            items: (text, target_language) pairs
+            source_language: Source language code (BCP-47 format)
+            speaker_gender: Male or Female
+            mode: formal or informal
+            model: Translation model
+            max_workers: Maximum packed requests in flight
+        
+        Returns:
+            One result dictionary per item, in input order
+        """
+        options = {
+            "source_language": source_language,
             "speaker_gender": speaker_gender,
             "mode": mode,
-            "model": "mayura:v1",
-            "enable_preprocessing": True
+            "model": model
         }
         
-        try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=15
-            )
+        results = {}
+        pending = {}  # target language -> unique texts still to translate
+        for text, target_language in items:
+            key = (text, target_language)
+            if key in results or text in pending.get(target_language, ()):
+                continue
             
-            if response.status_code == 200:
-                data = response.json()
-                translated_text = data.get("translated_text", "")
-                return {
-                    "success": True,
-                    "translated_text": translated_text,
-                    "raw_response": data
-                }
+            cached = None
+            if self.translation_cache is not None:
+                cached = self.translation_cache.get(TranslationCache.make_key(
+                    text, source_language, target_language, mode, speaker_gender, model
+                ))
+            if cached is not None:
+                results[key] = {"success": True, "translated_text": cached, "cached": True}
             else:
-                return {
-                    "success": False,
-                    "error": f"Translation failed: HTTP {response.status_code}"
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Translation error: {str(e)}"
-            }
+                pending.setdefault(target_language, {})[text] = None
+        
+        chunks = []
+        for target_language, texts in pending.items():
+            for chunk in self._pack_for_translation(list(texts)):
+                chunks.append((chunk, target_language))
+        
+        if chunks:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._translate_packed, chunk, target_language, options)
+                    for chunk, target_language in chunks
+                ]
+                for (chunk, target_language), future in zip(chunks, futures):
+                    for text, result in zip(chunk, future.result()):
+                        results[(text, target_language)] = result
+        
+        return [results[(text, target_language)] for text, target_language in items]
+    
+    def _pack_for_translation(self, texts: List[str]) -> List[List[str]]:
+        """Group texts into chunks whose joined length fits one translate request"""
+        chunks = []
+        current = []
+        current_length = 0
+        for text in texts:
+            # Texts with their own line breaks cannot be split back apart reliably
+            if BATCH_SEPARATOR in text or len(text) >= TRANSLATE_INPUT_LIMIT:
+                chunks.append([text])
+                continue
+            
+            added_length = len(text) + (len(BATCH_SEPARATOR) if current else 0)
+            if current and current_length + added_length > TRANSLATE_INPUT_LIMIT:
+                chunks.append(current)
+                current = []
+                current_length = 0
+                added_length = len(text)
+            
+            current.append(text)
+            current_length += added_length
+        
+        if current:
+            chunks.append(current)
+        return chunks
     
-    def detect_language(self, text: str) -> Dict[str, Any]:
+    def _translate_packed(
+        self,
+        texts: List[str],
+        target_language: str,
+        options: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        """Translate a packed chunk, falling back to one request per text if it cannot be unpacked"""
+        if len(texts) == 1:
+            return [self.translate_text(texts[0], target_language=target_language, **options)]
+        
+        result = self.translate_text(
+            BATCH_SEPARATOR.join(texts),
+            target_language=target_language,
+            **options
+        )
+        if not result["success"]:
+            return [dict(result) for _ in texts]
+        
+        parts = result["translated_text"].split(BATCH_SEPARATOR)
+        if len(parts) == len(texts):
+            results = []
+            for text, part in zip(texts, parts):
+                if self.translation_cache is not None:
+                    self.translation_cache.set(TranslationCache.make_key(
+                        text, options["source_language"], target_language,
+                        options["mode"], options["speaker_gender"], options["model"]
+                    ), part)
+                results.append({"success": True, "translated_text": part})
+            return results
+        
+        # The translation merged or split lines, so translate each text on its own
+        return [self.translate_text(text, target_language=target_language, **options) for text in texts]
+    
+    def detect_language(self, text: str, local_confidence: Optional[float] = 0.9) -> Dict[str, Any]:
         """
         Detect the language of given text
         
         Args:
             text: Text to analyze
+            local_confidence: Answer from the local script detector without a
+                network call when its confidence reaches this value (None
+                always asks the API)
             
         Returns:
             Dictionary with success status and detected language or error
         """
         
-        url = f"{self.base_url}/detect-language"
+        if local_confidence is not None:
+            local = detect_script(text)
+            # Hinglish and scripts shared by several languages need the API to tell apart;
+            # mixed-script text and Latin text without English words come back with low confidence
+            if (local["confidence"] >= local_confidence and not local["hinglish"]
+                    and local["script"] not in SHARED_SCRIPTS):
+                return {
+                    "success": True,
+                    "detected_language": local["language_code"],
+                    "confidence": local["confidence"],
+                    "source": "local"
+                }
         
         payload = {
             "input": text
         }
         
         try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "detected_language": data.get("detected_language"),
-                    "confidence": data.get("confidence"),
-                    "raw_response": data
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Language detection failed: HTTP {response.status_code}"
-                }
+            response = self._post("detect-language", payload)
+            return parse_detect_response(response.status_code, response.content)
                 
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Language detection error: {str(e)}"
-            }
+            return error_result(f"Language detection error: {str(e)}")
     
     def test_connection(self) -> Dict[str, Any]:
         """
@@ -271,9 +1017,11 @@ class SarvamClient:
         # Test with a simple chat completion
         test_messages = [{"role": "user", "content": "Hello"}]
         
+        # Never answered from the response cache: the check must reach the API
         result = self.chat_completion(
             messages=test_messages,
-            temperature=0.1
+            temperature=0.1,
+            cache=False
         )
         
         if result["success"]:
@@ -286,3 +1034,27 @@ class SarvamClient:
                 "success": False,
                 "error": f"API connection failed: {result.get('error', 'Unknown error')}"
             }
+    
+    def warm_up(self, connections: int = 2, check_connection: bool = False) -> Dict[str, Any]:
+        """
+        Prepare the client before it serves its first user
+        
+        Args:
+            connections: Keep-alive connections to open to the API host, so
+                the first requests skip the TCP and TLS handshakes
+            check_connection: Also run test_connection (one chat completion)
+        
+        Returns:
+            Dictionary with success status, connections opened and, when
+            checked, the test_connection result
+        """
+        result = {"success": True, "connections_opened": 0}
+        try:
+            result["connections_opened"] = preconnect(self.session, self.base_url, connections)
+        except Exception as e:
+            result = {"success": False, "connections_opened": 0, "error": f"Could not connect to {self.base_url}: {e}"}
+        
+        if check_connection:
+            result["connection_test"] = self.test_connection()
+            result["success"] = result["success"] and result["connection_test"]["success"]
+        return result
@@ -12,7 +12,7 @@ def install_dependencies():
     """Install required Python packages"""
     print("📦 Installing dependencies...")
     
-    packages = ["streamlit", "requests"]
+    packages = ["streamlit", "requests", "orjson"]
     
     for package in packages:
         try:
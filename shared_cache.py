@@ -0,0 +1,92 @@
+"""
+Shared cache
+Small key-value store in a SQLite WAL file, so worker processes started by
+run.py --workers can reuse each other's results
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+# Set by run.py --workers: directory holding state shared by every worker process
+SHARED_STATE_ENV = "MUFASA_SHARED_STATE_DIR"
+
+
+def shared_state_path(filename: str) -> Optional[str]:
+    """
+    Path of a file in the shared state directory
+
+    Returns:
+        The path, or None when the app runs as a single process
+    """
+    directory = os.environ.get(SHARED_STATE_ENV)
+    if not directory:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, filename)
+
+
+class SharedCache:
+    """JSON values by key, readable and writable from several processes at once"""
+
+    def __init__(self, db_path: str, namespace: str = "default"):
+        """
+        Open or create the cache
+
+        Args:
+            db_path: SQLite file shared by the worker processes
+            namespace: Keeps different kinds of entries apart in one file
+        """
+        self.db_path = db_path
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        # Writers in other processes hold the lock briefly; wait instead of failing
+        self._db = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, stored_at REAL NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Look up an entry
+
+        Returns:
+            (value, stored_at) or None if no process has stored the key
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, stored_at FROM entries WHERE namespace = ? AND key = ?", (self.namespace, key)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, stored_at: Optional[float] = None):
+        """
+        Store an entry for every process
+
+        Args:
+            key: Entry key
+            value: JSON-serializable value
+            stored_at: When the value was produced (default: now)
+        """
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), stored_at or time.time())
+            )
+            self._db.commit()
+
+    def clear(self):
+        """Drop every entry in this namespace"""
+        with self._lock:
+            self._db.execute("DELETE FROM entries WHERE namespace = ?", (self.namespace,))
+            self._db.commit()
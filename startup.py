@@ -0,0 +1,232 @@
+"""
+Startup helpers
+Import-time profile of app.py and a warm-up session that makes a fresh
+Streamlit worker pay its first-request costs before run.py reports it ready
+"""
+
+import asyncio
+import hmac
+import json
+import os
+import secrets
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from load_balancer import probe_health
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Query parameter that makes app.py run its warm-up instead of the chat page
+WARMUP_QUERY_PARAM = "warmup"
+
+# Set by run.py for its workers: a warm-up request must carry this secret, so
+# visitors cannot trigger it or read its report (which includes upstream errors)
+WARMUP_TOKEN_ENV = "MUFASA_WARMUP_TOKEN"
+
+# Set to "1" by run.py --check-connection: the warm-up also calls SarvamClient.test_connection
+WARMUP_CHECK_ENV = "MUFASA_WARMUP_CHECK_CONNECTION"
+
+# Imported before app.py when profiling: a worker has these loaded before its first script run
+SERVER_MODULES = ("streamlit.web.bootstrap", "streamlit.web.server.server")
+
+
+def check_connection_requested() -> bool:
+    """Whether this process was started with run.py --check-connection"""
+    return os.environ.get(WARMUP_CHECK_ENV) == "1"
+
+
+_warmup_token = None
+
+
+def warmup_token() -> str:
+    """The token this process gives the workers it starts (MUFASA_WARMUP_TOKEN, or a random one)"""
+    global _warmup_token
+    if _warmup_token is None:
+        _warmup_token = os.environ.get(WARMUP_TOKEN_ENV) or secrets.token_urlsafe(24)
+    return _warmup_token
+
+
+def warmup_requested(value: Optional[str]) -> bool:
+    """Whether a warmup query parameter carries the token this worker was started with"""
+    expected = os.environ.get(WARMUP_TOKEN_ENV)
+    if not expected or not value:
+        return False
+    return hmac.compare_digest(value.encode("utf-8"), expected.encode("utf-8"))
+
+
+def parse_importtime(output: str) -> List[Tuple[int, str, int, int]]:
+    """
+    Parse python -X importtime output
+
+    Returns:
+        (depth, module, self us, cumulative us) per import, in the order
+        Python reports them (a module comes after everything it imported)
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((depth, name.strip(), int(fields[0]), int(fields[1])))
+    return entries
+
+
+def profile_imports(module: str = "app", preload: Tuple[str, ...] = SERVER_MODULES) -> Dict[str, Any]:
+    """
+    Measure what importing a module costs a worker, in a fresh interpreter
+
+    Args:
+        module: Module to profile, imported from APP_DIR
+        preload: Modules imported first and left out of the profile
+
+    Returns:
+        Dictionary with the module's total import time, its direct imports
+        and the packages that took longest (all in seconds)
+    """
+    statement = "".join(f"import {name}; " for name in preload) + f"import {module}"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    entries = parse_importtime(completed.stderr)
+    top_level = [index for index, (depth, _, _, _) in enumerate(entries) if depth == 0]
+    end = next((index for index in top_level if entries[index][1] == module), None)
+    if completed.returncode != 0 or end is None:
+        raise RuntimeError(f"Could not import {module}: {completed.stderr.strip()[-500:]}")
+    # The module's subtree: everything between the previous top-level import and its own line
+    start = max((index + 1 for index in top_level if index < end), default=0)
+    entries = entries[start:end + 1]
+
+    packages = defaultdict(int)
+    for _, name, self_us, _ in entries[:-1]:
+        packages[name.split(".")[0]] += self_us
+    return {
+        "module": module,
+        "total": entries[-1][3] / 1e6,
+        "own": entries[-1][2] / 1e6,
+        "imports": sorted(
+            ((name, cumulative / 1e6) for depth, name, _, cumulative in entries if depth == 1),
+            key=lambda item: item[1], reverse=True
+        ),
+        "packages": sorted(((name, total / 1e6) for name, total in packages.items()),
+                           key=lambda item: item[1], reverse=True)
+    }
+
+
+def format_import_profile(profile: Dict[str, Any], limit: int = 12) -> str:
+    """Text report of profile_imports() for the console"""
+    lines = [
+        f"Importing {profile['module']}.py on a started worker: {profile['total'] * 1000:.0f} ms "
+        f"({profile['own'] * 1000:.0f} ms in its own top-level code)",
+        "",
+        "Direct imports (including what they load):"
+    ]
+    lines += [f"  {seconds * 1000:8.1f} ms  {name}" for name, seconds in profile["imports"][:limit]]
+    lines += ["", "Time by package:"]
+    lines += [f"  {seconds * 1000:8.1f} ms  {name}" for name, seconds in profile["packages"][:limit]]
+    return "\n".join(lines)
+
+
+async def run_script(host: str, port: int, query_string: str = "", timeout: float = 60.0) -> List[Any]:
+    """
+    Open a headless Streamlit session and run the app once
+
+    Args:
+        host: Worker host
+        port: Worker port
+        query_string: URL query the session starts with
+        timeout: Seconds allowed for the run
+
+    Returns:
+        The ForwardMsgs of the run, up to and including script_finished
+
+    Raises:
+        RuntimeError: websockets is not installed, or the app raised an exception
+        asyncio.TimeoutError: The run did not finish in time
+    """
+    try:
+        from websockets.asyncio.client import connect
+    except ImportError:
+        raise RuntimeError("Running the app headless needs the websockets package: pip install websockets") from None
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    async def run():
+        messages = []
+        async with connect(f"ws://{host}:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as websocket:
+            request = BackMsg()
+            request.rerun_script.query_string = query_string
+            await websocket.send(request.SerializeToString())
+            while True:
+                message = ForwardMsg()
+                message.ParseFromString(await websocket.recv())
+                messages.append(message)
+                if message.WhichOneof("type") == "delta" and message.delta.new_element.WhichOneof("type") == "exception":
+                    raise RuntimeError(f"App raised: {message.delta.new_element.exception.message}")
+                if message.WhichOneof("type") == "script_finished":
+                    return messages
+
+    return await asyncio.wait_for(run(), timeout)
+
+
+async def warm_up_worker(
+    host: str,
+    port: int,
+    timeout: float = 60.0,
+    startup_timeout: float = 120.0,
+    process: Optional[subprocess.Popen] = None
+) -> Dict[str, Any]:
+    """
+    Wait for a worker to start, then run app.py's warm-up in it
+    The worker must have been started from this process (run.start_worker),
+    so that it expects this process's warmup_token()
+
+    Args:
+        host: Worker host
+        port: Worker port
+        timeout: Seconds allowed for the warm-up run
+        startup_timeout: Seconds to wait for the worker's health check
+        process: The worker's process, to stop waiting if it exits
+
+    Returns:
+        The report app.warm_up() produced, plus "ready_after" (seconds
+        waited for the health check) and "warm_up_seconds" (the whole run)
+    """
+    started = time.perf_counter()
+    deadline = time.monotonic() + startup_timeout
+    while not await probe_health(host, port):
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Worker on port {port} exited with code {process.returncode}")
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Worker on port {port} did not start within {startup_timeout:.0f}s")
+        await asyncio.sleep(0.1)
+    ready_after = time.perf_counter() - started
+
+    messages = await run_script(host, port, f"{WARMUP_QUERY_PARAM}={warmup_token()}", timeout)
+    report = {}
+    for message in messages:
+        if message.WhichOneof("type") == "delta" and message.delta.new_element.WhichOneof("type") == "json":
+            report = json.loads(message.delta.new_element.json.body)
+    report["ready_after"] = ready_after
+    report["warm_up_seconds"] = time.perf_counter() - started - ready_after
+    return report
+
+
+def describe_warm_up(port: int, report: Optional[Dict[str, Any]], error: Optional[Exception] = None) -> str:
+    """One console line about a worker's warm-up"""
+    if error is not None:
+        return f"⚠️  Worker on port {port} not warmed up: {error}"
+    line = (f"🔥 Worker on port {port} warmed up in {report['warm_up_seconds']:.2f}s "
+            f"({report.get('connections_opened', 0)} API connections opened)")
+    if not report.get("success", True):
+        line += f" ⚠️  {report.get('error') or report.get('connection_test', {}).get('error')}"
+    elif "connection_test" in report:
+        line += " ✅ API connection OK"
+    return line
@@ -0,0 +1,162 @@
+"""
+Length-aware text chunking for translation
+Splits long replies at paragraph and sentence boundaries while keeping
+markdown code blocks and list items intact
+"""
+
+import re
+from typing import List, Tuple
+
+# Sentence terminators for all supported scripts: Latin punctuation plus the
+# danda / double danda used by Hindi, Marathi, Bengali, Punjabi and Odia
+SENTENCE_END = ".!?।॥"
+
+_CODE_BLOCK = re.compile(r"(```.*?```|~~~.*?~~~)", re.DOTALL)
+_PARAGRAPH_BREAK = re.compile(r"(\n[ \t]*\n\s*)")
+_LINE_BREAK = re.compile(r"(\n)")
+_SENTENCE_BREAK = re.compile(r"(?<=[" + SENTENCE_END + r"])([\"')\]]*\s+)")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+")
+
+# (text, translate) pieces; joining every piece's text rebuilds the original
+Piece = Tuple[str, bool]
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences, keeping each sentence's trailing whitespace
+
+    Args:
+        text: Text in any supported script
+
+    Returns:
+        Sentences whose concatenation equals the input
+    """
+    parts = _SENTENCE_BREAK.split(text)
+    # re.split alternates text and captured separator; glue each separator back on
+    sentences = [parts[i] + (parts[i + 1] if i + 1 < len(parts) else "") for i in range(0, len(parts), 2)]
+    return [sentence for sentence in sentences if sentence]
+
+
+def split_code_blocks(text: str) -> List[str]:
+    """
+    Split text around complete fenced code blocks
+
+    Args:
+        text: Text to split (markdown allowed)
+
+    Returns:
+        Prose and code blocks alternating, starting and ending with prose
+        (possibly empty): code blocks are at the odd indexes
+    """
+    return _CODE_BLOCK.split(text)
+
+
+def _split_words(text: str, max_chars: int) -> List[str]:
+    """Hard-split a run-on sentence at whitespace into pieces of at most max_chars"""
+    pieces = []
+    current = ""
+    for word in re.findall(r"\S+\s*", text):
+        if current and len(current) + len(word) > max_chars:
+            pieces.append(current)
+            current = ""
+        # A single word longer than the limit has to be cut
+        while len(word) > max_chars:
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        current += word
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _is_list_block(block: str) -> bool:
+    return any(_LIST_ITEM.match(line) for line in block.split("\n"))
+
+
+def _units(block: str, max_chars: int) -> List[Piece]:
+    """Break one paragraph into translatable units no longer than max_chars"""
+    if len(block) <= max_chars:
+        return [(block, True)]
+
+    if _is_list_block(block):
+        # Keep each list item (line) whole; only over-long items are split further
+        units = []
+        for part in _LINE_BREAK.split(block):
+            if part == "\n":
+                units.append((part, False))
+            elif part:
+                units.extend(_units(part, max_chars) if len(part) > max_chars else [(part, True)])
+        return units
+
+    units = []
+    for sentence in split_sentences(block):
+        if len(sentence) <= max_chars:
+            units.append((sentence, True))
+        else:
+            units.extend((piece, True) for piece in _split_words(sentence, max_chars))
+    return units
+
+
+def _strip_piece(text: str) -> List[Piece]:
+    """Move leading and trailing whitespace of a unit into untranslated pieces"""
+    stripped = text.strip()
+    if not stripped:
+        return [(text, False)] if text else []
+
+    start = text.index(stripped)
+    pieces = []
+    if start:
+        pieces.append((text[:start], False))
+    pieces.append((stripped, True))
+    if start + len(stripped) < len(text):
+        pieces.append((text[start + len(stripped):], False))
+    return pieces
+
+
+def split_for_translation(text: str, max_chars: int) -> List[Piece]:
+    """
+    Split text into pieces that can be translated independently
+
+    Fenced code blocks and whitespace between blocks are returned as
+    untranslated pieces. Paragraphs, list items and sentences are packed
+    greedily into translatable pieces of at most max_chars characters.
+
+    Args:
+        text: Text to split (markdown allowed)
+        max_chars: Maximum characters in one translatable piece
+
+    Returns:
+        (text, translate) pieces whose texts concatenate to the original
+    """
+    units = []
+    for index, part in enumerate(split_code_blocks(text)):
+        if not part:
+            continue
+        if index % 2:
+            units.append((part, False))
+            continue
+        for block in _PARAGRAPH_BREAK.split(part):
+            if not block:
+                continue
+            if _PARAGRAPH_BREAK.fullmatch(block):
+                units.append((block, False))
+            else:
+                units.extend(_units(block, max_chars))
+
+    # Pack neighbouring units (and the separators between them) up to max_chars
+    packed = []
+    for unit_text, translate in units:
+        if packed and packed[-1][1] and len(packed[-1][0]) + len(unit_text) <= max_chars and (
+            translate or unit_text.isspace()
+        ):
+            packed[-1] = (packed[-1][0] + unit_text, True)
+        else:
+            packed.append((unit_text, translate))
+
+    pieces = []
+    for piece_text, translate in packed:
+        if translate:
+            pieces.extend(_strip_piece(piece_text))
+        else:
+            pieces.append((piece_text, False))
+    return pieces
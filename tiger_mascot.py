@@ -1,11 +1,230 @@
 import random
-from typing import Dict, List
+import string
+import sys
+import unicodedata
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+from image_tiger import compact_html
+
+# Reaction keywords per category and language. Categories are listed in
+# priority order: when several fire, the earliest one decides the state.
+REACTION_KEYWORDS = {
+    "greeting": {
+        "en-IN": ["hello", "hi", "hey", "greetings", "welcome", "namaste"],
+        "hi-IN": ["नमस्ते", "नमस्कार", "स्वागत"],
+        "bn-IN": ["নমস্কার", "স্বাগতম"],
+        "ta-IN": ["வணக்கம்"],
+        "te-IN": ["నమస్కారం", "స్వాగతం"],
+        "mr-IN": ["नमस्कार", "स्वागत"],
+        "gu-IN": ["નમસ્તે", "સ્વાગત"],
+        "kn-IN": ["ನಮಸ್ಕಾರ", "ಸ್ವಾಗತ"],
+        "ml-IN": ["നമസ്കാരം", "സ്വാഗതം"],
+        "pa-IN": ["ਸਤ ਸ੍ਰੀ ਅਕਾਲ"],
+        "or-IN": ["ନମସ୍କାର"]
+    },
+    "positive": {
+        "en-IN": ["great", "excellent", "wonderful", "amazing", "fantastic", "good", "yes", "correct"],
+        "hi-IN": ["अच्छा", "शानदार", "हाँ", "सही"],
+        "bn-IN": ["ভালো", "দারুণ", "চমৎকার", "হ্যাঁ", "সঠিক"],
+        "ta-IN": ["நல்லது", "அருமை", "சிறப்பு", "ஆம்", "சரி"],
+        "te-IN": ["మంచి", "అద్భుతం", "అవును", "సరైనది"],
+        "mr-IN": ["छान", "उत्तम", "बरोबर"],
+        "gu-IN": ["સરસ", "ઉત્તમ", "હા", "સાચું"],
+        "kn-IN": ["ಒಳ್ಳೆಯದು", "ಅದ್ಭುತ", "ಹೌದು", "ಸರಿ"],
+        "ml-IN": ["നല്ലത്", "മികച്ചത്", "അതെ", "ശരി"],
+        "pa-IN": ["ਵਧੀਆ", "ਹਾਂ", "ਸਹੀ"],
+        "or-IN": ["ଭଲ", "ଚମତ୍କାର", "ହଁ"]
+    },
+    "question": {
+        "en-IN": ["?", "what", "how", "why", "when", "where", "which"],
+        "hi-IN": ["क्या", "कैसे", "क्यों", "कब", "कहाँ", "कौन"],
+        "bn-IN": ["কী", "কেন", "কীভাবে", "কখন", "কোথায়"],
+        "ta-IN": ["என்ன", "ஏன்", "எப்படி", "எப்போது", "எங்கே"],
+        "te-IN": ["ఏమి", "ఎందుకు", "ఎలా", "ఎప్పుడు", "ఎక్కడ"],
+        "mr-IN": ["काय", "कसे", "केव्हा", "कुठे"],
+        "gu-IN": ["શું", "કેમ", "ક્યારે", "ક્યાં"],
+        "kn-IN": ["ಏನು", "ಏಕೆ", "ಹೇಗೆ", "ಯಾವಾಗ", "ಎಲ್ಲಿ"],
+        "ml-IN": ["എന്ത്", "എന്തുകൊണ്ട്", "എങ്ങനെ", "എപ്പോൾ", "എവിടെ"],
+        "pa-IN": ["ਕੀ", "ਕਿਉਂ", "ਕਿਵੇਂ", "ਕਦੋਂ", "ਕਿੱਥੇ"],
+        "or-IN": ["କଣ", "କାହିଁକି", "କିପରି", "କେବେ"]
+    },
+    "celebration": {
+        "en-IN": ["congratulations", "congrats", "success", "successful", "achievement", "won", "victory", "celebrate"],
+        "hi-IN": ["बधाई", "सफलता", "जीत"],
+        "bn-IN": ["অভিনন্দন", "সাফল্য"],
+        "ta-IN": ["வாழ்த்துக்கள்", "வெற்றி"],
+        "te-IN": ["అభినందనలు", "విజయం"],
+        "mr-IN": ["अभिनंदन", "यश", "विजय"],
+        "gu-IN": ["અભિનંદન", "સફળતા", "વિજય"],
+        "kn-IN": ["ಅಭಿನಂದನೆಗಳು", "ಯಶಸ್ಸು", "ಗೆಲುವು"],
+        "ml-IN": ["അഭിനന്ദനങ്ങൾ", "വിജയം"],
+        "pa-IN": ["ਵਧਾਈਆਂ", "ਸਫਲਤਾ", "ਜਿੱਤ"],
+        "or-IN": ["ଅଭିନନ୍ଦନ", "ସଫଳତା", "ବିଜୟ"]
+    }
+}
+
+# Tiger state shown when a category fires
+REACTION_STATES = {
+    "greeting": "excited",
+    "positive": "happy",
+    "question": "thinking",
+    "celebration": "celebrating"
+}
+
+# Characters stripped from the ends of each word before lookup, so keywords
+# still match next to punctuation, quotes, markdown emphasis and dandas
+WORD_PUNCTUATION = string.punctuation + "।॥“”‘’…—–«»¿¡"
+
+
+def _is_word_char(char: str) -> bool:
+    # Letters, digits and combining marks (Indic vowel signs, viramas) continue a word
+    return unicodedata.category(char)[0] in "LMN"
+
+
+def _whole_word(text: str, keyword: str) -> bool:
+    """Whether keyword occurs in text with no word character on either side"""
+    start = text.find(keyword)
+    while start != -1:
+        end = start + len(keyword)
+        if ((start == 0 or not _is_word_char(text[start - 1]))
+                and (end == len(text) or not _is_word_char(text[end]))):
+            return True
+        start = text.find(keyword, start + 1)
+    return False
+
+
+class ReactionMatcher:
+    """
+    Multi-language keyword matcher that only accepts whole words
+
+    ASCII replies can only hold English keywords, and are scanned with one
+    substring sweep per category that checks word boundaries where a keyword
+    occurs. Other replies are split into words once and looked up in hash
+    tables of every language's keywords: with ~150 Indic keywords a sweep is
+    several times slower whenever no keyword is present
+    (benchmarks/bench_reaction_matcher.py).
+    """
+
+    def __init__(self, keywords: Dict[str, Dict[str, List[str]]], languages: Optional[List[str]] = None):
+        """
+        Compile the keyword table
+
+        Args:
+            keywords: Category -> language code -> keywords, categories in
+                priority order
+            languages: Language codes to include (default: all)
+        """
+        self.priority = {category: rank for rank, category in enumerate(keywords)}
+        sweep = {category: set() for category in keywords}
+        words = {}     # single word -> category
+        phrases = {}   # first word -> [(phrase, category)]
+        symbols = []   # keywords without letters ("?"), matched anywhere
+
+        # Lowest priority first, so a keyword listed under several
+        # categories keeps the highest-priority one
+        for category in reversed(list(keywords)):
+            for code, language_words in keywords[category].items():
+                if languages is not None and code not in languages:
+                    continue
+                for keyword in language_words:
+                    keyword = keyword.lower()
+                    parts = keyword.split()
+                    if keyword.isascii():
+                        sweep[category].add(" ".join(parts))
+                    if not keyword.strip(WORD_PUNCTUATION):
+                        symbols.append((keyword, category))
+                    elif len(parts) > 1:
+                        phrases.setdefault(parts[0], []).append((" ".join(parts), category))
+                    else:
+                        words[keyword] = category
+
+        # Sorted, so the first hit is also the smallest keyword of its category
+        self._sweep = tuple((category, tuple(sorted(sweep[category]))) for category in keywords)
+        self._sweep_phrases = any(" " in keyword for category_keywords in sweep.values() for keyword in category_keywords)
+        self._words = words
+        self._word_set = frozenset(words)
+        self._phrases = phrases
+        self._phrase_starts = frozenset(phrases)
+        self._symbols = tuple(symbols)
+
+    def sweep(self, text: str) -> Optional[Tuple[str, str]]:
+        """
+        Find the highest-priority ASCII keyword in text as a whole word
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (category, keyword) of the best match, or None if nothing matched
+        """
+        lowered = text.lower()
+        if self._sweep_phrases:
+            lowered = " ".join(lowered.split())
+        for category, keywords in self._sweep:
+            for keyword in keywords:
+                if keyword in lowered and (not keyword.strip(WORD_PUNCTUATION) or _whole_word(lowered, keyword)):
+                    return category, keyword
+        return None
+
+    def find(self, text: str) -> List[Tuple[str, str]]:
+        """
+        Find every keyword present in text as a whole word
+
+        The text is split on whitespace once; each distinct word is stripped
+        of surrounding punctuation, lowercased and looked up, so the cost
+        grows with the text rather than with the number of keywords.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (category, keyword) pairs, in no particular order
+        """
+        tokens = {token.strip(WORD_PUNCTUATION).lower() for token in set(text.split())}
+        found = [(self._words[word], word) for word in self._word_set.intersection(tokens)]
+
+        starts = self._phrase_starts.intersection(tokens)
+        if starts:
+            # Phrases are rare; compare them against whitespace-normalized text
+            normalized = " ".join(text.lower().split())
+            for start in starts:
+                found.extend((category, phrase) for phrase, category in self._phrases[start] if phrase in normalized)
+
+        found.extend((category, symbol) for symbol, category in self._symbols if symbol in text)
+        return found
+
+    def match(self, text: str) -> Optional[Tuple[str, str]]:
+        """
+        Find the highest-priority keyword category in text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (category, keyword) of the best match, or None if nothing matched
+        """
+        if text.isascii():
+            return self.sweep(text)
+        found = self.find(text)
+        if not found:
+            return None
+        return min(found, key=lambda item: (self.priority[item[0]], item[1]))
+
 
 class TigerMascot:
     """Animated tiger mascot that reacts to chat interactions"""
     
-    def __init__(self):
-        """Initialize the tiger mascot with different states and animations"""
+    def __init__(self, languages: Optional[List[str]] = None):
+        """
+        Initialize the tiger mascot with different states and animations
+        
+        Args:
+            languages: Language codes whose reaction keywords are matched (default: all)
+        """
+        
+        # Keyword matcher for reactions, compiled once
+        self.reaction_matcher = ReactionMatcher(REACTION_KEYWORDS, languages)
         
         # Different tiger emojis and expressions
         self.tiger_emojis = {
@@ -52,6 +271,14 @@ class TigerMascot:
                 "*Tiger looks puzzled* 🤔"
             ]
         }
+        
+        # Status fragments for every (state, animation, emoji), rendered once
+        self.status_fragments = MappingProxyType({
+            (state, animation, emoji): self._render_status_html(state, emoji, animation)
+            for state, emojis in self.tiger_emojis.items()
+            for animation in self.animations[state]
+            for emoji in emojis
+        })
     
     def get_tiger_emoji(self, state: str) -> str:
         """
@@ -134,31 +361,30 @@ class TigerMascot:
         if is_error:
             return "sad"
         
-        # Convert to lowercase for easier matching
-        content_lower = message_content.lower()
-        
-        # Check for greeting patterns
-        greeting_words = ["hello", "hi", "hey", "greetings", "welcome", "namaste"]
-        if any(word in content_lower for word in greeting_words):
-            return "excited"
-        
-        # Check for positive sentiment
-        positive_words = ["great", "excellent", "wonderful", "amazing", "fantastic", "good", "yes", "correct"]
-        if any(word in content_lower for word in positive_words):
-            return "happy"
-        
-        # Check for questions or complex responses
-        question_indicators = ["?", "what", "how", "why", "when", "where", "which"]
-        if any(indicator in content_lower for indicator in question_indicators):
-            return "thinking"
-        
-        # Check for celebration-worthy content
-        celebration_words = ["congratulations", "success", "achievement", "won", "victory", "celebrate"]
-        if any(word in content_lower for word in celebration_words):
-            return "celebrating"
-        
         # Default to happy state for normal responses
-        return "happy"
+        reaction = self.classify_reaction(message_content)
+        return reaction["state"] if reaction else "happy"
+    
+    def classify_reaction(self, message_content: str) -> Optional[Dict[str, str]]:
+        """
+        Find the highest-priority reaction keyword in a message
+        
+        Args:
+            message_content: The content of the AI response
+            
+        Returns:
+            Dictionary with the category that fired, the matched keyword and
+            the resulting tiger state, or None if no keyword matched
+        """
+        match = self.reaction_matcher.match(message_content)
+        if match is None:
+            return None
+        category, keyword = match
+        return {
+            "category": category,
+            "keyword": keyword,
+            "state": REACTION_STATES[category]
+        }
     
     def get_context_appropriate_emoji(self, user_message: str, ai_response: str) -> str:
         """
@@ -177,19 +403,9 @@ class TigerMascot:
         # Get emoji for that state
         return self.get_tiger_emoji(state)
     
-    def get_tiger_status_html(self, state: str) -> str:
-        """
-        Generate HTML for tiger status display
-        
-        Args:
-            state: Current tiger state
-            
-        Returns:
-            HTML string for tiger status
-        """
-        emoji = self.get_tiger_emoji(state)
+    def _render_status_html(self, state: str, emoji: str, animation: str) -> str:
+        """Render the tiger status fragment for one emoji and animation"""
         description = self.get_state_description(state)
-        animation = self.get_animation_class(state)
         
         html = f"""
         <div style="
@@ -210,6 +426,24 @@ class TigerMascot:
         </div>
         """
         
+        return sys.intern(compact_html(html))
+    
+    def get_tiger_status_html(self, state: str) -> str:
+        """
+        Generate HTML for tiger status display
+        
+        Args:
+            state: Current tiger state
+            
+        Returns:
+            HTML string for tiger status
+        """
+        emoji = self.get_tiger_emoji(state)
+        animation = self.get_animation_class(state)
+        
+        html = self.status_fragments.get((state, animation, emoji))
+        if html is None:
+            html = self._render_status_html(state, emoji, animation)
         return html
     
     def get_random_idle_animation(self) -> str:
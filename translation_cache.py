@@ -0,0 +1,160 @@
+"""
+Translation cache
+Content-addressed LRU + TTL cache for translations with an optional SQLite tier
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class TranslationCache:
+    """Thread-safe translation cache shared by all sessions using a SarvamClient"""
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        ttl_seconds: float = 24 * 60 * 60,
+        db_path: Optional[str] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum translations kept in memory before LRU eviction
+            ttl_seconds: Seconds a translation stays valid
+            db_path: SQLite file for a persistent tier that survives restarts
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (translated_text, expires_at)
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "persistent_hits": 0
+        }
+
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(key TEXT PRIMARY KEY, translated_text TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(
+        text: str,
+        source_language: str,
+        target_language: str,
+        mode: str,
+        speaker_gender: str,
+        model: str
+    ) -> str:
+        """
+        Build the cache key for a translation request
+
+        Returns:
+            Key combining the text hash with every parameter that affects the output
+        """
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return "|".join((text_hash, source_language, target_language, mode, speaker_gender, model))
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a translation
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached translated text, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                translated_text, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return translated_text
+
+                del self._entries[key]
+                self._stats["expirations"] += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT translated_text, expires_at FROM translations WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    self._store(key, row[0], row[1])
+                    self._stats["hits"] += 1
+                    self._stats["persistent_hits"] += 1
+                    return row[0]
+                if row is not None:
+                    self._db.execute("DELETE FROM translations WHERE key = ?", (key,))
+                    self._db.commit()
+                    self._stats["expirations"] += 1
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: str, translated_text: str):
+        """
+        Store a translation
+
+        Args:
+            key: Key from make_key
+            translated_text: Successful translation to cache
+        """
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._store(key, translated_text, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO translations (key, translated_text, expires_at) VALUES (?, ?, ?)",
+                    (key, translated_text, expires_at)
+                )
+                self._db.commit()
+
+    def _store(self, key, translated_text, expires_at):
+        # Caller holds the lock
+        self._entries[key] = (translated_text, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def clear(self):
+        """Drop every cached translation, including the persistent tier"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM translations")
+                self._db.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hit/miss/eviction counts and current size
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,195 @@
+"""
+Pipelined translation of streamed replies
+Sends each completed sentence of a streaming chat reply to the translate
+endpoint while generation continues, so translation overlaps generation
+instead of starting after it
+"""
+
+import contextvars
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from text_chunking import split_code_blocks, split_sentences
+
+_CODE_FENCE = re.compile(r"```|~~~")
+
+
+class StreamingTranslator:
+    """Translates a reply sentence by sentence as its deltas arrive"""
+
+    def __init__(
+        self,
+        sarvam_client,
+        target_language: str,
+        source_language: str = "en-IN",
+        min_chars: int = 60,
+        max_workers: int = 4
+    ):
+        """
+        Initialize the translator
+
+        Args:
+            sarvam_client: SarvamClient used for translate requests
+            target_language: Language code to translate into
+            source_language: Language code of the streamed reply
+            min_chars: Complete sentences are grouped until a segment reaches
+                this length, so short sentences do not each cost a request
+            max_workers: Translate requests in flight at once
+        """
+        self.sarvam_client = sarvam_client
+        self.target_language = target_language
+        self.source_language = source_language
+        self.min_chars = min_chars
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="translate-pipeline")
+        self._lock = threading.Lock()
+        self._buffer = ""
+        self._pending = ""
+        # (leading whitespace, future or None, trailing whitespace) in reply order
+        self._segments = []
+
+    def _submit(self, segment: str):
+        """Queue one segment, keeping its surrounding whitespace out of the request"""
+        stripped = segment.strip()
+        leading = segment[:len(segment) - len(segment.lstrip())]
+        trailing = segment[len(segment.rstrip()):]
+        future = None
+        if stripped:
+            future = self._executor.submit(
+                contextvars.copy_context().run,
+                self.sarvam_client.translate_text,
+                text=stripped,
+                source_language=self.source_language,
+                target_language=self.target_language
+            )
+        with self._lock:
+            self._segments.append((leading, future, trailing))
+
+    def _pass_through(self, text: str):
+        """Keep text (a code block) in the reply untranslated"""
+        with self._lock:
+            self._segments.append((text, None, ""))
+
+    def _flush_pending(self):
+        """Queue the grouped sentences, however short, before a segment that breaks them"""
+        if self._pending:
+            self._submit(self._pending)
+            self._pending = ""
+
+    def _take_code_blocks(self, text: str) -> str:
+        """Queue text up to the last complete code block and the blocks themselves; return the rest"""
+        # The last part is the text after the final complete block
+        parts = split_code_blocks(text)
+        for index in range(0, len(parts) - 1, 2):
+            self._pending += parts[index]
+            self._flush_pending()
+            self._pass_through(parts[index + 1])
+        return parts[-1]
+
+    def feed(self, delta: str):
+        """
+        Add streamed text and queue every sentence it completes
+
+        Complete fenced code blocks are kept untranslated; text before a
+        block is queued as it stands, since the block ends its sentence.
+
+        Args:
+            delta: Next piece of the reply
+        """
+        self._buffer += delta
+        # Never cut a segment inside an unterminated code block
+        if len(_CODE_FENCE.findall(self._buffer)) % 2:
+            return
+
+        self._buffer = self._take_code_blocks(self._buffer)
+        sentences = split_sentences(self._buffer)
+        # The last sentence may still be growing
+        if len(sentences) < 2:
+            return
+        self._buffer = sentences[-1]
+        for sentence in sentences[:-1]:
+            self._pending += sentence
+            if len(self._pending.strip()) >= self.min_chars:
+                self._submit(self._pending)
+                self._pending = ""
+
+    def finish(self):
+        """Queue whatever is left once the stream has ended"""
+        unterminated = ""
+        fences = list(_CODE_FENCE.finditer(self._buffer))
+        if len(fences) % 2:
+            # The reply ended inside a code block: keep it from its opening fence on
+            start = fences[-1].start()
+            self._buffer, unterminated = self._buffer[:start], self._buffer[start:]
+        self._pending += self._take_code_blocks(self._buffer)
+        self._buffer = ""
+        self._flush_pending()
+        if unterminated:
+            self._pass_through(unterminated)
+
+    def cancel(self):
+        """Drop queued segments; requests already sent are left to finish"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def translated_text(self) -> str:
+        """
+        Get the translated prefix available so far, without blocking
+
+        Returns:
+            Translations of the leading segments that have finished, stopping
+            at the first one still in flight (or failed)
+        """
+        with self._lock:
+            segments = list(self._segments)
+
+        parts: List[str] = []
+        for leading, future, trailing in segments:
+            if future is not None:
+                if not future.done():
+                    break
+                result = future.result()
+                if not result["success"]:
+                    break
+                parts.append(leading + result["translated_text"] + trailing)
+            else:
+                parts.append(leading + trailing)
+        return "".join(parts)
+
+    def result(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for every segment and assemble the full translation
+
+        Call finish() first. The translator cannot be used afterwards.
+
+        Args:
+            timeout: Seconds to wait for each outstanding segment
+
+        Returns:
+            Result dictionary like translate_text, with "segments" holding the
+            number of translate requests made
+        """
+        with self._lock:
+            segments = list(self._segments)
+
+        try:
+            parts = []
+            for leading, future, trailing in segments:
+                if future is None:
+                    parts.append(leading + trailing)
+                    continue
+                result = future.result(timeout)
+                if not result["success"]:
+                    return result
+                parts.append(leading + result["translated_text"] + trailing)
+        except Exception as e:
+            return {"success": False, "error": f"Translation error: {str(e)}"}
+        finally:
+            self.cancel()
+
+        return {
+            "success": True,
+            "translated_text": "".join(parts),
+            "segments": sum(1 for _, future, _ in segments if future is not None)
+        }
@@ -0,0 +1,263 @@
+"""
+Weather lookups for the chat and sidebar
+WeatherAPI client with a per-city TTL cache, stale-while-revalidate refresh,
+request coalescing and a pooled HTTP session with strict timeouts
+"""
+
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+from http_session import ConnectionStats, create_pooled_session
+from metrics import MetricsRegistry, record_error, record_response
+from shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD = re.compile(r"[^\w\s,-]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_city(city: str) -> str:
+    """Normalize a city name into a cache key ("  New  Delhi! " -> "new delhi")"""
+    return _WHITESPACE.sub(" ", _NON_WORD.sub("", city)).strip().casefold()
+
+
+def format_weather(data: Dict[str, Any]) -> str:
+    """Format a WeatherAPI current.json response as a markdown report"""
+    location = data["location"]["name"]
+    region = data["location"]["region"]
+    country = data["location"]["country"]
+    temp_c = data["current"]["temp_c"]
+    feelslike_c = data["current"]["feelslike_c"]
+    condition = data["current"]["condition"]["text"]
+    humidity = data["current"]["humidity"]
+    wind_kph = data["current"]["wind_kph"]
+
+    return (
+        f"**Weather in {location}, {region}, {country}**\n"
+        f"- Condition: {condition}\n"
+        f"- Temperature: {temp_c}°C (Feels like {feelslike_c}°C)\n"
+        f"- Humidity: {humidity}%\n"
+        f"- Wind Speed: {wind_kph} kph"
+    )
+
+
+class _InFlight:
+    """Result slot shared by callers waiting on the same city lookup"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class WeatherService:
+    """Cached WeatherAPI client shared by every session"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://api.weatherapi.com/v1",
+        ttl_seconds: float = 10 * 60,
+        stale_ttl_seconds: float = 60 * 60,
+        timeout: Tuple[float, float] = (3.05, 5.0),
+        refresh_workers: int = 2,
+        metrics: Optional[MetricsRegistry] = None,
+        shared_cache: Optional[SharedCache] = None
+    ):
+        """
+        Initialize the weather service
+
+        Args:
+            api_key: WeatherAPI key
+            base_url: WeatherAPI base URL
+            ttl_seconds: Age after which a report is refreshed
+            stale_ttl_seconds: Age up to which a stale report is still served
+                while it is refreshed in the background
+            timeout: (connect, read) timeout for each request
+            refresh_workers: Threads available for background refreshes
+            metrics: Registry receiving per-request timings, sizes and status
+                codes (default: a private registry)
+            shared_cache: Cache shared with other worker processes; reports
+                fetched by any process are reused by all of them
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.timeout = timeout
+        self.metrics = metrics or MetricsRegistry()
+        self.shared_cache = shared_cache
+
+        self.connection_stats = ConnectionStats()
+        self.session = create_pooled_session(self.connection_stats, pool_maxsize=refresh_workers + 8)
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="weather-refresh")
+
+        self._lock = threading.Lock()
+        self._entries = {}  # city key -> (report, fetched_at)
+        self._in_flight = {}
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "errors": 0,
+            "shared_hits": 0
+        }
+
+    def fetch(self, city: str) -> Tuple[bool, str]:
+        """
+        Fetch current weather from WeatherAPI, bypassing the cache
+
+        Args:
+            city: City name as typed by the user
+
+        Returns:
+            (success, report) where report is markdown or an error message
+        """
+        params = {
+            "key": self.api_key,
+            "q": city,
+            "aqi": "no"
+        }
+        try:
+            self.connection_stats.record_request()
+            self.connection_stats.pop_connect_timing()
+            started = time.perf_counter()
+            try:
+                response = self.session.get(f"{self.base_url}/current.json", params=params, timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                record_error(self.metrics, "weather", "current.json", started, e)
+                raise
+            record_response(
+                self.metrics, "weather", "current.json", response, started,
+                connect_timing=self.connection_stats.pop_connect_timing()
+            )
+            data = response.json()
+            if response.status_code == 200:
+                return True, format_weather(data)
+            else:
+                error_message = data.get("error", {}).get("message", "Unknown error")
+                return False, f"❌ Could not fetch weather: {error_message}"
+
+        except requests.exceptions.Timeout:
+            return False, "❌ Error fetching weather: the weather service timed out"
+
+        except Exception as e:
+            return False, f"❌ Error fetching weather: {str(e)}"
+
+    def get_weather(self, city: str) -> str:
+        """
+        Get a weather report, from cache when possible
+
+        Fresh reports are returned directly. Reports older than the TTL but
+        younger than the stale TTL are returned immediately while a
+        background refresh runs. Otherwise the report is fetched, with
+        concurrent lookups for the same city sharing one request.
+
+        Args:
+            city: City name as typed by the user
+
+        Returns:
+            Markdown weather report or error message
+        """
+        key = normalize_city(city)
+        if not key:
+            return "❌ Could not fetch weather: No city given"
+
+        now = time.time()
+        shared = None
+        if self.shared_cache is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None or now - entry[1] >= self.ttl_seconds:
+                # Another worker process may have fetched this city more recently;
+                # read outside the lock so disk I/O does not hold up other cities
+                shared = self._read_shared(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if shared is not None and (entry is None or shared[1] > entry[1]):
+                entry = self._entries[key] = shared
+                if now - shared[1] < self.ttl_seconds:
+                    self._stats["shared_hits"] += 1
+            if entry is not None:
+                report, fetched_at = entry
+                age = now - fetched_at
+                if age < self.ttl_seconds:
+                    self._stats["hits"] += 1
+                    return report
+                if age < self.stale_ttl_seconds:
+                    self._stats["stale_hits"] += 1
+                    if key not in self._in_flight:
+                        self._in_flight[key] = _InFlight()
+                        self._stats["refreshes"] += 1
+                        self._refresher.submit(self._load, key, city)
+                    return report
+
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = self._in_flight[key] = _InFlight()
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            in_flight.done.wait(sum(self.timeout) + 1)
+            return in_flight.result or "❌ Error fetching weather: the weather service timed out"
+
+        return self._load(key, city)
+
+    def _read_shared(self, key: str) -> Optional[Tuple[str, float]]:
+        """Look a city up in the shared cache; a failing read counts as a miss"""
+        try:
+            return self.shared_cache.get(key)
+        except Exception:
+            logger.warning("Shared weather cache read failed", exc_info=True)
+            return None
+
+    def _load(self, key: str, city: str) -> str:
+        """Fetch a city, store successful reports and wake coalesced callers"""
+        success, report = False, "❌ Error fetching weather: the lookup failed"
+        try:
+            success, report = self.fetch(city)
+            if success:
+                fetched_at = time.time()
+                with self._lock:
+                    self._entries[key] = (report, fetched_at)
+                if self.shared_cache is not None:
+                    try:
+                        self.shared_cache.set(key, report, fetched_at)
+                    except Exception:
+                        # e.g. "database is locked": this process still serves the report
+                        logger.warning("Shared weather cache write failed", exc_info=True)
+        finally:
+            # Always release the city, or every later lookup would wait on it until the timeout
+            with self._lock:
+                if not success:
+                    self._stats["errors"] += 1
+                in_flight = self._in_flight.pop(key, None)
+            if in_flight is not None:
+                in_flight.result = report
+                in_flight.done.set()
+        return report
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache and connection counters
+
+        Returns:
+            Dictionary with cache hit/miss counts, size and connection reuse
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        stats["connections"] = self.connection_stats.snapshot()
+        return stats
@@ -0,0 +1,144 @@
+"""
+Background worker pool for blocking API calls
+Runs Sarvam and weather requests off the Streamlit script thread and hands
+each session a job handle it can poll, render and cancel
+"""
+
+import contextvars
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class Job:
+    """Handle for one background call, kept in st.session_state"""
+
+    def __init__(self, kind: str):
+        """
+        Create a job handle
+
+        Args:
+            kind: What the job does ("chat", "weather", ...)
+        """
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        # Text produced so far; written by the worker, read by the polling UI
+        self.partial = ""
+        # Translation of the partial text, for jobs that translate as they stream
+        self.partial_translation = ""
+        self.future = None
+        self._cancelled = threading.Event()
+        self._rejected_result = None
+
+    @property
+    def cancelled(self) -> bool:
+        """True once the session cancelled the job; workers should stop early"""
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        """True when the result is available (or the job never started)"""
+        return self.future is None or self.future.done()
+
+    def cancel(self):
+        """Cancel the job; a queued job never runs, a running one stops at its next check"""
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Get the job result without blocking
+
+        Returns:
+            The worker's result dictionary, or an error dictionary if the job
+            failed, was cancelled, rejected or is still running
+        """
+        if self.future is None:
+            return self._rejected_result
+        if not self.future.done():
+            return {"success": False, "error": "Job is still running"}
+        if self.future.cancelled() or self.cancelled:
+            return {"success": False, "error": "Cancelled", "cancelled": True}
+
+        error = self.future.exception()
+        if error is not None:
+            return {"success": False, "error": f"Unexpected error: {str(error)}", "unexpected": True}
+        return self.future.result()
+
+
+class WorkerPool:
+    """Process-wide bounded thread pool shared by every session"""
+
+    def __init__(self, max_workers: int = 16, max_pending: int = 64):
+        """
+        Initialize the pool
+
+        Args:
+            max_workers: Threads running jobs concurrently
+            max_pending: Maximum jobs queued or running; further jobs are rejected
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mufasa-worker")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "rejected": 0,
+            "pending": 0
+        }
+
+    def submit(self, kind: str, fn: Callable[..., Dict[str, Any]], *args, **kwargs) -> Job:
+        """
+        Run fn(job, *args, **kwargs) on a worker thread
+
+        Args:
+            kind: Job kind stored on the handle
+            fn: Callable returning a result dictionary; it receives the Job so
+                it can publish partial output and check for cancellation
+
+        Returns:
+            Job handle; rejected at once with an error result when the pool is full
+        """
+        job = Job(kind)
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats["rejected"] += 1
+            job._rejected_result = {"success": False, "error": "Server is busy. Please try again in a moment."}
+            return job
+
+        with self._lock:
+            self._stats["submitted"] += 1
+            self._stats["pending"] += 1
+
+        def run():
+            if job.cancelled:
+                return {"success": False, "error": "Cancelled", "cancelled": True}
+            return fn(job, *args, **kwargs)
+
+        # Run in a copy of the submitter's context (e.g. its bound session metrics)
+        job.future = self._executor.submit(contextvars.copy_context().run, run)
+        job.future.add_done_callback(self._release)
+        return job
+
+    def _release(self, future):
+        self._slots.release()
+        with self._lock:
+            self._stats["completed"] += 1
+            self._stats["pending"] -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool counters
+
+        Returns:
+            Dictionary with submitted, completed, rejected and pending job counts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["max_workers"] = self.max_workers
+        return stats
+